@@ -0,0 +1,108 @@
+import argparse
+import datetime
+import importlib
+import json
+import pathlib
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+import traceback
+from typing import Any, Optional
+
+import sdk
+
+from . import __path__ as package_path
+from .common import report
+
+_NOT_BENCHMARKS: frozenset[str] = frozenset(('__main__', 'common', 'data'))
+
+
+def _names() -> list[str]:
+    module: pkgutil.ModuleInfo
+    return sorted(module.name for module in pkgutil.iter_modules(package_path) if module.name not in _NOT_BENCHMARKS)
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=pathlib.Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _compare(baseline: dict[str, Any], results: dict[str, Any]) -> None:
+    print(f"Compared with {baseline['version']} ({baseline['created']})")
+    name: str
+    for name in results['results']:
+        old: dict[str, float] = baseline['results'].get(name, dict())
+        new: dict[str, float] = results['results'][name]
+        shared: list[str] = [label for label in new if label in old]
+        if not shared:
+            continue
+        print(name)
+        label: str
+        for label in shared:
+            ratio: float = new[label] / old[label] if old[label] else float('nan')
+            print(f"  {label:<40} {old[label]:>14.3f} {new[label]:>14.3f} {ratio:>8.2f}x")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description="Run the benchmarks and save the results as JSON")
+    parser.add_argument('names', nargs='*', metavar='NAME', help="benchmarks to run, all of them by default")
+    parser.add_argument('--list', action='store_true', help="list the benchmarks and exit")
+    parser.add_argument(
+        '--output', type=pathlib.Path, help="results file, benchmark-<version>-<timestamp>.json by default")
+    parser.add_argument('--compare', type=pathlib.Path, metavar='BASELINE', help="results file to compare against")
+    args: argparse.Namespace = parser.parse_args()
+
+    names: list[str] = _names()
+    if args.list:
+        print('\n'.join(names))
+        return
+    name: str
+    unknown: list[str] = [name for name in args.names if name not in names]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    baseline: Optional[dict[str, Any]] = json.loads(args.compare.read_text()) if args.compare else None
+
+    created: datetime.datetime = datetime.datetime.now(datetime.timezone.utc)
+    results: dict[str, Any] = {
+        'version': sdk.VERSION,
+        'commit': _commit(),
+        'created': created.isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'results': dict(),
+        'durations': dict(),
+        'errors': dict(),
+    }
+    for name in args.names or names:
+        start: float = time.perf_counter()
+        try:
+            module_results: dict[str, float] = importlib.import_module(f'{__package__}.{name}').run()
+        except Exception:
+            results['errors'][name] = traceback.format_exc()
+            print(f"{name} failed\n{results['errors'][name]}", file=sys.stderr)
+            continue
+        finally:
+            results['durations'][name] = time.perf_counter() - start
+        results['results'][name] = module_results
+        report(name, module_results)
+
+    output: pathlib.Path = args.output or pathlib.Path(
+        f"benchmark-{sdk.VERSION}-{created.strftime('%Y%m%dT%H%M%SZ')}.json")
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Saved to {output}")
+    if baseline:
+        _compare(baseline, results)
+    if results['errors']:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
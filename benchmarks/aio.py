@@ -0,0 +1,69 @@
+import asyncio
+import os
+import pty
+import threading
+import time
+import tty
+
+import sdk
+
+from .common import report
+
+
+async def _device(master: int) -> None:
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    chunks: asyncio.Queue = asyncio.Queue()
+    loop.add_reader(master, lambda: chunks.put_nowait(os.read(master, 4096)))
+    buffer: bytes = b''
+    while True:
+        buffer += await chunks.get()
+        while b'\r\n' in buffer:
+            command: bytes
+            command, buffer = buffer.split(b'\r\n', 1)
+            os.write(master, b'Status : 0x91\r\nOK\r\n' if command == b'RD' else b'OK\r\n')
+
+
+async def _round_trips(devices: int, commands: int) -> dict[str, float]:
+    tasks: list[asyncio.Task] = list()
+    serials: list[sdk.AsyncFreezeDripSerial] = list()
+    _: int
+    for _ in range(devices):
+        master: int
+        slave: int
+        master, slave = pty.openpty()
+        tty.setraw(slave)
+        tasks.append(asyncio.create_task(_device(master)))
+        serials.append(await sdk.AsyncFreezeDripSerial(os.ttyname(slave)).open())
+
+    async def drive(device: sdk.AsyncFreezeDripSerial) -> None:
+        for _ in range(commands):
+            await device.command('RD')
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*(drive(device) for device in serials))
+    elapsed: float = time.perf_counter() - start
+    device: sdk.AsyncFreezeDripSerial
+    for device in serials:
+        device.close()
+    task: asyncio.Task
+    for task in tasks:
+        task.cancel()
+    return {
+        f'{devices:>2} devices, commands/s': devices * commands / elapsed,
+        f'{devices:>2} devices, threads': threading.active_count()}
+
+
+def run(device_counts: tuple[int, ...] = (1, 8, 32), commands: int = 500) -> dict[str, float]:
+    results: dict[str, float] = dict()
+    devices: int
+    for devices in device_counts:
+        results.update(asyncio.run(_round_trips(devices, commands)))
+    return results
+
+
+def main() -> None:
+    report("AsyncFreezeDripSerial command round trips over pty pairs", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+from desktop import ui, ui_model
+import sdk
+
+from .common import measure, report
+
+
+def _fill(telemetry_chart_model: ui_model.TelemetryChartModel, samples: int) -> None:
+    times: numpy.ndarray = numpy.arange(samples) * 0.5
+    rng: numpy.random.Generator = numpy.random.default_rng(0)
+    name: str
+    for name in telemetry_chart_model.SERIES:
+        telemetry_chart_model.series[name].extend(times, 20 + numpy.cumsum(rng.normal(0, 0.1, samples)))
+
+
+def run(sizes: tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000), width: int = 800) -> dict[str, float]:
+    app: QApplication = QApplication.instance() or QApplication([])
+    results: dict[str, float] = dict()
+    samples: int
+    for samples in sizes:
+        telemetry_chart_model: ui_model.TelemetryChartModel = ui_model.TelemetryChartModel(max(sizes))
+        _fill(telemetry_chart_model, samples)
+        series: sdk.RingSeries = telemetry_chart_model.series['temp']
+        widget: ui.QTelemetryChartWidget = ui.QTelemetryChartWidget()
+        widget.setup(telemetry_chart_model)
+        widget.resize(width, 400)
+        pixmap: QPixmap = QPixmap(widget.size())
+        results[f'{samples:>9} samples, sample scan (ms)'] = measure(
+            lambda: sdk.decimate_min_max(series.times(), series.values(), width), number=10) * 1e3
+        results[f'{samples:>9} samples, block decimation (ms)'] = measure(
+            lambda: series.decimate(width), number=10) * 1e3
+        results[f'{samples:>9} samples, full redraw (ms)'] = measure(lambda: widget.render(pixmap), number=10) * 1e3
+        widget.deleteLater()
+    results['append one reading (us)'] = measure(
+        lambda: telemetry_chart_model.append(sdk.TelemetryReading('', 0, 1, temp=200, cd_battery_volt=48)),
+        number=10_000) * 1e6
+    app.processEvents()
+    return results
+
+
+def main() -> None:
+    report("Telemetry chart, 3 series, 800 px wide", run())
+
+
+if __name__ == '__main__':
+    main()
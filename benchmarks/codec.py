@@ -0,0 +1,87 @@
+import dataclasses
+import random
+
+import sdk
+
+from .common import measure, report
+
+_WIDE_FIELDS: frozenset[str] = frozenset((
+    'lost_alarm_interval', 'temp_detection_interval', 'temp_lvl_2_thold', 'temp_lvl_3_thold', 'temp_lvl_4_thold',
+    'lvl_2_pump_on_time', 'lvl_2_pump_off_time', 'lvl_3_pump_on_time', 'lvl_3_pump_off_time'))
+
+
+def _format_profile(record: sdk.ProfileRecord) -> str:
+    profile_str: str = '#'
+    profile_str += 'B' + ',' + f"{record.low_battery_thold:02X}" + ','
+    profile_str += 'RBV' + ',' + 'FF' + ','
+    profile_str += 'CBV' + ',' + 'FF' + ','
+    profile_str += 'S' + ',' + f"{record.setup_duration:02X}" + ','
+    profile_str += 'H' + ',' + f"{record.heartbeat_interval:02X}" + ','
+    profile_str += 'T' + ',' + f"{record.temp_sensitivity:02X}" + ','
+    profile_str += 'U' + ',' + f"{record.scale_of_pump_on_time:02X}" + ','
+    profile_str += 'L' + ',' + f"{record.lost_alarm_interval:04X}" + ','
+    profile_str += 'D' + ',' + f"{record.temp_detection_interval:04X}" + ','
+    profile_str += 'T1' + ',' + f"{record.temp_lvl_2_thold:04X}" + ','
+    profile_str += 'T2' + ',' + f"{record.temp_lvl_3_thold:04X}" + ','
+    profile_str += 'T3' + ',' + f"{record.temp_lvl_4_thold:04X}" + ','
+    profile_str += 'S1' + ',' + f"{record.lvl_2_pump_on_time:04X}" + ','
+    profile_str += 'S2' + ',' + f"{record.lvl_2_pump_off_time:04X}" + ','
+    profile_str += 'S3' + ',' + f"{record.lvl_3_pump_on_time:04X}" + ','
+    profile_str += 'S4' + ',' + f"{record.lvl_3_pump_off_time:04X}"
+    profile_str += '$'
+    return profile_str
+
+
+def _records(count: int, seed: int = 0) -> list[sdk.ProfileRecord]:
+    generator: random.Random = random.Random(seed)
+    names: list[str] = [field.name for field in dataclasses.fields(sdk.ProfileRecord)][2:]
+    name: str
+    # Every field at both ends of its range first, then random values across the whole range
+    records: list[sdk.ProfileRecord] = [
+        sdk.ProfileRecord(**{name: 0 for name in names}),
+        sdk.ProfileRecord(**{name: 0xFFFF if name in _WIDE_FIELDS else 0xFF for name in names})]
+    while len(records) < count:
+        records.append(sdk.ProfileRecord(**{
+            name: generator.randint(0, 0xFFFF if name in _WIDE_FIELDS else 0xFF) for name in names}))
+    return records
+
+
+def _shuffled(frame: str, generator: random.Random) -> str:
+    tokens: list[str] = frame[1:-1].split(',')
+    i: int
+    pairs: list[str] = [f"{tokens[i]},{tokens[i + 1].lower()}" for i in range(0, len(tokens), 2)]
+    generator.shuffle(pairs)
+    return '#' + ','.join(pairs) + '$'
+
+
+def run(count: int = 10_000) -> dict[str, float]:
+    records: list[sdk.ProfileRecord] = _records(count)
+    frames: list[bytes] = sdk.encode_profiles(records)
+    texts: list[str] = [frame.decode() for frame in frames]
+    generator: random.Random = random.Random(2)
+    frame: bytes
+    reordered: list[str] = [_shuffled(frame.decode(), generator) for frame in frames]
+    record: sdk.ProfileRecord
+    text: str
+    legacy: float = measure(lambda: [_format_profile(record).encode() for record in records])
+    single: float = measure(lambda: [sdk.encode_profile(record).encode() for record in records])
+    bulk: float = measure(lambda: sdk.encode_profiles(records))
+    decode_fields: float = measure(lambda: sdk.decode_profiles(reordered))
+    decode_single: float = measure(lambda: [sdk.decode_profile(text) for text in texts])
+    decode_bulk: float = measure(lambda: sdk.decode_profiles(texts))
+    return {
+        'encode, concatenated (ns/profile)': legacy / count * 1e9,
+        'encode_profile (ns/profile)': single / count * 1e9,
+        'encode_profiles (ns/profile)': bulk / count * 1e9,
+        'decode, reordered fields (ns/profile)': decode_fields / count * 1e9,
+        'decode_profile (ns/profile)': decode_single / count * 1e9,
+        'decode_profiles (ns/profile)': decode_bulk / count * 1e9,
+    }
+
+
+def main() -> None:
+    report("Profile frame codec", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+import importlib.resources
+import time
+from typing import Callable
+
+from . import data
+
+
+def measure(func: Callable[[], object], number: int = 1, repeat: int = 5) -> float:
+    best: float = float('inf')
+    _: int
+    for _ in range(repeat):
+        start: int = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter_ns() - start) / number)
+    return best / 1e9
+
+
+def load_traffic() -> list[str]:
+    return importlib.resources.files(data).joinpath('traffic.txt').read_text().splitlines()
+
+
+def report(title: str, results: dict[str, float]) -> None:
+    print(title)
+    name: str
+    value: float
+    for name, value in results.items():
+        print(f"  {name:<40} {value:>14.3f}")
@@ -0,0 +1,141 @@
+import dataclasses
+import pathlib
+import tempfile
+import time
+from typing import Any, Callable, Iterable, Optional
+
+import dacite
+import dataset
+
+import sdk
+
+from .common import report
+
+
+class LegacyProfileDatabase:
+    def __init__(self, path: pathlib.Path):
+        self.path: pathlib.Path = path
+        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
+            if 'profile' not in tx.tables:
+                tx.create_table('profile')
+
+    def add(self, profile: sdk.Profile) -> None:
+        profile_dict: dict[str, Any] = dataclasses.asdict(profile)
+        profile_dict['id'] = None
+        tx: dataset.Database
+        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
+            profile_table: dataset.Table = tx.get_table('profile')
+            profile_table.insert(profile_dict)
+            profile_table.create_index(['id'])
+
+    def edit(self, profile: sdk.Profile) -> None:
+        tx: dataset.Database
+        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
+            if 'profile' not in tx.tables:
+                raise ValueError('profile table is not in the database yet')
+            profile_table: dataset.Table = tx.get_table('profile')
+            profile_table.update(dataclasses.asdict(profile), ['id'])
+
+    def get(self, id_: int) -> sdk.Profile:
+        tx: dataset.Database
+        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
+            if 'profile' not in tx.tables:
+                raise ValueError('profile table is not in the database yet')
+            profile_table: dataset.Table = tx.get_table('profile')
+            res: Optional[dict[str, Any]] = profile_table.find_one(id=id_)
+            if not res:
+                raise ValueError("no such id")
+            return dacite.from_dict(data_class=sdk.Profile, data=res)
+
+    def get_all(self) -> Iterable[sdk.Profile]:
+        tx: dataset.Database
+        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
+            if 'profile' not in tx.tables:
+                return map(lambda _: _, ())
+            profile_table: dataset.Table = tx.get_table('profile')
+            return map(lambda x: dacite.from_dict(data_class=sdk.Profile, data=x), profile_table.find())
+
+    def remove(self, profile: sdk.Profile) -> None:
+        tx: dataset.Database
+        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
+            if 'profile' not in tx.tables:
+                raise ValueError('profile table is not in the database yet')
+            profile_table: dataset.Table = tx.get_table('profile')
+            if not profile_table.find_one(id=profile.id):
+                raise ValueError("no such id")
+            profile_table.delete(id=profile.id)
+
+
+def _profile(i: int) -> sdk.Profile:
+    return sdk.Profile(
+        name=f"Profile {i}",
+        temp_lvl_2_thold="40",
+        temp_lvl_3_thold="37",
+        temp_lvl_4_thold="32",
+        temp_sensitivity="1",
+        temp_detection_interval="60",
+        scale_of_pump_on_time="2",
+        lvl_2_pump_on_time="30",
+        lvl_2_pump_off_time="60",
+        lvl_3_pump_on_time="60",
+        lvl_3_pump_off_time="30",
+        low_battery_thold="4.8",
+        lost_alarm_interval="10",
+        heartbeat_interval="60",
+        setup_duration="5")
+
+
+def _command(i: int) -> sdk.Command:
+    return sdk.Command(name=f"Command {i}", command='RD' if i % 2 else 'CD0')
+
+
+def _per_op(func: Callable[[int], object], ops: int) -> float:
+    start: int = time.perf_counter_ns()
+    i: int
+    for i in range(ops):
+        func(i)
+    return (time.perf_counter_ns() - start) / ops / 1e6
+
+
+def _bench(database: Any, make: Callable[[int], Any], rows: int, ops: int) -> dict[str, float]:
+    i: int
+    for i in range(rows):
+        database.add(make(i))
+    ids: list[int] = [item.id for item in database.get_all()]
+    results: dict[str, float] = dict()
+    results['add'] = _per_op(lambda i: database.add(make(rows + i)), ops)
+    results['get'] = _per_op(lambda i: database.get(ids[i * 7 % len(ids)]), ops)
+    results['edit'] = _per_op(lambda i: database.edit(dataclasses.replace(make(i), id=ids[i % len(ids)])), ops)
+    results['get_all'] = _per_op(lambda i: list(database.get_all()), max(1, ops // 10))
+    results['remove'] = _per_op(lambda i: database.remove(dataclasses.replace(make(i), id=ids[-1 - i])), ops)
+    return results
+
+
+def run(row_counts: tuple[int, ...] = (10, 1_000, 10_000), legacy_rows: int = 1_000, ops: int = 10) -> dict[str, float]:
+    results: dict[str, float] = dict()
+    directory: str
+    with tempfile.TemporaryDirectory() as directory:
+        path: pathlib.Path = pathlib.Path(directory)
+        legacy: dict[str, float] = _bench(LegacyProfileDatabase(path / 'legacy.db'), _profile, legacy_rows, ops)
+        name: str
+        for name in legacy:
+            results[f'{legacy_rows:>6} profiles, {name} legacy (ms/op)'] = legacy[name]
+        rows: int
+        for rows in row_counts:
+            profiles: dict[str, float] = _bench(sdk.ProfileDatabase(path / f'profile-{rows}.db'), _profile, rows, ops)
+            commands: dict[str, float] = _bench(sdk.CommandDatabase(path / f'command-{rows}.db'), _command, rows, ops)
+            for name in profiles:
+                results[f'{rows:>6} profiles, {name} (ms/op)'] = profiles[name]
+            for name in commands:
+                results[f'{rows:>6} commands, {name} (ms/op)'] = commands[name]
+            sdk.connect_database(path / f'profile-{rows}.db').close()
+            sdk.connect_database(path / f'command-{rows}.db').close()
+    return results
+
+
+def main() -> None:
+    report("ProfileDatabase and CommandDatabase CRUD", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import os
+import pty
+import queue
+import threading
+import time
+import tty
+
+import sdk
+
+from .common import load_traffic, report
+
+
+def _open_ptys(count: int) -> list[tuple[int, int]]:
+    pairs: list[tuple[int, int]] = [pty.openpty() for _ in range(count)]
+    master: int
+    slave: int
+    for master, slave in pairs:
+        tty.setraw(slave)
+    return pairs
+
+
+def _close_ptys(pairs: list[tuple[int, int]]) -> None:
+    master: int
+    slave: int
+    for master, slave in pairs:
+        os.close(master)
+        os.close(slave)
+
+
+def _feed(pairs: list[tuple[int, int]], payload: bytes) -> None:
+    master: int
+    slave: int
+    for master, slave in pairs:
+        os.write(master, payload)
+
+
+def _engine(ports: int, lines: int) -> tuple[float, int]:
+    baseline: int = threading.active_count()
+    pairs: list[tuple[int, int]] = _open_ptys(ports)
+    payload: bytes = ''.join(f'{line}\r\n' for line in load_traffic()[:lines]).encode()
+    expected: int = ports * len(payload.splitlines())
+    received: list[int] = [0]
+    done: threading.Event = threading.Event()
+
+    def on_lines(port: sdk.FreezeDripPort, port_lines: list[str]) -> None:
+        received[0] += len(port_lines)
+        if received[0] >= expected:
+            done.set()
+
+    engine: sdk.FreezeDripEngine = sdk.FreezeDripEngine().start()
+    master: int
+    slave: int
+    for master, slave in pairs:
+        engine.open(os.ttyname(slave), on_lines)
+    time.sleep(0.1)
+    threads: int = threading.active_count() - baseline
+    start: float = time.perf_counter()
+    _feed(pairs, payload)
+    done.wait(30)
+    elapsed: float = time.perf_counter() - start
+    engine.close()
+    _close_ptys(pairs)
+    return received[0] / elapsed, threads
+
+
+def _threads_per_port(ports: int, lines: int) -> tuple[float, int]:
+    baseline: int = threading.active_count()
+    pairs: list[tuple[int, int]] = _open_ptys(ports)
+    payload: bytes = ''.join(f'{line}\r\n' for line in load_traffic()[:lines]).encode()
+    expected: int = ports * len(payload.splitlines())
+    input_queue: queue.Queue = queue.Queue()
+    serials: list[sdk.serial.FreezeDripSerial] = list()
+    master: int
+    slave: int
+    for master, slave in pairs:
+        serials.append(sdk.serial.FreezeDripSerial(os.ttyname(slave), input_queue, queue.Queue()))
+    time.sleep(0.1)
+    threads: int = threading.active_count() - baseline
+    start: float = time.perf_counter()
+    _feed(pairs, payload)
+    received: int
+    for received in range(expected):
+        input_queue.get(timeout=30)
+    elapsed: float = time.perf_counter() - start
+    serial: sdk.serial.FreezeDripSerial
+    for serial in serials:
+        serial.stopped = True
+    # The legacy reader threads stay blocked in readline(), so the pty pairs are left open for them.
+    return expected / elapsed, threads
+
+
+def run(port_counts: tuple[int, ...] = (1, 8, 32), lines: int = 200) -> dict[str, float]:
+    results: dict[str, float] = dict()
+    ports: int
+    for ports in port_counts:
+        rate: float
+        threads: int
+        rate, threads = _engine(ports, lines)
+        results[f'{ports:>2} ports, engine (lines/s)'] = rate
+        results[f'{ports:>2} ports, engine (threads)'] = threads
+        rate, threads = _threads_per_port(ports, lines)
+        results[f'{ports:>2} ports, thread per port (lines/s)'] = rate
+        results[f'{ports:>2} ports, thread per port (threads)'] = threads
+    return results
+
+
+def main() -> None:
+    report("FreezeDripEngine vs FreezeDripSerial over pty pairs", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+from .common import report
+
+_CHILD: str = '''
+import sys
+import time
+
+from PySide6.QtWidgets import QApplication
+
+app = QApplication([])
+start = time.perf_counter()
+import desktop.main
+main_window = desktop.main.load_main_window(use_ui_loader=sys.argv[1] == 'loader')
+main_window.show()
+cold = time.perf_counter() - start
+start = time.perf_counter()
+for _ in range(5):
+    desktop.main.load_main_window(use_ui_loader=sys.argv[1] == 'loader').show()
+print(cold, (time.perf_counter() - start) / 5)
+'''
+
+
+def _time_to_show(mode: str) -> tuple[float, float]:
+    env: dict[str, str] = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    cwd: str = os.path.join(os.path.dirname(__file__), 'data')
+    completed: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-c', _CHILD, mode], env=env, cwd=cwd, capture_output=True, text=True, check=True)
+    cold: str
+    warm: str
+    cold, warm = completed.stdout.split()
+    return float(cold), float(warm)
+
+
+def run(repeat: int = 5) -> dict[str, float]:
+    results: dict[str, float] = dict()
+    mode: str
+    for mode in ('loader', 'generated'):
+        times: list[tuple[float, float]] = [_time_to_show(mode) for _ in range(repeat)]
+        results[f'{mode}: import + build + show (ms)'] = min(cold for cold, _ in times) * 1e3
+        results[f'{mode}: build + show again (ms)'] = min(warm for _, warm in times) * 1e3
+    return results
+
+
+def main() -> None:
+    report("Time to QMainWindowExt.show() on the offscreen platform", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+from typing import Any
+
+import sdk
+
+from .common import measure, report
+
+
+class _Plain:
+    def __init__(self):
+        self._value: int = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+
+
+class _Observable(sdk.ObservableProperty):
+    def __init__(self):
+        super().__init__()
+        self._value: int = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+
+
+def _setattr(model: Any, name: str, count: int) -> float:
+    def assign() -> None:
+        i: int
+        for i in range(count):
+            setattr(model, name, i)
+
+    return measure(assign, number=10, repeat=7) / count * 1e9
+
+
+def run(count: int = 10_000, observer_counts: tuple[int, ...] = (0, 1, 4)) -> dict[str, float]:
+    results: dict[str, float] = {
+        'plain property (ns/set)': _setattr(_Plain(), 'value', count),
+        'observable, private field (ns/set)': _setattr(_Observable(), '_value', count),
+    }
+    observers: int
+    for observers in observer_counts:
+        model: _Observable = _Observable()
+        i: int
+        for i in range(observers):
+            model.add_on_changed_observer(lambda name, value: None)
+            model.add_on_changed_observer(lambda value: None, 'value')
+        results[f'{observers} observers per hook (ns/set)'] = _setattr(model, 'value', count)
+        with model.batch():
+            results[f'{observers} observers per hook, batched (ns/set)'] = _setattr(model, 'value', count)
+    return results
+
+
+def main() -> None:
+    report("ObservableProperty.__setattr__ dispatch", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+from typing import Optional, Union
+
+import sdk
+
+from .common import load_traffic, measure, report
+
+
+class LegacyFreezeDripSerialParser:
+    def __init__(self):
+        self.status: str = ''
+
+    def is_cd(self) -> Optional[bool]:
+        if self.status:
+            return bool(int(self.status, 16) & 0b1000_0000)
+
+    def parse_line(self, line: str) -> Optional[Union[sdk.FreezeDripSerialData, sdk.FreezeDripSerialResponse]]:
+        if line in ['OK', 'ERROR']:
+            return sdk.FreezeDripSerialResponse(line)
+
+        if line.startswith('Status : '):
+            self.status = line.removeprefix('Status : ').removesuffix(' Hex')
+            return sdk.FreezeDripSerialData(
+                status=self.status,
+                heartbeat_flag=str(bool(int(self.status, 16) & 0b1)),
+                low_temp_flag=str(bool(int(self.status, 16) & 0b10)),
+                low_bat_flag=str(bool(int(self.status, 16) & 0b100)),
+                setup_flag=str(bool(int(self.status, 16) & 0b1_0000)))
+        if line.startswith('Fahrenheit Temperature : '):
+            return sdk.FreezeDripSerialData(
+                temp=line.removeprefix('Fahrenheit Temperature : ').removesuffix(" 'F"))
+        if line.startswith('Received Battery Value: '):
+            if not self.is_cd():
+                return
+            return sdk.FreezeDripSerialData(
+                rts_battery_volt=line.removeprefix('Received Battery Value: ').removesuffix(' Volts'))
+        if line.startswith('Current Battery Voltage : '):
+            if not self.status:
+                return
+            bat_volt: str = line.removeprefix('Current Battery Voltage : ').removesuffix(' Volts')
+            if not sdk.floatable(bat_volt) or int(float(bat_volt) * 10) == 0xFF:
+                return
+            return sdk.FreezeDripSerialData(cd_battery_volt=bat_volt) if self.is_cd() \
+                else sdk.FreezeDripSerialData(rts_battery_volt=bat_volt)
+
+        if line.startswith('Temp. level 2 threshold : '):
+            return sdk.FreezeDripSerialData(
+                temp_lvl_2_thold=line.removeprefix('Temp. level 2 threshold : ').removesuffix(" 'F"))
+        if line.startswith('Temp. level 3 threshold : '):
+            return sdk.FreezeDripSerialData(
+                temp_lvl_3_thold=line.removeprefix('Temp. level 3 threshold : ').removesuffix(" 'F"))
+        if line.startswith('Temp. level 4 threshold : '):
+            return sdk.FreezeDripSerialData(
+                temp_lvl_4_thold=line.removeprefix('Temp. level 4 threshold : ').removesuffix(" 'F"))
+        if line.startswith('Temperature sensitivity : '):
+            return sdk.FreezeDripSerialData(
+                temp_sensitivity=line.removeprefix('Temperature sensitivity : ').removesuffix(" 'F"))
+        if line.startswith('Temp. detection interval : '):
+            return sdk.FreezeDripSerialData(
+                temp_detection_interval=line.removeprefix('Temp. detection interval : ').removesuffix(' Secs'))
+        if line.startswith('Scale of S1 and S3 : '):
+            return sdk.FreezeDripSerialData(
+                scale_of_pump_on_time=line.removeprefix('Scale of S1 and S3 : ').removesuffix(' X'))
+        if line.startswith('Pump on time of level 2 : '):
+            return sdk.FreezeDripSerialData(
+                lvl_2_pump_on_time=line.removeprefix('Pump on time of level 2 : ').removesuffix(' Secs'))
+        if line.startswith('Pump off time of level 2 : '):
+            return sdk.FreezeDripSerialData(
+                lvl_2_pump_off_time=line.removeprefix('Pump off time of level 2 : ').removesuffix(' Secs'))
+        if line.startswith('Pump on time of level 3 : '):
+            return sdk.FreezeDripSerialData(
+                lvl_3_pump_on_time=line.removeprefix('Pump on time of level 3 : ').removesuffix(' Secs'))
+        if line.startswith('Pump off time of level 3 : '):
+            return sdk.FreezeDripSerialData(
+                lvl_3_pump_off_time=line.removeprefix('Pump off time of level 3 : ').removesuffix(' Secs'))
+        if line.startswith('Low Battery threshold : '):
+            low_battery_thold: str = line.removeprefix('Low Battery threshold : ').removesuffix(' Volts')
+            if self.is_cd():
+                low_battery_thold = str(float(low_battery_thold) * 2)
+            return sdk.FreezeDripSerialData(low_battery_thold=low_battery_thold)
+        if line.startswith('Interval of the Lost alarm : '):
+            return sdk.FreezeDripSerialData(
+                lost_alarm_interval=line.removeprefix('Interval of the Lost alarm : ').removesuffix(' Secs'))
+        if line.startswith('H.B./L. Bat. interval : '):
+            return sdk.FreezeDripSerialData(
+                heartbeat_interval=line.removeprefix('H.B./L. Bat. interval : ').removesuffix(' Mins'))
+        if line.startswith('Setup signal interval : '):
+            return sdk.FreezeDripSerialData(
+                setup_duration=line.removeprefix('Setup signal interval : ').removesuffix(' Mins'))
+
+
+_DUMP_PREFIXES: tuple[str, ...] = (
+    'Temp. ', 'Temperature ', 'Scale ', 'Pump on ', 'Pump off ', 'Low ', 'Interval ', 'H.B.', 'Setup ', 'OK')
+_STATUS_PREFIXES: tuple[str, ...] = ('Status : ', 'Fahrenheit ', 'Current ', 'Received ')
+
+
+def _mixes(lines: list[str]) -> dict[str, list[str]]:
+    line: str
+    return {
+        'traffic': lines,
+        'status': [line for line in lines if line.startswith(_STATUS_PREFIXES)],
+        'dump': [line for line in lines if line.startswith(('Status : ', *_DUMP_PREFIXES))],
+        'noise': [line for line in lines if not line.startswith(_STATUS_PREFIXES + _DUMP_PREFIXES)],
+    }
+
+
+def run() -> dict[str, float]:
+    lines: list[str] = load_traffic()
+
+    legacy_parser: LegacyFreezeDripSerialParser = LegacyFreezeDripSerialParser()
+    parser: sdk.FreezeDripSerialParser = sdk.FreezeDripSerialParser()
+    line: str
+    for line in lines:
+        if legacy_parser.parse_line(line) != parser.parse_line(line):
+            raise AssertionError(f"parsers disagree on {line!r}")
+
+    legacy: float = measure(lambda: [legacy_parser.parse_line(line) for line in lines], number=50, repeat=15)
+    table: float = measure(lambda: [parser.parse_line(line) for line in lines], number=50, repeat=15)
+    bulk: float = measure(lambda: parser.parse_lines(lines), number=50, repeat=15)
+    results: dict[str, float] = {
+        'parse_line legacy (ns/line)': legacy / len(lines) * 1e9,
+        'parse_line (ns/line)': table / len(lines) * 1e9,
+        'parse_line speedup (x)': legacy / table,
+        'parse_lines (ns/line)': bulk / len(lines) * 1e9,
+    }
+    name: str
+    mix: list[str]
+    for name, mix in _mixes(lines).items():
+        # Repeat each mix up to the size of the full capture so the timings are comparable
+        mix = mix * max(1, len(lines) // len(mix))
+        results[f'{name} mix, parse_line (ns/line)'] = measure(
+            lambda: [parser.parse_line(line) for line in mix], number=50, repeat=15) / len(mix) * 1e9
+    return results
+
+
+def main() -> None:
+    report("FreezeDripSerialParser.parse_line", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import os
+import pty
+import statistics
+import time
+import tty
+from typing import Optional
+
+import sdk
+
+from .common import load_traffic, measure, report
+
+
+def _latencies(batch_interval: float, count: int, latency: Optional[sdk.LatencyMonitor] = None) -> list[float]:
+    master: int
+    slave: int
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    traffic: list[bytes] = [f"{line}\r\n".encode() for line in load_traffic() if line]
+    received: list[float] = list()
+
+    def on_line(line: str) -> None:
+        received.append(time.perf_counter())
+
+    def on_lines(lines: list[str]) -> None:
+        now: float = time.perf_counter()
+        received.extend(now for _ in lines)
+
+    listener: sdk.FreezeDripSerialListener = sdk.FreezeDripSerialListener()
+    listener.signal.connect(on_line)
+    listener.lines_signal.connect(on_lines)
+    serial: sdk.SimpleFreezeDripSerial = sdk.SimpleFreezeDripSerial(
+        os.ttyname(slave), [listener], batch_interval, latency=latency)
+    serial.open()
+    time.sleep(0.2)
+    latencies: list[float] = list()
+    i: int
+    for i in range(count):
+        sent: float = time.perf_counter()
+        os.write(master, traffic[i % len(traffic)])
+        deadline: float = sent + 1.0
+        while len(received) <= i and time.perf_counter() < deadline:
+            time.sleep(0)
+        if len(received) <= i:
+            raise AssertionError(f"line {i} was not delivered within a second")
+        latencies.append(received[i] - sent)
+    serial.close()
+    os.close(master)
+    os.close(slave)
+    return latencies
+
+
+def run(count: int = 500) -> dict[str, float]:
+    results: dict[str, float] = dict()
+    name: str
+    batch_interval: float
+    latency: Optional[sdk.LatencyMonitor]
+    for name, batch_interval, latency in (
+            ('per-line', 0.0, None), ('per-line, monitored', 0.0, sdk.LatencyMonitor()), ('batched', 0.03, None)):
+        latencies: list[float] = sorted(_latencies(batch_interval, count, latency))
+        results[f'{name}, median (ms)'] = statistics.median(latencies) * 1e3
+        results[f'{name}, p99 (ms)'] = latencies[int(len(latencies) * 0.99)] * 1e3
+        results[f'{name}, max (ms)'] = latencies[-1] * 1e3
+    monitor: sdk.LatencyMonitor = sdk.LatencyMonitor()
+    results['LatencyMonitor.record (ns)'] = measure(lambda: monitor.record('queue', 0), number=100_000) * 1e9
+    return results
+
+
+def main() -> None:
+    report("Serial reader to listener emission latency", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import os
+import pathlib
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+
+from desktop import main as desktop_main
+import sdk
+import sdk.qt
+
+from .common import load_traffic, measure, report
+
+
+def _lines_per_second(window, batch_interval: float, count: int) -> float:
+    app: QApplication = QApplication.instance()
+    traffic: list[bytes] = [line.encode() for line in load_traffic()]
+    handled: list[int] = [0]
+    listener: sdk.qt.SimpleFreezeDripSerialListener = window.seirla_receiver
+    listener.signal.connect(lambda line: handled.__setitem__(0, handled[0] + 1))
+    listener.lines_signal.connect(lambda lines: handled.__setitem__(0, handled[0] + len(lines)))
+
+    serial: sdk.SimpleFreezeDripSerial = sdk.SimpleFreezeDripSerial('bench', [listener], batch_interval)
+    serial.stopped = False
+    threading.Thread(target=serial.receive_loop, daemon=True).start()
+    start: float = time.perf_counter()
+    i: int
+    for i in range(count):
+        serial.input_queue.put((time.monotonic_ns(), traffic[i % len(traffic)]))
+    while handled[0] < count:
+        app.processEvents()
+    elapsed: float = time.perf_counter() - start
+    serial.close()
+    listener.signal.disconnect()
+    listener.lines_signal.disconnect()
+    listener.signal.connect(window.on_receive_serial_line)
+    listener.lines_signal.connect(window.on_receive_serial_lines)
+    window.on_clear_terminal_push_button_clicked()
+    return count / elapsed
+
+
+def run(count: int = 10_000) -> dict[str, float]:
+    app: QApplication = QApplication.instance() or QApplication([])
+    cwd: str = os.getcwd()
+    directory: str
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            window = desktop_main.load_main_window()
+            window.show()
+            app.processEvents()
+            per_line: float = _lines_per_second(window, 0.0, count)
+            batched: float = _lines_per_second(window, window.receive_batch_interval, count)
+            data: sdk.FreezeDripSerialData
+            data, _ = window.serial_parser.parse_lines(load_traffic())
+            update: float = measure(lambda: window.on_receive_serial_data(data), number=1_000)
+            window.close()
+            sdk.connect_database(pathlib.Path('freeze-drip-terminal-desktop.db')).close()
+        finally:
+            os.chdir(cwd)
+    return {
+        'per-line delivery (lines/s)': per_line,
+        'batched delivery (lines/s)': batched,
+        'repeated status update (us)': update * 1e6,
+    }
+
+
+def main() -> None:
+    report("Received lines through QMainWindowExt", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import tracemalloc
+from typing import Callable
+
+import sdk
+
+from .common import load_traffic, measure, report
+
+
+def _allocated(build: Callable[[], list]) -> tuple[list, int]:
+    tracemalloc.start()
+    items: list = build()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return items, size
+
+
+def run(count: int = 50_000) -> dict[str, float]:
+    lines: list[str] = load_traffic()
+    parser: sdk.FreezeDripSerialParser = sdk.FreezeDripSerialParser()
+    i: int
+    line: str
+    bursts: list[list[str]] = [
+        [f"Status : {0x80 | i % 0x20:02X} Hex",
+         f"Fahrenheit Temperature : {30 + i % 400 / 10:.1f} 'F",
+         f"Current Battery Voltage : {4 + i % 10 / 10:.1f} Volts"] + lines[:24]
+        for i in range(count)]
+
+    data: list[sdk.FreezeDripSerialData]
+    data_size: int
+    data, data_size = _allocated(lambda: [parser.parse_lines(burst)[0] for burst in bursts])
+    records: list[sdk.FreezeDripSerialRecord]
+    records_size: int
+    records, records_size = _allocated(lambda: [sdk.FreezeDripSerialRecord.from_data(x) for x in data])
+    del data
+
+    record: sdk.FreezeDripSerialRecord = records[0]
+    snapshot: sdk.FreezeDripSerialData = record.to_data()
+    profile: sdk.Profile = record.to_profile()
+    profile_record: sdk.ProfileRecord = sdk.ProfileRecord.from_profile(profile)
+    string_display: float = measure(
+        lambda: (
+            str(float(snapshot.temp)), str(float(snapshot.temp_lvl_2_thold)), str(int(snapshot.heartbeat_interval))),
+        number=10_000)
+    record_display: float = measure(
+        lambda: (str(record.temp / 10), str(record.temp_lvl_2_thold / 10), str(record.heartbeat_interval)),
+        number=10_000)
+    parse_profile: float = measure(lambda: parser.parse_profile(profile), number=10_000)
+    parse_profile_record: float = measure(lambda: parser.parse_profile(profile_record), number=10_000)
+    return {
+        'FreezeDripSerialData (bytes/snapshot)': data_size / count,
+        'FreezeDripSerialRecord (bytes/snapshot)': records_size / count,
+        'display from strings (ns)': string_display * 1e9,
+        'display from record (ns)': record_display * 1e9,
+        'parse_profile(Profile) (ns)': parse_profile * 1e9,
+        'parse_profile(ProfileRecord) (ns)': parse_profile_record * 1e9,
+    }
+
+
+def main() -> None:
+    report("Typed records", run())
+
+
+if __name__ == '__main__':
+    main()
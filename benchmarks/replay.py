@@ -0,0 +1,108 @@
+import os
+import pathlib
+import tempfile
+import time
+from typing import Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+
+from desktop import main as desktop_main
+import sdk
+import sdk.capture
+
+from .common import load_traffic, report
+
+_LINES_PER_RECORD: int = 10
+_NOMINAL_LINES_PER_SECOND: int = 1_000
+
+
+def _write_capture(path: pathlib.Path, count: int) -> None:
+    traffic: list[str] = load_traffic()
+    step_ns: int = _LINES_PER_RECORD * 10 ** 9 // _NOMINAL_LINES_PER_SECOND
+    start_ns: int = time.time_ns()
+    with open(path, 'wb') as file:
+        i: int
+        for i in range(0, count, _LINES_PER_RECORD):
+            line: str
+            payload: bytes = ''.join(
+                f"{line}\r\n" for line in (traffic[(i + j) % len(traffic)] for j in range(_LINES_PER_RECORD))).encode()
+            file.write(sdk.capture.RAW_CAPTURE_HEADER.pack(
+                start_ns + i // _LINES_PER_RECORD * step_ns, sdk.capture.RAW_CAPTURE_RECEIVED, len(payload)))
+            file.write(payload)
+
+
+def _parse(url: str, count: int) -> float:
+    parser: sdk.FreezeDripSerialParser = sdk.FreezeDripSerialParser()
+    handled: list[int] = [0]
+
+    def on_lines(lines: list[str]) -> None:
+        parser.parse_lines(lines)
+        handled[0] += len(lines)
+
+    listener: sdk.FreezeDripSerialListener = sdk.FreezeDripSerialListener()
+    listener.lines_signal.connect(on_lines)
+    start: float = time.perf_counter()
+    serial: sdk.SimpleFreezeDripSerial = sdk.SimpleFreezeDripSerial(url, [listener], 0.03).open()
+    while handled[0] < count:
+        time.sleep(0.001)
+    elapsed: float = time.perf_counter() - start
+    serial.close()
+    return elapsed
+
+
+def _render(window, url: str, count: int) -> float:
+    app: QApplication = QApplication.instance()
+    window.on_clear_terminal_push_button_clicked()
+    window.extra_port_names[:] = [url]
+    window.update_port_popup_hookable_combo_box()
+    window.port_popup_hookable_combo_box.setCurrentIndex(window.port_popup_hookable_combo_box.findText(url))
+    start: float = time.perf_counter()
+    window.main_window_model.connected = True
+    while window.terminal_model.line_count < count:
+        app.processEvents()
+    elapsed: float = time.perf_counter() - start
+    window.main_window_model.connected = False
+    return elapsed
+
+
+def run(count: int = 20_000, speeds: tuple[Optional[int], ...] = (10, 40, 160, None)) -> dict[str, float]:
+    app: QApplication = QApplication.instance() or QApplication([])
+    results: dict[str, float] = dict()
+    cwd: str = os.getcwd()
+    directory: str
+    with tempfile.TemporaryDirectory() as directory:
+        capture_path: pathlib.Path = pathlib.Path(directory) / 'session.capture'
+        _write_capture(capture_path, count)
+        os.chdir(directory)
+        try:
+            window = desktop_main.load_main_window()
+            window.show()
+            app.processEvents()
+            window.load()
+            speed: Optional[int]
+            for speed in speeds:
+                url: str = f"replay://{capture_path}?speed={speed or 'max'}"
+                name: str = f"{speed}x" if speed else "max speed"
+                parsed: float = _parse(url, count)
+                rendered: float = _render(window, url, count)
+                results[f'{name}, parse (lines/s)'] = count / parsed
+                results[f'{name}, parse and render (lines/s)'] = count / rendered
+                if speed:
+                    nominal: float = count / _NOMINAL_LINES_PER_SECOND / speed
+                    results[f'{name}, parse behind by (ms)'] = max(0.0, parsed - nominal) * 1e3
+                    results[f'{name}, parse and render behind by (ms)'] = max(0.0, rendered - nominal) * 1e3
+            window.close()
+            sdk.connect_database(pathlib.Path('freeze-drip-terminal-desktop.db')).close()
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def main() -> None:
+    report(f"Replayed capture, 1x = {_NOMINAL_LINES_PER_SECOND} lines/s", run())
+
+
+if __name__ == '__main__':
+    main()
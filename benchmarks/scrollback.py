@@ -0,0 +1,42 @@
+import os
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+
+from desktop import ui, ui_model
+
+from .common import load_traffic, report
+
+
+def run(batches: int = 2_000, line_cap: int = 10_000) -> dict[str, float]:
+    app: QApplication = QApplication.instance() or QApplication([])
+    traffic: list[str] = load_traffic()
+    terminal_model: ui_model.TerminalModel = ui_model.TerminalModel()
+    view: ui.QScrollbackPlainTextEdit = ui.QScrollbackPlainTextEdit()
+    view.setup(terminal_model, line_cap)
+    view.show()
+    results: dict[str, float] = dict()
+    lap: int
+    for lap in range(5):
+        before: int = terminal_model.line_count
+        start: int = time.perf_counter_ns()
+        i: int
+        for i in range(batches):
+            view.append_text(terminal_model.append(traffic[i % len(traffic):i % len(traffic) + 10]))
+        app.processEvents()
+        results[f'append after {before:>6} lines (us/batch)'] = (time.perf_counter_ns() - start) / batches / 1e3
+    results['lines kept in the view'] = view.blockCount() - 1
+    view.page_older()
+    results['paged back to line'] = view.first_line
+    terminal_model.close()
+    return results
+
+
+def main() -> None:
+    report("QScrollbackPlainTextEdit with 10-line batches", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import statistics
+import threading
+import time
+from typing import Optional
+
+import sdk
+
+from .common import report
+
+
+def _stress(devices: int, interval: float, duration: float) -> dict[str, float]:
+    simulator: sdk.FreezeDripSimulator = sdk.FreezeDripSimulator().start()
+    i: int
+    simulated: list[sdk.SimulatedDevice] = [
+        simulator.add(cd=not i % 2, status_interval=interval, seed=i) for i in range(devices)]
+    received: list[int] = [0]
+    readings: list[int] = [0]
+    round_trips: list[float] = list()
+    sent_at: dict[str, float] = dict()
+
+    def on_lines(port: sdk.FreezeDripPort, lines: list[str]) -> None:
+        received[0] += len(lines)
+
+    def on_data(
+            port: sdk.FreezeDripPort,
+            data: Optional[sdk.FreezeDripSerialData],
+            responses: list[sdk.FreezeDripSerialResponse]) -> None:
+        if data:
+            readings[0] += 1
+        if responses and port.port_name in sent_at:
+            round_trips.append(time.perf_counter() - sent_at.pop(port.port_name))
+
+    engine: sdk.FreezeDripEngine = sdk.FreezeDripEngine().start()
+    device: sdk.SimulatedDevice
+    ports: list[sdk.FreezeDripPort] = [engine.open(device.port_name, on_lines, on_data) for device in simulated]
+    time.sleep(0.2)
+    received[0] = readings[0] = 0
+    sent: int = sum(device.sent_lines for device in simulated)
+    threads: int = threading.active_count()
+    start: float = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        port: sdk.FreezeDripPort
+        for port in ports:
+            sent_at[port.port_name] = time.perf_counter()
+            port.submit('RD')
+        time.sleep(0.1)
+    elapsed: float = time.perf_counter() - start
+    sent = sum(device.sent_lines for device in simulated) - sent
+    engine.close()
+    simulator.close()
+    return {
+        'sent (lines/s)': sent / elapsed,
+        'received (lines/s)': received[0] / elapsed,
+        'parsed readings (/s)': readings[0] / elapsed,
+        'RD round trip, median (ms)': statistics.median(round_trips) * 1e3 if round_trips else float('nan'),
+        'threads in total': threads,
+    }
+
+
+def run(
+        device_counts: tuple[int, ...] = (1, 16, 64),
+        interval: float = 0.01,
+        duration: float = 2.0) -> dict[str, float]:
+    results: dict[str, float] = dict()
+    devices: int
+    for devices in device_counts:
+        name: str
+        value: float
+        for name, value in _stress(devices, interval, duration).items():
+            results[f'{devices:>2} devices, {name}'] = value
+    return results
+
+
+def main() -> None:
+    report("Simulated devices reporting every 10 ms into FreezeDripEngine", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+import os
+import re
+import subprocess
+import sys
+import time
+
+from .common import report
+
+_CHILD: str = '''
+import time
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+import desktop.main
+from desktop import ui
+
+marks = dict()
+
+
+class Probe(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and 'paint' not in marks:
+            marks['paint'] = time.perf_counter()
+        return False
+
+
+def load(self, _load=ui.QMainWindowExt.load):
+    _load(self)
+    marks.setdefault('loaded', time.perf_counter())
+    QApplication.quit()
+
+
+def exec_(self=None):
+    probe = Probe()
+    QApplication.instance().installEventFilter(probe)
+    return QApplication.exec()
+
+
+ui.QMainWindowExt.load = load
+QApplication.exec_ = exec_
+desktop.main.main()
+print(marks['paint'], marks['loaded'])
+'''
+
+_IMPORT_TIME: re.Pattern = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)')
+
+
+def _spawn(code: str, cwd: str) -> tuple[float, str]:
+    env: dict[str, str] = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    start: float = time.perf_counter()
+    completed: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-c', code], env=env, cwd=cwd, capture_output=True, text=True, check=True)
+    return start, completed.stdout
+
+
+def import_times(module: str = 'desktop.main') -> dict[str, float]:
+    completed: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True, check=True)
+    results: dict[str, float] = dict()
+    match: re.Match
+    for match in _IMPORT_TIME.finditer(completed.stderr):
+        # Only the modules imported directly by the application packages, plus the packages themselves.
+        if len(match.group(3)) <= 3:
+            results[match.group(4)] = max(results.get(match.group(4), 0.0), int(match.group(2)) / 1e3)
+    return dict(sorted(results.items(), key=lambda item: item[1], reverse=True))
+
+
+def first_paint(repeat: int = 5) -> dict[str, float]:
+    cwd: str = os.path.join(os.path.dirname(__file__), 'data')
+    best: dict[str, float] = {'interpreter (ms)': float('inf'), 'first paint (ms)': float('inf'),
+                              'profiles/commands/ports loaded (ms)': float('inf')}
+    _: int
+    for _ in range(repeat):
+        start: float
+        output: str
+        start, output = _spawn('pass', cwd)
+        best['interpreter (ms)'] = min(best['interpreter (ms)'], (time.perf_counter() - start) * 1e3)
+        start, output = _spawn(_CHILD, cwd)
+        paint: str
+        loaded: str
+        paint, loaded = output.split()
+        best['first paint (ms)'] = min(best['first paint (ms)'], (float(paint) - start) * 1e3)
+        best['profiles/commands/ports loaded (ms)'] = min(
+            best['profiles/commands/ports loaded (ms)'], (float(loaded) - start) * 1e3)
+    database: str
+    for database in ('freeze-drip-terminal-desktop.db', 'freeze-drip-terminal-desktop.db-shm',
+                     'freeze-drip-terminal-desktop.db-wal'):
+        if os.path.exists(os.path.join(cwd, database)):
+            os.remove(os.path.join(cwd, database))
+    return best
+
+
+def run() -> dict[str, float]:
+    results: dict[str, float] = first_paint()
+    name: str
+    value: float
+    for name, value in list(import_times().items())[:10]:
+        results[f'import {name} (ms)'] = value
+    return results
+
+
+def main() -> None:
+    report("Desktop cold start on the offscreen platform", run())
+
+
+if __name__ == '__main__':
+    main()
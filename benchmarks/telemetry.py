@@ -0,0 +1,61 @@
+import pathlib
+import tempfile
+import time
+
+import sdk
+
+from .common import measure, report
+
+_PORTS: tuple[str, ...] = ('/dev/ttyUSB0', '/dev/ttyUSB1', '/dev/ttyUSB2', '/dev/ttyUSB3')
+_HOUR_NS: int = 3600 * 10 ** 9
+
+
+def _reading(i: int, start_ns: int, step_ns: int) -> sdk.TelemetryReading:
+    return sdk.TelemetryReading(
+        port=_PORTS[i % len(_PORTS)],
+        time_ns=start_ns + i * step_ns,
+        monotonic_ns=i * step_ns,
+        role=sdk.TelemetryReading.ROLE_CD if i % 2 else sdk.TelemetryReading.ROLE_RTS,
+        status=0x91,
+        temp=100 + i % 50,
+        cd_battery_volt=48,
+        rts_battery_volt=47)
+
+
+def run(rows: int = 200_000, weeks: int = 3) -> dict[str, float]:
+    results: dict[str, float] = dict()
+    with tempfile.TemporaryDirectory() as directory:
+        telemetry: sdk.TelemetryDatabase = sdk.TelemetryDatabase(pathlib.Path(directory) / 'telemetry.db')
+        step_ns: int = weeks * 7 * 24 * _HOUR_NS // rows
+        start_ns: int = time.time_ns() - weeks * 7 * 24 * _HOUR_NS
+        readings: list[sdk.TelemetryReading] = [_reading(i, start_ns, step_ns) for i in range(rows)]
+
+        start: float = time.perf_counter()
+        reading: sdk.TelemetryReading
+        for reading in readings:
+            telemetry.append(reading)
+        results['append, caller side (us/reading)'] = (time.perf_counter() - start) / rows * 1e6
+        telemetry.flush()
+        results['append + batched commit (readings/s)'] = rows / (time.perf_counter() - start)
+
+        middle_ns: int = start_ns + weeks * 7 * 24 * _HOUR_NS // 2
+
+        def query() -> None:
+            list(telemetry.find(_PORTS[0], middle_ns, middle_ns + _HOUR_NS))
+
+        results['1 h of one port out of the range (ms)'] = measure(query, repeat=10) * 1e3
+        name: str
+        for name in [row['name'] for row in telemetry.database.query(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'telemetry'")]:
+            telemetry.database.query(f'DROP INDEX "{name}"')
+        results['same query without indexes (ms)'] = measure(query, repeat=3) * 1e3
+        telemetry.close()
+    return results
+
+
+def main() -> None:
+    report("TelemetryDatabase", run())
+
+
+if __name__ == '__main__':
+    main()
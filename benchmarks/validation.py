@@ -0,0 +1,71 @@
+import dataclasses
+import random
+
+import numpy
+
+from desktop import ui_model
+import sdk
+
+from .common import measure, report
+
+
+def _profiles(count: int, seed: int = 0) -> list[sdk.Profile]:
+    generator: random.Random = random.Random(seed)
+    profiles: list[sdk.Profile] = list()
+    i: int
+    for i in range(count):
+        field: sdk.FieldRange
+        values: dict[str, str] = {
+            field.name: str(generator.randint(int(field.minimum), int(field.maximum)))
+            for field in sdk.PROFILE_SCHEMA}
+        if not i % 10:
+            values['temp_sensitivity'] = 'x'
+        profiles.append(sdk.Profile(name=f"Profile {i}", **values))
+    return profiles
+
+
+def run(count: int = 10_000) -> dict[str, float]:
+    profiles: list[sdk.Profile] = _profiles(count)
+    profile: sdk.Profile
+    field: sdk.FieldRange
+
+    def validate_each() -> list[list[bool]]:
+        return [[field.is_valid(getattr(profile, field.name)) for field in sdk.PROFILE_SCHEMA] for profile in profiles]
+
+    if not numpy.array_equal(numpy.array(validate_each()), sdk.validate_profiles(profiles)):
+        raise AssertionError("validate_profiles() disagrees with FieldRange.is_valid()")
+    each: float = measure(validate_each, repeat=5)
+    vectorized: float = measure(lambda: sdk.validate_profiles(profiles), repeat=5)
+
+    model: ui_model.MainWindowModel = ui_model.MainWindowModel()
+    model.profile = dataclasses.replace(profiles[1])
+    model.is_profile_valid()
+    values: list[str] = [str(i) for i in range(1, 600)]
+    i: int
+
+    def edit() -> None:
+        for i in range(len(values)):
+            model.profile.lvl_2_pump_on_time = values[i]
+            model.is_profile_valid()
+
+    def revalidate_all() -> None:
+        for i in range(len(values)):
+            model.profile.lvl_2_pump_on_time = values[i]
+            all([field.is_valid(getattr(model.profile, field.name)) for field in sdk.PROFILE_SCHEMA])
+
+    keystroke: float = measure(edit, repeat=7) / len(values)
+    uncached: float = measure(revalidate_all, repeat=7) / len(values)
+    return {
+        f'{count} profiles, one by one (ms)': each * 1e3,
+        f'{count} profiles, vectorized (ms)': vectorized * 1e3,
+        'keystroke, all fields (us)': uncached * 1e6,
+        'keystroke, cached verdicts (us)': keystroke * 1e6,
+    }
+
+
+def main() -> None:
+    report("Profile validation", run())
+
+
+if __name__ == '__main__':
+    main()
@@ -14,7 +14,15 @@ a = Analysis([str(pathlib.Path('.venv') / ('Scripts' if os.name == 'nt' else 'bi
                  (str(pathlib.Path('packages/desktop/ui/main_window.ico')), str(pathlib.Path('desktop/ui'))),
                  (str(pathlib.Path('packages/desktop/ui/main_window.ui')), str(pathlib.Path('desktop/ui'))),
                  (str(pathlib.Path('packages/desktop/ui/received_form.ui')), str(pathlib.Path('desktop/ui')))],
-             hiddenimports=[],
+             # sdk imports these on first use of their names, and pyserial finds replay:// by module name
+             hiddenimports=[
+                 'sdk.aio',
+                 'sdk.constant',
+                 'sdk.protocol_replay',
+                 'sdk.qt',
+                 'sdk.series',
+                 'sdk.simulator',
+                 'sdk.validation'],
              hookspath=[],
              runtime_hooks=[],
              excludes=[],
@@ -0,0 +1,211 @@
+import argparse
+import dataclasses
+import json
+import pathlib
+import sys
+import threading
+import time
+from typing import Any, Optional, Union
+
+import sdk
+
+
+def _open(
+        port_name: str,
+        listener: sdk.FreezeDripSerialListener,
+        batch_interval: float = 0.0,
+        capture: Optional[sdk.RawCaptureSink] = None) -> sdk.SimpleFreezeDripSerial:
+    serial: Optional[sdk.SimpleFreezeDripSerial] = sdk.SimpleFreezeDripSerial(
+        port_name, [listener], batch_interval, capture).open()
+    if not serial:
+        raise SystemExit(f"Cannot open {port_name}")
+    return serial
+
+
+def _exchange(
+        port_name: str,
+        commands: list[str],
+        timeout: float,
+        capture: Optional[sdk.RawCaptureSink] = None) -> list[str]:
+    lines: list[str] = list()
+    listener: sdk.FreezeDripSerialListener = sdk.FreezeDripSerialListener()
+    listener.signal.connect(lines.append)
+    serial: sdk.SimpleFreezeDripSerial = _open(port_name, listener, capture=capture)
+    serial.submit(*commands)
+    done: bool = serial.join(timeout)
+    serial.close()
+    if not done:
+        raise SystemExit(f"Timed out waiting for {port_name}")
+    return lines
+
+
+def _fields(data: Union[sdk.Profile, sdk.FreezeDripSerialData]) -> dict[str, Any]:
+    return {key: value for key, value in dataclasses.asdict(data).items() if value is not None}
+
+
+def _print_fields(fields: dict[str, Any], output_json: bool) -> None:
+    if output_json:
+        print(json.dumps(fields))
+        return
+    key: str
+    value: Any
+    for key, value in fields.items():
+        print(f"{key}: {value}")
+
+
+def _failed(lines: list[str]) -> bool:
+    return 'ERROR' in lines
+
+
+def ports(args: argparse.Namespace) -> int:
+    port: Any
+    for port in sdk.get_available_serial_ports():
+        print(f"{port.device}\t{port.description}")
+    return 0
+
+
+def config(args: argparse.Namespace) -> int:
+    data: Optional[sdk.FreezeDripSerialData] = sdk.FreezeDripSerialParser().parse_lines(
+        _exchange(args.port, ['RD', 'CD0'], args.timeout, args.capture_sink))[0]
+    if not data:
+        print(f"No configuration received from {args.port}", file=sys.stderr)
+        return 1
+    _print_fields(_fields(data), args.json)
+    return 0
+
+
+def push(args: argparse.Namespace) -> int:
+    if not args.db.is_file():
+        print(f"No profile database at {args.db}", file=sys.stderr)
+        return 1
+    profile: sdk.Profile
+    for profile in sdk.ProfileDatabase(args.db).get_all():
+        if args.profile in (str(profile.id), profile.name):
+            break
+    else:
+        print(f"No profile {args.profile!r} in {args.db}", file=sys.stderr)
+        return 1
+    field: sdk.FieldRange
+    invalid: list[str] = [
+        field.name for field in sdk.PROFILE_SCHEMA if not field.is_valid(getattr(profile, field.name))]
+    if invalid:
+        print(f"Profile {profile.name!r} has invalid {', '.join(invalid)}", file=sys.stderr)
+        return 1
+    lines: list[str] = _exchange(
+        args.port, [sdk.FreezeDripSerialParser().parse_profile(profile), 'CD0'], args.timeout, args.capture_sink)
+    print('\n'.join(lines))
+    return 1 if _failed(lines) else 0
+
+
+def send(args: argparse.Namespace) -> int:
+    lines: list[str] = _exchange(args.port, args.commands, args.timeout, args.capture_sink)
+    print('\n'.join(lines))
+    return 1 if _failed(lines) else 0
+
+
+def tail(args: argparse.Namespace) -> int:
+    parser: sdk.FreezeDripSerialParser = sdk.FreezeDripSerialParser()
+
+    def on_lines(lines: list[str]) -> None:
+        if args.raw:
+            print('\n'.join(lines), flush=True)
+            return
+        data: Optional[sdk.FreezeDripSerialData]
+        responses: list[sdk.FreezeDripSerialResponse]
+        data, responses = parser.parse_lines(lines)
+        fields: dict[str, Any] = _fields(data) if data else dict()
+        response: sdk.FreezeDripSerialResponse
+        for response in responses:
+            fields.setdefault('responses', list()).append(response.response)
+        if not fields:
+            return
+        if args.json:
+            print(json.dumps({'time': time.time(), **fields}), flush=True)
+            return
+        print(time.strftime('%H:%M:%S'), ' '.join(f"{key}={value}" for key, value in fields.items()), flush=True)
+
+    listener: sdk.FreezeDripSerialListener = sdk.FreezeDripSerialListener()
+    listener.lines_signal.connect(on_lines)
+    serial: sdk.SimpleFreezeDripSerial = _open(args.port, listener, args.batch_interval, args.capture_sink)
+    try:
+        threading.Event().wait(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        serial.close()
+    return 0
+
+
+def simulate(args: argparse.Namespace) -> int:
+    simulator: sdk.FreezeDripSimulator = sdk.FreezeDripSimulator().start()
+    i: int
+    for i in range(args.count):
+        device: sdk.SimulatedDevice = simulator.add(
+            cd=args.role == 'cd' or args.role == 'mixed' and not i % 2, status_interval=args.interval, seed=i)
+        print(f"{device.port_name}\t{'CD' if device.cd else 'RTS'}", flush=True)
+    try:
+        threading.Event().wait(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.close()
+    return 0
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(prog='freeze-drip-terminal-cli')
+    argument_parser.add_argument('--version', action='version', version=f"%(prog)s {sdk.VERSION}")
+    subparsers: argparse._SubParsersAction = argument_parser.add_subparsers(dest='command', required=True)
+
+    ports_parser: argparse.ArgumentParser = subparsers.add_parser('ports', help="list available serial ports")
+    ports_parser.set_defaults(func=ports)
+
+    config_parser: argparse.ArgumentParser = subparsers.add_parser('config', help="read the device configuration")
+    config_parser.add_argument('port')
+    config_parser.add_argument('--json', action='store_true')
+    config_parser.set_defaults(func=config)
+
+    push_parser: argparse.ArgumentParser = subparsers.add_parser('push', help="send a stored profile to the device")
+    push_parser.add_argument('port')
+    push_parser.add_argument('profile', help="profile id or name")
+    push_parser.add_argument('--db', type=pathlib.Path, default=pathlib.Path('freeze-drip-terminal-desktop.db'))
+    push_parser.set_defaults(func=push)
+
+    send_parser: argparse.ArgumentParser = subparsers.add_parser('send', help="send commands and print the replies")
+    send_parser.add_argument('port')
+    send_parser.add_argument('commands', nargs='+')
+    send_parser.set_defaults(func=send)
+
+    tail_parser: argparse.ArgumentParser = subparsers.add_parser('tail', help="print parsed telemetry as it arrives")
+    tail_parser.add_argument('port')
+    tail_parser.add_argument('--raw', action='store_true')
+    tail_parser.add_argument('--json', action='store_true')
+    tail_parser.add_argument('--duration', type=float, default=None)
+    tail_parser.add_argument('--batch-interval', type=float, default=0.1)
+    tail_parser.set_defaults(func=tail)
+
+    simulate_parser: argparse.ArgumentParser = subparsers.add_parser(
+        'simulate', help="run simulated devices on pseudo terminals")
+    simulate_parser.add_argument('--count', type=int, default=1)
+    simulate_parser.add_argument('--role', choices=('cd', 'rts', 'mixed'), default='cd')
+    simulate_parser.add_argument('--interval', type=float, default=1.0, help="seconds between status reports")
+    simulate_parser.add_argument('--duration', type=float, default=None)
+    simulate_parser.set_defaults(func=simulate)
+
+    subparser: argparse.ArgumentParser
+    for subparser in (config_parser, push_parser, send_parser):
+        subparser.add_argument('--timeout', type=float, default=10.0)
+    for subparser in (config_parser, push_parser, send_parser, tail_parser):
+        subparser.add_argument('--capture', type=pathlib.Path, help="append the raw bytes to a capture file")
+    return argument_parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args: argparse.Namespace = build_argument_parser().parse_args(argv)
+    capture_path: Optional[pathlib.Path] = getattr(args, 'capture', None)
+    args.capture_sink = sdk.RawCaptureSink(capture_path) if capture_path else None
+    try:
+        return args.func(args)
+    finally:
+        if args.capture_sink:
+            args.capture_sink.close()
@@ -1,24 +1,28 @@
 import importlib.resources
 import logging
+import os
 import pathlib
 import sys
+from typing import Any, Optional, Union
 
 from PySide6.QtCore import QCoreApplication, QFile, QIODevice, Qt
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QWidget
+import sdk
 
 from . import ui
 
+logger: logging.Logger = logging.getLogger(__name__)
 
-def main() -> int:
-    logging.basicConfig()
-    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
-    app: QApplication = QApplication(sys.argv)
+
+def _load_forms_with_ui_loader() -> tuple[ui.QMainWindowExt, ui.QReceivedForm]:
+    import PySide6.QtXml  # This is only for PyInstaller to process properly
+    from PySide6.QtUiTools import QUiLoader
 
     ui_loader: QUiLoader = QUiLoader()
     ui_loader.registerCustomWidget(ui.QReceivedForm)
     ui_loader.registerCustomWidget(ui.QMainWindowExt)
     ui_loader.registerCustomWidget(ui.QPopupHookableComboBox)
+    ui_loader.registerCustomWidget(ui.QScrollbackPlainTextEdit)
     ui_loader.registerCustomWidget(ui.QSelectAllOnFocusLineEdit)
 
     ui_path: pathlib.Path
@@ -33,7 +37,61 @@ def main() -> int:
         if not ui_file.open(QIODevice.ReadOnly):
             raise RuntimeError(f"Cannot open {ui_path}: {ui_file.errorString()}")
         main_window: ui.QMainWindowExt = ui_loader.load(ui_file)
-        main_window.setup(received_form)
         ui_file.close()
+    return main_window, received_form
+
+
+def _set_up_form(form: Any, widget: QWidget) -> None:
+    form.setupUi(widget)
+    name: str
+    value: Any
+    for name, value in vars(form).items():
+        setattr(widget, name, value)
+
+
+def _build_forms() -> tuple[ui.QMainWindowExt, ui.QReceivedForm]:
+    from .ui import ui_main_window, ui_received_form
+
+    received_form: ui.QReceivedForm = ui.QReceivedForm()
+    _set_up_form(ui_received_form.Ui_Form(), received_form)
+    main_window: ui.QMainWindowExt = ui.QMainWindowExt()
+    _set_up_form(ui_main_window.Ui_MainWindow(), main_window)
+    return main_window, received_form
+
+
+def load_main_window(scrollback_line_cap: int = 10_000, use_ui_loader: bool = False) -> ui.QMainWindowExt:
+    main_window: Optional[ui.QMainWindowExt] = None
+    received_form: Optional[ui.QReceivedForm] = None
+    if not use_ui_loader:
+        try:
+            main_window, received_form = _build_forms()
+        except ModuleNotFoundError as e:
+            if e.name not in (f'{ui.__name__}.ui_main_window', f'{ui.__name__}.ui_received_form'):
+                raise
+            logger.info("Generated UI modules are absent, loading the .ui files instead")
+    if not main_window:
+        main_window, received_form = _load_forms_with_ui_loader()
+    main_window.setup(received_form, scrollback_line_cap)
+    return main_window
+
+
+def main() -> int:
+    level_name: str = os.environ.get('FREEZE_DRIP_TERMINAL_LOG_LEVEL', 'WARNING').upper()
+    level: Union[int, str] = logging.getLevelName(level_name)
+    logging.basicConfig(level=level if isinstance(level, int) else logging.WARNING)
+    if not isinstance(level, int):
+        logger.warning("Unknown log level %r, using WARNING", level_name)
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    app: QApplication = QApplication(sys.argv)
+
+    main_window: ui.QMainWindowExt = load_main_window(
+        int(os.environ.get('FREEZE_DRIP_TERMINAL_SCROLLBACK_LINES', 10_000)),
+        bool(os.environ.get('FREEZE_DRIP_TERMINAL_UI_LOADER')))
+    capture_path: Optional[str] = os.environ.get('FREEZE_DRIP_TERMINAL_CAPTURE')
+    if capture_path:
+        main_window.capture = sdk.RawCaptureSink(capture_path)
+    replay_url: Optional[str] = os.environ.get('FREEZE_DRIP_TERMINAL_REPLAY')
+    if replay_url:
+        main_window.extra_port_names.append(replay_url)
     main_window.show()
     return app.exec_()
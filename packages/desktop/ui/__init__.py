@@ -1,4 +1,7 @@
+from .latency_diagnostics_widget import QLatencyDiagnosticsWidget
 from .main_window import QMainWindowExt
 from .popup_hookable_combox import QPopupHookableComboBox
 from .received_form import QReceivedForm
+from .scrollback_plain_text_edit import QScrollbackPlainTextEdit
 from .select_all_on_focus_line_edit import QSelectAllOnFocusLineEdit
+from .telemetry_chart_widget import QTelemetryChartWidget
@@ -0,0 +1,42 @@
+import pathlib
+import re
+import subprocess
+import sys
+
+_FORMS: dict[str, str] = {
+    'main_window.ui': 'ui_main_window.py',
+    'received_form.ui': 'ui_received_form.py',
+}
+
+# pyside6-uic writes characters outside the BMP as UTF-16 surrogate pairs, which Python keeps as lone surrogates
+_SURROGATE_PAIR: re.Pattern = re.compile(r'\\u(d[89ab][0-9a-f]{2})\\u(d[c-f][0-9a-f]{2})', re.IGNORECASE)
+
+# The windows connect their signals explicitly in setup(), like the QUiLoader path
+_CONNECT_SLOTS_BY_NAME: re.Pattern = re.compile(r'^ *QMetaObject\.connectSlotsByName\(\w+\)\n', re.MULTILINE)
+
+
+def _join_surrogate_pair(match: re.Match) -> str:
+    high: int = int(match.group(1), 16)
+    low: int = int(match.group(2), 16)
+    return f'\\U{0x10000 + ((high - 0xD800) << 10) + (low - 0xDC00):08x}'
+
+
+def compile_form(ui_path: pathlib.Path, py_path: pathlib.Path) -> None:
+    source: str = subprocess.run(
+        ['pyside6-uic', str(ui_path)], capture_output=True, text=True, encoding='utf-8', check=True).stdout
+    source = _CONNECT_SLOTS_BY_NAME.sub('', source)
+    py_path.write_text(_SURROGATE_PAIR.sub(_join_surrogate_pair, source), encoding='utf-8')
+
+
+def main() -> int:
+    directory: pathlib.Path = pathlib.Path(__file__).parent
+    ui_name: str
+    py_name: str
+    for ui_name, py_name in _FORMS.items():
+        compile_form(directory / ui_name, directory / py_name)
+        print(f"{ui_name} -> {py_name}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+from typing import Any, Optional
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QHideEvent, QShowEvent
+from PySide6.QtWidgets import (
+    QFileDialog, QHBoxLayout, QHeaderView, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
+
+import sdk
+
+
+class QLatencyDiagnosticsWidget(QWidget):
+    STAGES: dict[str, str] = {
+        'frame': "Serial read to queued",
+        'queue': "Serial read to dequeued",
+        'batch': "Dequeued to emitted",
+        'signal': "Emitted to delivered",
+        'terminal': "Terminal append",
+        'parse': "Parse",
+        'widgets': "Widget update",
+        'total': "Serial read to widgets updated",
+    }
+    COLUMNS: tuple[str, ...] = ("Count", "p50", "p99", "Max")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latency: Optional[sdk.LatencyMonitor] = None
+        self.table_widget: QTableWidget = QTableWidget(0, len(self.COLUMNS), self)
+        self.table_widget.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_widget.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.reset_push_button: QPushButton = QPushButton("Reset", self)
+        self.reset_push_button.clicked.connect(self.on_reset_push_button_clicked)
+        self.export_push_button: QPushButton = QPushButton("Export...", self)
+        self.export_push_button.clicked.connect(self.on_export_push_button_clicked)
+
+        buttons_layout: QHBoxLayout = QHBoxLayout()
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.reset_push_button)
+        buttons_layout.addWidget(self.export_push_button)
+        layout: QVBoxLayout = QVBoxLayout(self)
+        layout.addWidget(self.table_widget)
+        layout.addLayout(buttons_layout)
+
+        self._refresh_timer: QTimer = QTimer(self)
+        self._refresh_timer.setInterval(1000)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.resize(560, 360)
+
+    def setup(self, latency: sdk.LatencyMonitor) -> None:
+        self.latency = latency
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self.refresh()
+        self._refresh_timer.start()
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self) -> None:
+        if not self.latency:
+            return
+        snapshot: dict[str, Any] = self.latency.snapshot()
+        name: str
+        stages: list[str] = [name for name in self.STAGES if name in snapshot['stages']]
+        stages += sorted(name for name in snapshot['stages'] if name not in self.STAGES)
+        rows: list[tuple[str, list[str]]] = list()
+        stage: dict[str, float]
+        for name in stages:
+            stage = snapshot['stages'][name]
+            rows.append((f"{self.STAGES.get(name, name)} (ms)", [
+                str(stage['count']), f"{stage['p50_us'] / 1e3:.3f}", f"{stage['p99_us'] / 1e3:.3f}",
+                f"{stage['max_us'] / 1e3:.3f}"]))
+        depth: dict[str, int]
+        for name, depth in sorted(snapshot['depths'].items()):
+            rows.append((f"{name.capitalize()} depth (lines)", [
+                str(depth['count']), str(depth['p50']), str(depth['p99']), str(depth['max'])]))
+
+        self.table_widget.setRowCount(len(rows))
+        self.table_widget.setVerticalHeaderLabels([name for name, _ in rows])
+        row: int
+        cells: list[str]
+        for row, (_, cells) in enumerate(rows):
+            column: int
+            cell: str
+            for column, cell in enumerate(cells):
+                item: Optional[QTableWidgetItem] = self.table_widget.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    self.table_widget.setItem(row, column, item)
+                item.setText(cell)
+
+    def on_reset_push_button_clicked(self) -> None:
+        if self.latency:
+            self.latency.reset()
+        self.refresh()
+
+    def on_export_push_button_clicked(self) -> None:
+        if not self.latency:
+            return
+        path: str
+        path, _ = QFileDialog.getSaveFileName(self, "Export Latency", "latency.json", "JSON (*.json)")
+        if path:
+            self.latency.export(path)
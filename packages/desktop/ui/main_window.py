@@ -1,48 +1,116 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import importlib.resources
 import pathlib
 import time
-from typing import Optional, Union
+from typing import Optional, TYPE_CHECKING
 
-import PySide6.QtXml  # This is only for PyInstaller to process properly
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QCloseEvent, QIcon, QTextCursor
+from PySide6.QtCore import QEvent, Qt, QTimer
+from PySide6.QtGui import QCloseEvent, QIcon, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
+    QLineEdit,
     QListWidgetItem,
     QMainWindow)
 import sdk
-import serial.tools.list_ports
-import serial.tools.list_ports_common
+import sdk.qt
 
+from .latency_diagnostics_widget import QLatencyDiagnosticsWidget
 from .popup_hookable_combox import QPopupHookableComboBox
 from .received_form import QReceivedForm
+from .telemetry_chart_widget import QTelemetryChartWidget
 from .. import ui_model
 
+if TYPE_CHECKING:
+    import serial.tools.list_ports_common
+
 
 class QMainWindowExt(QMainWindow):
+    # FreezeDripSerialData field, the line edit showing it and the type it is shown as
+    STATUS_BINDINGS: tuple[tuple[str, str, type], ...] = (
+        ('status', 'status_code_line_edit', str),
+        ('temp', 'temp_line_edit', float),
+        ('rts_battery_volt', 'rts_bat_volt_line_edit', str),
+        ('cd_battery_volt', 'cd_bat_volt_line_edit', str),
+        ('heartbeat_flag', 'heartbeat_flag_line_edit', str),
+        ('low_temp_flag', 'low_temp_flag_line_edit', str),
+        ('low_bat_flag', 'low_bat_flag_line_edit', str),
+        ('setup_flag', 'setup_flag_line_edit', str),
+    )
+    # Profile field and the type it is shown as in current_<field>_line_edit and expected_<field>_line_edit
+    PROFILE_BINDINGS: tuple[tuple[str, type], ...] = (
+        ('temp_lvl_2_thold', float),
+        ('temp_lvl_3_thold', float),
+        ('temp_lvl_4_thold', float),
+        ('temp_sensitivity', float),
+        ('temp_detection_interval', int),
+        ('scale_of_pump_on_time', float),
+        ('lvl_2_pump_on_time', int),
+        ('lvl_2_pump_off_time', int),
+        ('lvl_3_pump_on_time', int),
+        ('lvl_3_pump_off_time', int),
+        ('low_battery_thold', float),
+        ('lost_alarm_interval', int),
+        ('heartbeat_interval', int),
+        ('setup_duration', int),
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.main_window_model: ui_model.MainWindowModel = ui_model.MainWindowModel()
+        self.terminal_model: ui_model.TerminalModel = ui_model.TerminalModel()
 
         self.serial: Optional[sdk.SimpleFreezeDripSerial] = None
-        self.seirla_receiver: sdk.SimpleFreezeDripSerialListener = sdk.SimpleFreezeDripSerialListener()
+        self.seirla_receiver: sdk.qt.SimpleFreezeDripSerialListener = sdk.qt.SimpleFreezeDripSerialListener()
         self.seirla_receiver.signal.connect(self.on_receive_serial_line)
+        self.seirla_receiver.lines_signal.connect(self.on_receive_serial_lines)
         self.serial_parser: sdk.FreezeDripSerialParser = sdk.FreezeDripSerialParser()
 
+        self.receive_batch_interval: float = 0.03
+        self.loaded: bool = False
+        self.capture: Optional[sdk.RawCaptureSink] = None
+        self.telemetry: Optional[sdk.TelemetryDatabase] = None
+        self.extra_port_names: list[str] = list()
+        self.telemetry_chart_model: Optional[ui_model.TelemetryChartModel] = None
+        self.telemetry_chart_widget: Optional[QTelemetryChartWidget] = None
+        self.latency: sdk.LatencyMonitor = sdk.LatencyMonitor()
+        self.latency_diagnostics_widget: Optional[QLatencyDiagnosticsWidget] = None
+
         self.received_form: Optional[QReceivedForm] = None
+        self.status_bindings: list[tuple[str, QLineEdit, type]] = list()
+        self.profile_bindings: list[tuple[str, QLineEdit, QLineEdit, type]] = list()
+        self.updated_at_second: int = 0
         self.window_title: str = f"Freeze Drip Terminal {sdk.VERSION}"
 
     def closeEvent(self, event: QCloseEvent) -> None:
         if self.serial:
             self.serial.close()
+        if self.capture:
+            self.capture.close()
+        if self.telemetry:
+            self.telemetry.close()
+        if self.telemetry_chart_widget:
+            self.telemetry_chart_widget.close()
+        if self.latency_diagnostics_widget:
+            self.latency_diagnostics_widget.close()
+        self.terminal_model.close()
         super().closeEvent(event)
 
-    def setup(self, received_form: QReceivedForm) -> None:
+    def setup(self, received_form: QReceivedForm, scrollback_line_cap: int = 10_000) -> None:
         self.received_form = received_form
+        name: str
+        line_edit_name: str
+        kind: type
+        self.status_bindings = [
+            (name, getattr(self, line_edit_name), kind) for name, line_edit_name, kind in self.STATUS_BINDINGS]
+        self.profile_bindings = [
+            (name, getattr(self, f'current_{name}_line_edit'), getattr(self, f'expected_{name}_line_edit'), kind)
+            for name, kind in self.PROFILE_BINDINGS]
+        self.terminal_plain_text_edit.setup(self.terminal_model, scrollback_line_cap)
+        self.received_form.terminal_plain_text_edit.setup(self.terminal_model, scrollback_line_cap)
 
         self.setWindowTitle(self.window_title)
 
@@ -69,34 +137,9 @@ class QMainWindowExt(QMainWindow):
 
         self.main_window_model.add_on_changed_observer(self.on_profile_model_changed, 'profile')
         self.profile_name_line_edit.textChanged.connect(self.on_profile_name_line_edit_text_changed)
-        self.expected_temp_lvl_2_thold_line_edit.textChanged.connect(
-            self.on_expected_temp_lvl_2_thold_line_edit_text_changed)
-        self.expected_temp_lvl_3_thold_line_edit.textChanged.connect(
-            self.on_expected_temp_lvl_3_thold_line_edit_text_changed)
-        self.expected_temp_lvl_4_thold_line_edit.textChanged.connect(
-            self.on_expected_temp_lvl_4_thold_line_edit_text_changed)
-        self.expected_temp_sensitivity_line_edit.textChanged.connect(
-            self.on_expected_temp_sensitivity_line_edit_text_changed)
-        self.expected_temp_detection_interval_line_edit.textChanged.connect(
-            self.on_expected_temp_detection_interval_line_edit_text_changed)
-        self.expected_scale_of_pump_on_time_line_edit.textChanged.connect(
-            self.on_expected_scale_of_pump_on_time_line_edit_text_changed)
-        self.expected_lvl_2_pump_on_time_line_edit.textChanged.connect(
-            self.on_expected_lvl_2_pump_on_time_line_edit_text_changed)
-        self.expected_lvl_2_pump_off_time_line_edit.textChanged.connect(
-            self.on_expected_lvl_2_pump_off_time_line_edit_text_changed)
-        self.expected_lvl_3_pump_on_time_line_edit.textChanged.connect(
-            self.on_expected_lvl_3_pump_on_time_line_edit_text_changed)
-        self.expected_lvl_3_pump_off_time_line_edit.textChanged.connect(
-            self.on_expected_lvl_3_pump_off_time_line_edit_text_changed)
-        self.expected_low_battery_thold_line_edit.textChanged.connect(
-            self.on_expected_low_battery_thold_line_edit_text_changed)
-        self.expected_lost_alarm_interval_line_edit.textChanged.connect(
-            self.on_expected_lost_alarm_interval_line_edit_text_changed)
-        self.expected_heartbeat_interval_line_edit.textChanged.connect(
-            self.on_expected_heartbeat_interval_line_edit_text_changed)
-        self.expected_setup_duration_line_edit.textChanged.connect(
-            self.on_expected_setup_duration_line_edit_text_changed)
+        line_edit: QLineEdit
+        for name, _, line_edit, _ in self.profile_bindings:
+            line_edit.textChanged.connect(functools.partial(self.on_expected_line_edit_text_changed, name))
 
         self.send_profile_push_button.clicked.connect(self.on_send_profile_push_button_clicked)
         self.save_profile_push_button.clicked.connect(self.on_save_profile_push_button_clicked)
@@ -120,14 +163,42 @@ class QMainWindowExt(QMainWindow):
         self.clear_terminal_push_button.clicked.connect(self.on_clear_terminal_push_button_clicked)
         self.show_hide_external_terminal_push_button.clicked.connect(
             self.on_show_hide_external_terminal_push_button_clicked)
+        QShortcut(QKeySequence('Ctrl+T'), self, self.on_show_hide_telemetry_chart_shortcut_activated)
+        QShortcut(QKeySequence('Ctrl+L'), self, self.on_show_hide_latency_diagnostics_shortcut_activated)
 
-        self.update_port_popup_hookable_combo_box()
         self.on_connected_changed(False)
 
+        self.port_popup_hookable_combo_box.setFocus()
+
+    def load(self) -> None:
+        if self.loaded:
+            return
+        self.loaded = True
+        self.telemetry_chart_model = ui_model.TelemetryChartModel()
+        self.telemetry_chart_widget = QTelemetryChartWidget()
+        self.telemetry_chart_widget.setup(self.telemetry_chart_model)
+        self.telemetry_chart_widget.setWindowTitle(f"Telemetry - {self.window_title}")
+        self.telemetry_chart_widget.setWindowIcon(self.windowIcon())
+        self.telemetry_chart_widget.resize(640, 400)
+        QShortcut(
+            QKeySequence('Ctrl+T'), self.telemetry_chart_widget, self.on_show_hide_telemetry_chart_shortcut_activated)
+        self.latency_diagnostics_widget = QLatencyDiagnosticsWidget()
+        self.latency_diagnostics_widget.setup(self.latency)
+        self.latency_diagnostics_widget.setWindowTitle(f"Latency - {self.window_title}")
+        self.latency_diagnostics_widget.setWindowIcon(self.windowIcon())
+        QShortcut(
+            QKeySequence('Ctrl+L'), self.latency_diagnostics_widget,
+            self.on_show_hide_latency_diagnostics_shortcut_activated)
+        self.on_connected_changed(self.main_window_model.connected)
         self.on_profiles_model_changed(self.main_window_model.profiles)
         self.on_commands_model_changed(self.main_window_model.commands)
 
-        self.port_popup_hookable_combo_box.setFocus()
+    def event(self, event: QEvent) -> bool:
+        handled: bool = super().event(event)
+        if event.type() == QEvent.Paint and not self.loaded:
+            # The first frame has been painted, so the slower loading no longer delays it
+            QTimer.singleShot(0, self.load)
+        return handled
 
     def update_port_popup_hookable_combo_box(self):
         origin: str = self.port_popup_hookable_combo_box.currentText()
@@ -136,6 +207,7 @@ class QMainWindowExt(QMainWindow):
         port_info: serial.tools.list_ports_common.ListPortInfo
         port_name: str
         self.port_popup_hookable_combo_box.addItems(sorted(port_info.name for port_info in port_infos))
+        self.port_popup_hookable_combo_box.addItems(self.extra_port_names)
         index: int = self.port_popup_hookable_combo_box.findText(origin, flags=Qt.MatchExactly)
         self.port_popup_hookable_combo_box.setCurrentIndex(0 if index < 0 else index)
 
@@ -144,47 +216,34 @@ class QMainWindowExt(QMainWindow):
 
     def on_connected_changed(self, connected: bool):
         self.port_popup_hookable_combo_box.setEnabled(not connected)
-        self.port_connect_push_button.setEnabled(
-            bool(sdk.get_available_serial_ports() and not connected))
         self.port_disconnect_push_button.setEnabled(connected)
         self.refresh_push_button.setEnabled(connected)
         self.copy_to_profile_push_button.setEnabled(connected)
         self.send_profile_push_button.setEnabled(connected)
         self.send_command_push_button.setEnabled(connected)
-        self.update_port_popup_hookable_combo_box()
-
-        self.status_code_line_edit.setEnabled(connected)
-        self.temp_line_edit.setEnabled(connected)
-        self.rts_bat_volt_line_edit.setEnabled(connected)
-        self.cd_bat_volt_line_edit.setEnabled(connected)
-        self.heartbeat_flag_line_edit.setEnabled(connected)
-        self.low_temp_flag_line_edit.setEnabled(connected)
-        self.low_bat_flag_line_edit.setEnabled(connected)
-        self.setup_flag_line_edit.setEnabled(connected)
+        if self.loaded:
+            self.update_port_popup_hookable_combo_box()
+        self.port_connect_push_button.setEnabled(self.port_popup_hookable_combo_box.count() > 0 and not connected)
 
+        line_edit: QLineEdit
+        for _, line_edit, _ in self.status_bindings:
+            line_edit.setEnabled(connected)
         self.updated_at_line_edit.setEnabled(connected)
-        self.current_temp_lvl_2_thold_line_edit.setEnabled(connected)
-        self.current_temp_lvl_3_thold_line_edit.setEnabled(connected)
-        self.current_temp_lvl_4_thold_line_edit.setEnabled(connected)
-        self.current_temp_sensitivity_line_edit.setEnabled(connected)
-        self.current_temp_detection_interval_line_edit.setEnabled(connected)
-        self.current_scale_of_pump_on_time_line_edit.setEnabled(connected)
-        self.current_lvl_2_pump_on_time_line_edit.setEnabled(connected)
-        self.current_lvl_2_pump_off_time_line_edit.setEnabled(connected)
-        self.current_lvl_3_pump_on_time_line_edit.setEnabled(connected)
-        self.current_lvl_3_pump_off_time_line_edit.setEnabled(connected)
-        self.current_low_battery_thold_line_edit.setEnabled(connected)
-        self.current_lost_alarm_interval_line_edit.setEnabled(connected)
-        self.current_heartbeat_interval_line_edit.setEnabled(connected)
-        self.current_setup_duration_line_edit.setEnabled(connected)
+        for _, line_edit, _, _ in self.profile_bindings:
+            line_edit.setEnabled(connected)
 
         self.terminal_plain_text_edit.setEnabled(connected)
         self.received_form.terminal_plain_text_edit.setEnabled(connected)
 
         if connected:
+            if not self.telemetry:
+                self.telemetry = sdk.TelemetryDatabase(self.main_window_model.db_path)
             self.serial = sdk.SimpleFreezeDripSerial(
                 self.port_popup_hookable_combo_box.currentText(),
-                [self.seirla_receiver]).open()
+                [self.seirla_receiver],
+                self.receive_batch_interval,
+                self.capture,
+                self.latency).open()
             self.setWindowTitle(f"{self.window_title} - {self.port_popup_hookable_combo_box.currentText()}")
             self.received_form.setWindowTitle(
                 f"{self.port_popup_hookable_combo_box.currentText()} - Received - {self.window_title}")
@@ -203,51 +262,22 @@ class QMainWindowExt(QMainWindow):
         self.main_window_model.connected = False
 
     def on_refresh_push_button_clicked(self):
-        self.status_code_line_edit.setText("")
-        self.current_low_battery_thold_line_edit.setText("")
-        self.cd_bat_volt_line_edit.setText("")
-        self.rts_bat_volt_line_edit.setText("")
-        self.heartbeat_flag_line_edit.setText("")
-        self.low_temp_flag_line_edit.setText("")
-        self.low_bat_flag_line_edit.setText("")
-        self.setup_flag_line_edit.setText("")
-
+        line_edit: QLineEdit
+        for _, line_edit, _ in self.status_bindings:
+            line_edit.setText("")
         self.updated_at_line_edit.setText("")
-        self.current_temp_lvl_2_thold_line_edit.setText("")
-        self.current_temp_lvl_3_thold_line_edit.setText("")
-        self.current_temp_lvl_4_thold_line_edit.setText("")
-        self.current_temp_sensitivity_line_edit.setText("")
-        self.current_temp_detection_interval_line_edit.setText("")
-        self.current_scale_of_pump_on_time_line_edit.setText("")
-        self.current_lvl_2_pump_on_time_line_edit.setText("")
-        self.current_lvl_2_pump_off_time_line_edit.setText("")
-        self.current_lvl_3_pump_on_time_line_edit.setText("")
-        self.current_lvl_3_pump_off_time_line_edit.setText("")
-        self.current_low_battery_thold_line_edit.setText("")
-        self.current_lost_alarm_interval_line_edit.setText("")
-        self.current_heartbeat_interval_line_edit.setText("")
-        self.current_setup_duration_line_edit.setText("")
+        self.updated_at_second = 0
+        for _, line_edit, _, _ in self.profile_bindings:
+            line_edit.setText("")
 
         if self.serial:
-            self.serial.send('RD')
-            time.sleep(0.1)
-            self.serial.send('CD0')
+            self.serial.submit('RD', 'CD0')
 
     def on_copy_to_profile_push_button_clicked(self):
-        self.expected_temp_lvl_2_thold_line_edit.setText(self.current_temp_lvl_2_thold_line_edit.text())
-        self.expected_temp_lvl_3_thold_line_edit.setText(self.current_temp_lvl_3_thold_line_edit.text())
-        self.expected_temp_lvl_4_thold_line_edit.setText(self.current_temp_lvl_4_thold_line_edit.text())
-        self.expected_temp_sensitivity_line_edit.setText(self.current_temp_sensitivity_line_edit.text())
-        self.expected_temp_detection_interval_line_edit.setText(self.current_temp_detection_interval_line_edit.text())
-        self.expected_scale_of_pump_on_time_line_edit.setText(self.current_scale_of_pump_on_time_line_edit.text())
-        self.expected_lvl_2_pump_on_time_line_edit.setText(self.current_lvl_2_pump_on_time_line_edit.text())
-        self.expected_lvl_2_pump_off_time_line_edit.setText(self.current_lvl_2_pump_off_time_line_edit.text())
-        self.expected_lvl_3_pump_on_time_line_edit.setText(self.current_lvl_3_pump_on_time_line_edit.text())
-        self.expected_lvl_3_pump_off_time_line_edit.setText(self.current_lvl_3_pump_off_time_line_edit.text())
-        self.expected_low_battery_thold_line_edit.setText(self.current_low_battery_thold_line_edit.text())
-        self.expected_lost_alarm_interval_line_edit.setText(self.current_lost_alarm_interval_line_edit.text())
-        self.expected_heartbeat_interval_line_edit.setText(self.current_heartbeat_interval_line_edit.text())
-        self.expected_setup_duration_line_edit.setText(self.current_setup_duration_line_edit.text())
+        current_line_edit: QLineEdit
+        expected_line_edit: QLineEdit
+        for _, current_line_edit, expected_line_edit, _ in self.profile_bindings:
+            expected_line_edit.setText(current_line_edit.text())
 
     def on_remove_profile_push_button_clicked(self):
         self.main_window_model.remove_profile()
@@ -259,9 +289,7 @@ class QMainWindowExt(QMainWindow):
     def on_send_profile_push_button_clicked(self):
         if not self.serial:
             return
-        self.serial.send(self.serial_parser.parse_profile(self.main_window_model.profile))
-        time.sleep(0.1)
-        self.serial.send('CD0')
+        self.serial.submit(self.serial_parser.parse_profile(self.main_window_model.profile), 'CD0')
 
     def on_save_profile_push_button_clicked(self):
         self.main_window_model.save_profile()
@@ -278,29 +306,19 @@ class QMainWindowExt(QMainWindow):
             self, selected: QListWidgetItem, deselected: QListWidgetItem) -> None:
         if self.profile_list_widget.currentRow() < 0:
             return
-        self.main_window_model.profile = self.main_window_model.profiles[self.profile_list_widget.currentRow()]
+        self.main_window_model.select_profile(self.profile_list_widget.currentRow())
 
     def on_profile_list_widget_item_clicked(self, item: QListWidgetItem):
-        self.main_window_model.profile = self.main_window_model.profiles[self.profile_list_widget.currentRow()]
+        self.main_window_model.select_profile(self.profile_list_widget.currentRow())
 
     def on_profile_model_changed(self, profile: Optional[sdk.Profile]) -> None:
         if not profile:
             return
         self.profile_name_line_edit.setText(profile.name)
-        self.expected_temp_lvl_2_thold_line_edit.setText(profile.temp_lvl_2_thold)
-        self.expected_temp_lvl_3_thold_line_edit.setText(profile.temp_lvl_3_thold)
-        self.expected_temp_lvl_4_thold_line_edit.setText(profile.temp_lvl_4_thold)
-        self.expected_temp_sensitivity_line_edit.setText(profile.temp_sensitivity)
-        self.expected_temp_detection_interval_line_edit.setText(profile.temp_detection_interval)
-        self.expected_scale_of_pump_on_time_line_edit.setText(profile.scale_of_pump_on_time)
-        self.expected_lvl_2_pump_on_time_line_edit.setText(profile.lvl_2_pump_on_time)
-        self.expected_lvl_2_pump_off_time_line_edit.setText(profile.lvl_2_pump_off_time)
-        self.expected_lvl_3_pump_on_time_line_edit.setText(profile.lvl_3_pump_on_time)
-        self.expected_lvl_3_pump_off_time_line_edit.setText(profile.lvl_3_pump_off_time)
-        self.expected_low_battery_thold_line_edit.setText(profile.low_battery_thold)
-        self.expected_lost_alarm_interval_line_edit.setText(profile.lost_alarm_interval)
-        self.expected_heartbeat_interval_line_edit.setText(profile.heartbeat_interval)
-        self.expected_setup_duration_line_edit.setText(profile.setup_duration)
+        name: str
+        line_edit: QLineEdit
+        for name, _, line_edit, _ in self.profile_bindings:
+            line_edit.setText(getattr(profile, name))
 
     def on_remove_command_push_button_clicked(self):
         self.main_window_model.remove_command()
@@ -315,106 +333,47 @@ class QMainWindowExt(QMainWindow):
     def on_send_command_push_button_clicked(self):
         if not self.serial:
             return
-        self.serial.send(self.command_line_edit.text())
+        self.serial.submit(self.command_line_edit.text())
 
     def on_terminal_plain_text_edit_text_changed(self):
-        self.clear_terminal_push_button.setEnabled(bool(self.terminal_plain_text_edit.toPlainText()))
+        self.clear_terminal_push_button.setEnabled(not self.terminal_plain_text_edit.document().isEmpty())
 
     def on_clear_terminal_push_button_clicked(self):
-        self.terminal_plain_text_edit.setPlainText("")
-        self.received_form.terminal_plain_text_edit.setPlainText("")
+        self.terminal_model.clear()
+        self.terminal_plain_text_edit.clear_scrollback()
+        self.received_form.terminal_plain_text_edit.clear_scrollback()
 
     def on_show_hide_external_terminal_push_button_clicked(self):
         if not self.received_form:
             return
         self.received_form.hide() if self.received_form.isVisible() else self.received_form.show()
 
-    def on_profile_name_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.name = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_temp_lvl_2_thold_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.temp_lvl_2_thold = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_temp_lvl_3_thold_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.temp_lvl_3_thold = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_temp_lvl_4_thold_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.temp_lvl_4_thold = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_temp_sensitivity_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.temp_sensitivity = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_temp_detection_interval_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.temp_detection_interval = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_scale_of_pump_on_time_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.scale_of_pump_on_time = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_lvl_2_pump_on_time_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.lvl_2_pump_on_time = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_lvl_2_pump_off_time_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.lvl_2_pump_off_time = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_lvl_3_pump_on_time_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.lvl_3_pump_on_time = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_lvl_3_pump_off_time_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.lvl_3_pump_off_time = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
-
-    def on_expected_low_battery_thold_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.low_battery_thold = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
+    def on_show_hide_telemetry_chart_shortcut_activated(self):
+        if not self.telemetry_chart_widget:
+            return
+        if self.telemetry_chart_widget.isVisible():
+            self.telemetry_chart_widget.hide()
+            return
+        self.telemetry_chart_widget.show()
+        self.telemetry_chart_widget.raise_()
 
-    def on_expected_lost_alarm_interval_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.lost_alarm_interval = changed_text
-        self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
-        self.send_profile_push_button.setEnabled(
-            self.main_window_model.is_profile_valid() and self.main_window_model.connected)
+    def on_show_hide_latency_diagnostics_shortcut_activated(self):
+        if not self.latency_diagnostics_widget:
+            return
+        if self.latency_diagnostics_widget.isVisible():
+            self.latency_diagnostics_widget.hide()
+            return
+        self.latency_diagnostics_widget.show()
+        self.latency_diagnostics_widget.raise_()
 
-    def on_expected_heartbeat_interval_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.heartbeat_interval = changed_text
+    def on_profile_name_line_edit_text_changed(self, changed_text: str):
+        self.main_window_model.profile.name = changed_text
         self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
         self.send_profile_push_button.setEnabled(
             self.main_window_model.is_profile_valid() and self.main_window_model.connected)
 
-    def on_expected_setup_duration_line_edit_text_changed(self, changed_text: str):
-        self.main_window_model.profile.setup_duration = changed_text
+    def on_expected_line_edit_text_changed(self, name: str, changed_text: str):
+        setattr(self.main_window_model.profile, name, changed_text)
         self.save_profile_push_button.setEnabled(self.main_window_model.is_profile_valid())
         self.send_profile_push_button.setEnabled(
             self.main_window_model.is_profile_valid() and self.main_window_model.connected)
@@ -431,10 +390,10 @@ class QMainWindowExt(QMainWindow):
             self, selected: QListWidgetItem, deselected: QListWidgetItem) -> None:
         if self.command_list_widget.currentRow() < 0:
             return
-        self.main_window_model.command = self.main_window_model.commands[self.command_list_widget.currentRow()]
+        self.main_window_model.select_command(self.command_list_widget.currentRow())
 
     def on_command_list_widget_item_clicked(self, item: QListWidgetItem):
-        self.main_window_model.command = self.main_window_model.commands[self.command_list_widget.currentRow()]
+        self.main_window_model.select_command(self.command_list_widget.currentRow())
 
     def on_command_model_changed(self, command: Optional[sdk.Command]) -> None:
         if not command:
@@ -443,58 +402,56 @@ class QMainWindowExt(QMainWindow):
         self.command_line_edit.setText(command.command)
 
     def on_receive_serial_line(self, line: str):
-        self.terminal_plain_text_edit.moveCursor(QTextCursor.End)
-        self.terminal_plain_text_edit.insertPlainText(f"{line if line else datetime.datetime.now().isoformat()}\n")
-        self.received_form.terminal_plain_text_edit.moveCursor(QTextCursor.End)
-        self.received_form.terminal_plain_text_edit.insertPlainText(
-            f"{line if line else datetime.datetime.now().isoformat()}\n")
-
-        data: Optional[Union[sdk.FreezeDripSerialData, sdk.FreezeDripSerialResponse]] = \
-            self.serial_parser.parse_line(line)
-
-        if isinstance(data, sdk.FreezeDripSerialData):
-            if data.status:
-                self.status_code_line_edit.setText(data.status)
-            if data.temp:
-                self.temp_line_edit.setText(str(float(data.temp)))
-            if data.rts_battery_volt:
-                self.rts_bat_volt_line_edit.setText(data.rts_battery_volt)
-            if data.cd_battery_volt:
-                self.cd_bat_volt_line_edit.setText(data.cd_battery_volt)
-            if data.heartbeat_flag:
-                self.heartbeat_flag_line_edit.setText(data.heartbeat_flag)
-            if data.low_temp_flag:
-                self.low_temp_flag_line_edit.setText(data.low_temp_flag)
-            if data.low_bat_flag:
-                self.low_bat_flag_line_edit.setText(data.low_bat_flag)
-            if data.setup_flag:
-                self.setup_flag_line_edit.setText(data.setup_flag)
-            if data.temp_lvl_2_thold:
-                self.current_temp_lvl_2_thold_line_edit.setText(str(float(data.temp_lvl_2_thold)))
-            if data.temp_lvl_3_thold:
-                self.current_temp_lvl_3_thold_line_edit.setText(str(float(data.temp_lvl_3_thold)))
-            if data.temp_lvl_4_thold:
-                self.current_temp_lvl_4_thold_line_edit.setText(str(float(data.temp_lvl_4_thold)))
-            if data.temp_sensitivity:
-                self.current_temp_sensitivity_line_edit.setText(str(float(data.temp_sensitivity)))
-            if data.temp_detection_interval:
-                self.current_temp_detection_interval_line_edit.setText(str(int(data.temp_detection_interval)))
-            if data.scale_of_pump_on_time:
-                self.current_scale_of_pump_on_time_line_edit.setText(str(float(data.scale_of_pump_on_time)))
-            if data.lvl_2_pump_on_time:
-                self.current_lvl_2_pump_on_time_line_edit.setText(str(int(data.lvl_2_pump_on_time)))
-            if data.lvl_2_pump_off_time:
-                self.current_lvl_2_pump_off_time_line_edit.setText(str(int(data.lvl_2_pump_off_time)))
-            if data.lvl_3_pump_on_time:
-                self.current_lvl_3_pump_on_time_line_edit.setText(str(int(data.lvl_3_pump_on_time)))
-            if data.lvl_3_pump_off_time:
-                self.current_lvl_3_pump_off_time_line_edit.setText(str(int(data.lvl_3_pump_off_time)))
-            if data.low_battery_thold:
-                self.current_low_battery_thold_line_edit.setText(str(float(data.low_battery_thold)))
-            if data.lost_alarm_interval:
-                self.current_lost_alarm_interval_line_edit.setText(str(int(data.lost_alarm_interval)))
-            if data.heartbeat_interval:
-                self.current_heartbeat_interval_line_edit.setText(str(int(data.heartbeat_interval)))
-            if data.setup_duration:
-                self.current_setup_duration_line_edit.setText(str(int(data.setup_duration)))
-            self.updated_at_line_edit.setText(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        self.on_receive_serial_lines([line])
+
+    def on_receive_serial_lines(self, lines: list[str]):
+        delivered_ns: int = time.monotonic_ns()
+        if isinstance(lines, sdk.StampedLines):
+            self.latency.record('signal', lines.emitted_ns, delivered_ns)
+        now: str = datetime.datetime.now().isoformat()
+        line: str
+        text: str = self.terminal_model.append([line if line else now for line in lines])
+        self.terminal_plain_text_edit.append_text(text)
+        self.received_form.terminal_plain_text_edit.append_text(text)
+        appended_ns: int = self.latency.record('terminal', delivered_ns)
+
+        data: Optional[sdk.FreezeDripSerialData]
+        data, _ = self.serial_parser.parse_lines(lines)
+        parsed_ns: int = self.latency.record('parse', appended_ns)
+        if data:
+            self.on_receive_serial_data(data)
+            updated_ns: int = self.latency.record('widgets', parsed_ns)
+            if isinstance(lines, sdk.StampedLines):
+                self.latency.record('total', lines.read_ns, updated_ns)
+
+    def on_receive_serial_data(self, data: sdk.FreezeDripSerialData):
+        reading: Optional[sdk.TelemetryReading] = sdk.TelemetryReading.from_data(
+            self.serial.port_name, data, self.serial_parser) if self.serial else None
+        if reading and self.telemetry:
+            self.telemetry.append(reading)
+        if reading and self.telemetry_chart_model and self.telemetry_chart_model.append(reading):
+            self.telemetry_chart_widget.refresh()
+        # Only line edits whose text changes are touched; Qt paints all of them in the next paint event
+        name: str
+        line_edit: QLineEdit
+        kind: type
+        value: Optional[str]
+        text: str
+        for name, line_edit, kind in self.status_bindings:
+            value = getattr(data, name)
+            if not value:
+                continue
+            text = str(kind(value))
+            if line_edit.text() != text:
+                line_edit.setText(text)
+        for name, line_edit, _, kind in self.profile_bindings:
+            value = getattr(data, name)
+            if not value:
+                continue
+            text = str(kind(value))
+            if line_edit.text() != text:
+                line_edit.setText(text)
+        second: int = int(time.time())
+        if second != self.updated_at_second:
+            self.updated_at_second = second
+            self.updated_at_line_edit.setText(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
@@ -0,0 +1,72 @@
+from typing import Optional
+
+from PySide6.QtGui import QContextMenuEvent, QTextCursor
+from PySide6.QtWidgets import QMenu, QPlainTextEdit
+
+from .. import ui_model
+
+
+class QScrollbackPlainTextEdit(QPlainTextEdit):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.terminal_model: Optional[ui_model.TerminalModel] = None
+        self.line_cap: int = 0
+        self.first_line: Optional[int] = None
+
+    def setup(self, terminal_model: ui_model.TerminalModel, line_cap: int) -> None:
+        self.terminal_model = terminal_model
+        self.line_cap = line_cap
+        self.setMaximumBlockCount(line_cap + 1 if line_cap > 0 else 0)
+
+    def is_live(self) -> bool:
+        return self.first_line is None
+
+    def append_text(self, text: str) -> None:
+        if not self.is_live():
+            return
+        self.moveCursor(QTextCursor.End)
+        self.insertPlainText(text)
+
+    def clear_scrollback(self) -> None:
+        self.first_line = None
+        self.setPlainText("")
+
+    def _show_lines(self, first_line: int) -> None:
+        self.first_line = first_line
+        self.setPlainText(self.terminal_model.read(first_line, self.line_cap))
+        self.moveCursor(QTextCursor.Start)
+
+    def _page_size(self) -> int:
+        return max(1, self.line_cap // 2)
+
+    def _live_first_line(self) -> int:
+        return max(0, self.terminal_model.line_count - self.line_cap)
+
+    def page_older(self) -> None:
+        first_line: int = self._live_first_line() if self.is_live() else self.first_line
+        self._show_lines(max(0, first_line - self._page_size()))
+
+    def page_newer(self) -> None:
+        if self.is_live():
+            return
+        first_line: int = self.first_line + self._page_size()
+        if first_line >= self._live_first_line():
+            self.page_live()
+            return
+        self._show_lines(first_line)
+
+    def page_live(self) -> None:
+        self.first_line = None
+        self.setPlainText(self.terminal_model.read(self._live_first_line(), self.line_cap))
+        self.moveCursor(QTextCursor.End)
+
+    def contextMenuEvent(self, event: QContextMenuEvent) -> None:
+        menu: QMenu = self.createStandardContextMenu()
+        if self.terminal_model and self.line_cap > 0:
+            menu.addSeparator()
+            menu.addAction("Load Older Lines", self.page_older).setEnabled(
+                (self._live_first_line() if self.is_live() else self.first_line) > 0)
+            menu.addAction("Load Newer Lines", self.page_newer).setEnabled(not self.is_live())
+            menu.addAction("Back to Live", self.page_live).setEnabled(not self.is_live())
+        menu.exec_(event.globalPos())
+        menu.deleteLater()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
+from PySide6.QtCore import QPointF, QRectF, Qt, QTimer
+from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPen, QPolygonF
+from PySide6.QtWidgets import QWidget
+
+from .. import ui_model
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class QTelemetryChartWidget(QWidget):
+    PANELS: tuple[tuple[str, tuple[tuple[str, str, str], ...]], ...] = (
+        ("Temperature (°F)", (('temp', "Temp", '#d62728'),)),
+        ("Battery (V)", (('cd_battery_volt', "CD", '#1f77b4'), ('rts_battery_volt', "RTS", '#2ca02c'))),
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.telemetry_chart_model: Optional[ui_model.TelemetryChartModel] = None
+        self.margin: int = 8
+        self.refresh_interval: int = 100
+        self._refresh_timer: QTimer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.update)
+        self.setMinimumSize(320, 240)
+
+    def setup(self, telemetry_chart_model: ui_model.TelemetryChartModel) -> None:
+        self.telemetry_chart_model = telemetry_chart_model
+
+    def refresh(self) -> None:
+        # Bursts of readings are drawn at most once per refresh interval, and not at all while hidden
+        if self.isVisible() and not self._refresh_timer.isActive():
+            self._refresh_timer.start(self.refresh_interval)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter: QPainter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().base())
+        span: Optional[tuple[float, float]] = self.telemetry_chart_model.span() if self.telemetry_chart_model else None
+        panel_height: float = (self.height() - self.margin) / len(self.PANELS)
+        i: int
+        title: str
+        series: tuple[tuple[str, str, str], ...]
+        for i, (title, series) in enumerate(self.PANELS):
+            rect: QRectF = QRectF(
+                self.margin, self.margin + i * panel_height,
+                self.width() - self.margin * 2, panel_height - self.margin)
+            self._paint_panel(painter, rect, title, series, span)
+        painter.end()
+
+    def _paint_panel(
+            self,
+            painter: QPainter,
+            rect: QRectF,
+            title: str,
+            series: tuple[tuple[str, str, str], ...],
+            span: Optional[tuple[float, float]]) -> None:
+        painter.setPen(QPen(self.palette().mid().color()))
+        painter.drawRect(rect)
+        painter.setPen(QPen(self.palette().text().color()))
+        painter.drawText(rect.adjusted(4, 2, -4, -2), Qt.AlignLeft | Qt.AlignTop, title)
+        if not span or rect.width() < 1 or rect.height() < 1:
+            return
+
+        width: int = int(rect.width())
+        lines: list[tuple[numpy.ndarray, numpy.ndarray, str]] = list()
+        name: str
+        color: str
+        for name, _, color in series:
+            times: numpy.ndarray
+            values: numpy.ndarray
+            times, values = self.telemetry_chart_model.series[name].decimate(width, *span)
+            if len(times):
+                lines.append((times, values, color))
+        if not lines:
+            return
+
+        times_values: tuple[numpy.ndarray, numpy.ndarray, str]
+        low: float = min(float(times_values[1].min()) for times_values in lines)
+        high: float = max(float(times_values[1].max()) for times_values in lines)
+        if high - low < 0.1:
+            low, high = low - 0.5, high + 0.5
+        painter.drawText(rect.adjusted(4, 2, -4, -2), Qt.AlignRight | Qt.AlignTop, f"{high:g}")
+        painter.drawText(rect.adjusted(4, 2, -4, -2), Qt.AlignRight | Qt.AlignBottom, f"{low:g}")
+        label: str
+        legend_left: float = rect.left() + 4
+        for _, label, color in series:
+            painter.setPen(QPen(QColor(color)))
+            painter.drawText(
+                QRectF(legend_left, rect.top(), rect.width(), rect.height() - 2), Qt.AlignLeft | Qt.AlignBottom, label)
+            legend_left += painter.fontMetrics().horizontalAdvance(f"{label}  ")
+
+        xs: numpy.ndarray
+        ys: numpy.ndarray
+        x_scale: float = rect.width() / max(span[1] - span[0], 1e-9)
+        y_scale: float = rect.height() / (high - low)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        for times, values, color in lines:
+            xs = rect.left() + (times - span[0]) * x_scale
+            ys = rect.bottom() - (values - low) * y_scale
+            x: float
+            y: float
+            painter.setPen(QPen(QColor(color), 1))
+            painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
@@ -0,0 +1,1179 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.6.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGridLayout, QGroupBox, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QPushButton,
+    QSizePolicy, QWidget)
+
+from desktop.ui.main_window import QMainWindowExt
+from desktop.ui.popup_hookable_combox import QPopupHookableComboBox
+from desktop.ui.scrollback_plain_text_edit import QScrollbackPlainTextEdit
+from desktop.ui.select_all_on_focus_line_edit import QSelectAllOnFocusLineEdit
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1400, 744)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        font = QFont()
+        font.setPointSize(10)
+        MainWindow.setFont(font)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.gridLayout = QGridLayout(self.centralwidget)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.groupBox_5 = QGroupBox(self.centralwidget)
+        self.groupBox_5.setObjectName(u"groupBox_5")
+        self.groupBox_5.setFont(font)
+        self.gridLayout_3 = QGridLayout(self.groupBox_5)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.gridLayout_2 = QGridLayout()
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.label_5 = QLabel(self.groupBox_5)
+        self.label_5.setObjectName(u"label_5")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
+        self.label_5.setSizePolicy(sizePolicy1)
+        self.label_5.setMinimumSize(QSize(140, 14))
+
+        self.gridLayout_2.addWidget(self.label_5, 4, 0, 1, 1)
+
+        self.label_39 = QLabel(self.groupBox_5)
+        self.label_39.setObjectName(u"label_39")
+        sizePolicy1.setHeightForWidth(self.label_39.sizePolicy().hasHeightForWidth())
+        self.label_39.setSizePolicy(sizePolicy1)
+        self.label_39.setMinimumSize(QSize(140, 14))
+
+        self.gridLayout_2.addWidget(self.label_39, 4, 1, 1, 1)
+
+        self.status_code_line_edit = QLineEdit(self.groupBox_5)
+        self.status_code_line_edit.setObjectName(u"status_code_line_edit")
+        self.status_code_line_edit.setEnabled(False)
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Minimum)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.status_code_line_edit.sizePolicy().hasHeightForWidth())
+        self.status_code_line_edit.setSizePolicy(sizePolicy2)
+        self.status_code_line_edit.setMinimumSize(QSize(0, 26))
+        font1 = QFont()
+        font1.setPointSize(11)
+        self.status_code_line_edit.setFont(font1)
+        self.status_code_line_edit.setReadOnly(True)
+
+        self.gridLayout_2.addWidget(self.status_code_line_edit, 1, 0, 1, 1)
+
+        self.low_bat_flag_line_edit = QLineEdit(self.groupBox_5)
+        self.low_bat_flag_line_edit.setObjectName(u"low_bat_flag_line_edit")
+        self.low_bat_flag_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.low_bat_flag_line_edit.sizePolicy().hasHeightForWidth())
+        self.low_bat_flag_line_edit.setSizePolicy(sizePolicy2)
+        self.low_bat_flag_line_edit.setMinimumSize(QSize(0, 26))
+        self.low_bat_flag_line_edit.setFont(font1)
+        self.low_bat_flag_line_edit.setReadOnly(True)
+
+        self.gridLayout_2.addWidget(self.low_bat_flag_line_edit, 5, 1, 1, 1)
+
+        self.label_41 = QLabel(self.groupBox_5)
+        self.label_41.setObjectName(u"label_41")
+        sizePolicy1.setHeightForWidth(self.label_41.sizePolicy().hasHeightForWidth())
+        self.label_41.setSizePolicy(sizePolicy1)
+        self.label_41.setMinimumSize(QSize(140, 14))
+
+        self.gridLayout_2.addWidget(self.label_41, 0, 0, 1, 1)
+
+        self.label_29 = QLabel(self.groupBox_5)
+        self.label_29.setObjectName(u"label_29")
+        sizePolicy1.setHeightForWidth(self.label_29.sizePolicy().hasHeightForWidth())
+        self.label_29.setSizePolicy(sizePolicy1)
+        self.label_29.setMinimumSize(QSize(140, 14))
+
+        self.gridLayout_2.addWidget(self.label_29, 6, 0, 1, 1)
+
+        self.label_17 = QLabel(self.groupBox_5)
+        self.label_17.setObjectName(u"label_17")
+        sizePolicy1.setHeightForWidth(self.label_17.sizePolicy().hasHeightForWidth())
+        self.label_17.setSizePolicy(sizePolicy1)
+        self.label_17.setMinimumSize(QSize(140, 14))
+
+        self.gridLayout_2.addWidget(self.label_17, 0, 1, 1, 1)
+
+        self.label_35 = QLabel(self.groupBox_5)
+        self.label_35.setObjectName(u"label_35")
+        sizePolicy1.setHeightForWidth(self.label_35.sizePolicy().hasHeightForWidth())
+        self.label_35.setSizePolicy(sizePolicy1)
+        self.label_35.setMinimumSize(QSize(140, 14))
+
+        self.gridLayout_2.addWidget(self.label_35, 2, 1, 1, 1)
+
+        self.cd_bat_volt_line_edit = QLineEdit(self.groupBox_5)
+        self.cd_bat_volt_line_edit.setObjectName(u"cd_bat_volt_line_edit")
+        self.cd_bat_volt_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.cd_bat_volt_line_edit.sizePolicy().hasHeightForWidth())
+        self.cd_bat_volt_line_edit.setSizePolicy(sizePolicy2)
+        self.cd_bat_volt_line_edit.setMinimumSize(QSize(0, 26))
+        self.cd_bat_volt_line_edit.setFont(font1)
+        self.cd_bat_volt_line_edit.setReadOnly(True)
+
+        self.gridLayout_2.addWidget(self.cd_bat_volt_line_edit, 7, 0, 1, 1)
+
+        self.low_temp_flag_line_edit = QLineEdit(self.groupBox_5)
+        self.low_temp_flag_line_edit.setObjectName(u"low_temp_flag_line_edit")
+        self.low_temp_flag_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.low_temp_flag_line_edit.sizePolicy().hasHeightForWidth())
+        self.low_temp_flag_line_edit.setSizePolicy(sizePolicy2)
+        self.low_temp_flag_line_edit.setMinimumSize(QSize(0, 26))
+        self.low_temp_flag_line_edit.setFont(font1)
+        self.low_temp_flag_line_edit.setReadOnly(True)
+
+        self.gridLayout_2.addWidget(self.low_temp_flag_line_edit, 3, 1, 1, 1)
+
+        self.rts_bat_volt_line_edit = QLineEdit(self.groupBox_5)
+        self.rts_bat_volt_line_edit.setObjectName(u"rts_bat_volt_line_edit")
+        self.rts_bat_volt_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.rts_bat_volt_line_edit.sizePolicy().hasHeightForWidth())
+        self.rts_bat_volt_line_edit.setSizePolicy(sizePolicy2)
+        self.rts_bat_volt_line_edit.setMinimumSize(QSize(0, 26))
+        self.rts_bat_volt_line_edit.setFont(font1)
+        self.rts_bat_volt_line_edit.setReadOnly(True)
+
+        self.gridLayout_2.addWidget(self.rts_bat_volt_line_edit, 5, 0, 1, 1)
+
+        self.temp_line_edit = QLineEdit(self.groupBox_5)
+        self.temp_line_edit.setObjectName(u"temp_line_edit")
+        self.temp_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.temp_line_edit.sizePolicy().hasHeightForWidth())
+        self.temp_line_edit.setSizePolicy(sizePolicy2)
+        self.temp_line_edit.setMinimumSize(QSize(0, 26))
+        self.temp_line_edit.setFont(font1)
+        self.temp_line_edit.setReadOnly(True)
+
+        self.gridLayout_2.addWidget(self.temp_line_edit, 3, 0, 1, 1)
+
+        self.setup_flag_line_edit = QLineEdit(self.groupBox_5)
+        self.setup_flag_line_edit.setObjectName(u"setup_flag_line_edit")
+        self.setup_flag_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.setup_flag_line_edit.sizePolicy().hasHeightForWidth())
+        self.setup_flag_line_edit.setSizePolicy(sizePolicy2)
+        self.setup_flag_line_edit.setMinimumSize(QSize(0, 26))
+        self.setup_flag_line_edit.setFont(font1)
+        self.setup_flag_line_edit.setReadOnly(True)
+
+        self.gridLayout_2.addWidget(self.setup_flag_line_edit, 7, 1, 1, 1)
+
+        self.heartbeat_flag_line_edit = QLineEdit(self.groupBox_5)
+        self.heartbeat_flag_line_edit.setObjectName(u"heartbeat_flag_line_edit")
+        self.heartbeat_flag_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.heartbeat_flag_line_edit.sizePolicy().hasHeightForWidth())
+        self.heartbeat_flag_line_edit.setSizePolicy(sizePolicy2)
+        self.heartbeat_flag_line_edit.setMinimumSize(QSize(0, 26))
+        self.heartbeat_flag_line_edit.setFont(font1)
+        self.heartbeat_flag_line_edit.setReadOnly(True)
+
+        self.gridLayout_2.addWidget(self.heartbeat_flag_line_edit, 1, 1, 1, 1)
+
+        self.label_40 = QLabel(self.groupBox_5)
+        self.label_40.setObjectName(u"label_40")
+        sizePolicy1.setHeightForWidth(self.label_40.sizePolicy().hasHeightForWidth())
+        self.label_40.setSizePolicy(sizePolicy1)
+        self.label_40.setMinimumSize(QSize(140, 14))
+
+        self.gridLayout_2.addWidget(self.label_40, 6, 1, 1, 1)
+
+        self.label_42 = QLabel(self.groupBox_5)
+        self.label_42.setObjectName(u"label_42")
+        sizePolicy1.setHeightForWidth(self.label_42.sizePolicy().hasHeightForWidth())
+        self.label_42.setSizePolicy(sizePolicy1)
+        self.label_42.setMinimumSize(QSize(140, 14))
+
+        self.gridLayout_2.addWidget(self.label_42, 2, 0, 1, 1)
+
+
+        self.gridLayout_3.addLayout(self.gridLayout_2, 0, 0, 1, 1)
+
+
+        self.gridLayout.addWidget(self.groupBox_5, 1, 0, 3, 1)
+
+        self.groupBox = QGroupBox(self.centralwidget)
+        self.groupBox.setObjectName(u"groupBox")
+        self.groupBox.setFont(font)
+        self.gridLayout_6 = QGridLayout(self.groupBox)
+        self.gridLayout_6.setObjectName(u"gridLayout_6")
+        self.label_18 = QLabel(self.groupBox)
+        self.label_18.setObjectName(u"label_18")
+        sizePolicy2.setHeightForWidth(self.label_18.sizePolicy().hasHeightForWidth())
+        self.label_18.setSizePolicy(sizePolicy2)
+        self.label_18.setMinimumSize(QSize(0, 14))
+        self.label_18.setFont(font)
+
+        self.gridLayout_6.addWidget(self.label_18, 1, 2, 1, 1)
+
+        self.port_connect_push_button = QPushButton(self.groupBox)
+        self.port_connect_push_button.setObjectName(u"port_connect_push_button")
+        self.port_connect_push_button.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.port_connect_push_button.sizePolicy().hasHeightForWidth())
+        self.port_connect_push_button.setSizePolicy(sizePolicy2)
+        self.port_connect_push_button.setMinimumSize(QSize(0, 40))
+        font2 = QFont()
+        font2.setPointSize(11)
+        font2.setBold(True)
+        self.port_connect_push_button.setFont(font2)
+
+        self.gridLayout_6.addWidget(self.port_connect_push_button, 1, 6, 1, 3)
+
+        self.port_disconnect_push_button = QPushButton(self.groupBox)
+        self.port_disconnect_push_button.setObjectName(u"port_disconnect_push_button")
+        self.port_disconnect_push_button.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.port_disconnect_push_button.sizePolicy().hasHeightForWidth())
+        self.port_disconnect_push_button.setSizePolicy(sizePolicy2)
+        self.port_disconnect_push_button.setMinimumSize(QSize(0, 40))
+        self.port_disconnect_push_button.setFont(font2)
+
+        self.gridLayout_6.addWidget(self.port_disconnect_push_button, 1, 9, 1, 3)
+
+        self.port_popup_hookable_combo_box = QPopupHookableComboBox(self.groupBox)
+        self.port_popup_hookable_combo_box.setObjectName(u"port_popup_hookable_combo_box")
+        sizePolicy2.setHeightForWidth(self.port_popup_hookable_combo_box.sizePolicy().hasHeightForWidth())
+        self.port_popup_hookable_combo_box.setSizePolicy(sizePolicy2)
+        self.port_popup_hookable_combo_box.setMinimumSize(QSize(0, 28))
+        self.port_popup_hookable_combo_box.setFont(font1)
+
+        self.gridLayout_6.addWidget(self.port_popup_hookable_combo_box, 1, 4, 1, 2)
+
+
+        self.gridLayout.addWidget(self.groupBox, 0, 1, 1, 6)
+
+        self.groupBox_2 = QGroupBox(self.centralwidget)
+        self.groupBox_2.setObjectName(u"groupBox_2")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.groupBox_2.sizePolicy().hasHeightForWidth())
+        self.groupBox_2.setSizePolicy(sizePolicy3)
+        self.groupBox_2.setFont(font)
+        self.gridLayout_9 = QGridLayout(self.groupBox_2)
+        self.gridLayout_9.setObjectName(u"gridLayout_9")
+        self.add_profile_push_button = QPushButton(self.groupBox_2)
+        self.add_profile_push_button.setObjectName(u"add_profile_push_button")
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(0)
+        sizePolicy4.setHeightForWidth(self.add_profile_push_button.sizePolicy().hasHeightForWidth())
+        self.add_profile_push_button.setSizePolicy(sizePolicy4)
+
+        self.gridLayout_9.addWidget(self.add_profile_push_button, 5, 2, 1, 1)
+
+        self.remove_profile_push_button = QPushButton(self.groupBox_2)
+        self.remove_profile_push_button.setObjectName(u"remove_profile_push_button")
+        sizePolicy4.setHeightForWidth(self.remove_profile_push_button.sizePolicy().hasHeightForWidth())
+        self.remove_profile_push_button.setSizePolicy(sizePolicy4)
+
+        self.gridLayout_9.addWidget(self.remove_profile_push_button, 5, 1, 1, 1)
+
+        self.profile_list_widget = QListWidget(self.groupBox_2)
+        self.profile_list_widget.setObjectName(u"profile_list_widget")
+        sizePolicy4.setHeightForWidth(self.profile_list_widget.sizePolicy().hasHeightForWidth())
+        self.profile_list_widget.setSizePolicy(sizePolicy4)
+        self.profile_list_widget.setFont(font1)
+
+        self.gridLayout_9.addWidget(self.profile_list_widget, 0, 1, 4, 2)
+
+
+        self.gridLayout.addWidget(self.groupBox_2, 5, 0, 3, 1)
+
+        self.label_20 = QLabel(self.centralwidget)
+        self.label_20.setObjectName(u"label_20")
+        self.label_20.setMinimumSize(QSize(0, 0))
+        font3 = QFont()
+        font3.setPointSize(24)
+        font3.setBold(True)
+        self.label_20.setFont(font3)
+        self.label_20.setAlignment(Qt.AlignCenter)
+        self.label_20.setWordWrap(True)
+
+        self.gridLayout.addWidget(self.label_20, 0, 0, 1, 1)
+
+        self.groupBox_4 = QGroupBox(self.centralwidget)
+        self.groupBox_4.setObjectName(u"groupBox_4")
+        self.groupBox_4.setFont(font)
+        self.gridLayout_12 = QGridLayout(self.groupBox_4)
+        self.gridLayout_12.setObjectName(u"gridLayout_12")
+        self.gridLayout_11 = QGridLayout()
+        self.gridLayout_11.setObjectName(u"gridLayout_11")
+        self.label = QLabel(self.groupBox_4)
+        self.label.setObjectName(u"label")
+        sizePolicy2.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy2)
+        self.label.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_11.addWidget(self.label, 0, 0, 1, 2)
+
+        self.label_3 = QLabel(self.groupBox_4)
+        self.label_3.setObjectName(u"label_3")
+        sizePolicy1.setHeightForWidth(self.label_3.sizePolicy().hasHeightForWidth())
+        self.label_3.setSizePolicy(sizePolicy1)
+        self.label_3.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_3, 4, 0, 1, 1)
+
+        self.label_4 = QLabel(self.groupBox_4)
+        self.label_4.setObjectName(u"label_4")
+        sizePolicy1.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
+        self.label_4.setSizePolicy(sizePolicy1)
+        self.label_4.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_4, 6, 0, 1, 1)
+
+        self.expected_lvl_2_pump_off_time_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_lvl_2_pump_off_time_line_edit.setObjectName(u"expected_lvl_2_pump_off_time_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_lvl_2_pump_off_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_lvl_2_pump_off_time_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_lvl_2_pump_off_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_lvl_2_pump_off_time_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_lvl_2_pump_off_time_line_edit, 3, 2, 1, 1)
+
+        self.label_14 = QLabel(self.groupBox_4)
+        self.label_14.setObjectName(u"label_14")
+        sizePolicy1.setHeightForWidth(self.label_14.sizePolicy().hasHeightForWidth())
+        self.label_14.setSizePolicy(sizePolicy1)
+        self.label_14.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_14, 2, 3, 1, 1)
+
+        self.label_16 = QLabel(self.groupBox_4)
+        self.label_16.setObjectName(u"label_16")
+        sizePolicy1.setHeightForWidth(self.label_16.sizePolicy().hasHeightForWidth())
+        self.label_16.setSizePolicy(sizePolicy1)
+        self.label_16.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_16, 6, 3, 1, 1)
+
+        self.expected_temp_lvl_3_thold_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_temp_lvl_3_thold_line_edit.setObjectName(u"expected_temp_lvl_3_thold_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_temp_lvl_3_thold_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_temp_lvl_3_thold_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_temp_lvl_3_thold_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_temp_lvl_3_thold_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_temp_lvl_3_thold_line_edit, 5, 0, 1, 1)
+
+        self.expected_lvl_2_pump_on_time_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_lvl_2_pump_on_time_line_edit.setObjectName(u"expected_lvl_2_pump_on_time_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_lvl_2_pump_on_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_lvl_2_pump_on_time_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_lvl_2_pump_on_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_lvl_2_pump_on_time_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_lvl_2_pump_on_time_line_edit, 1, 2, 1, 1)
+
+        self.expected_temp_sensitivity_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_temp_sensitivity_line_edit.setObjectName(u"expected_temp_sensitivity_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_temp_sensitivity_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_temp_sensitivity_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_temp_sensitivity_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_temp_sensitivity_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_temp_sensitivity_line_edit, 3, 1, 1, 1)
+
+        self.label_15 = QLabel(self.groupBox_4)
+        self.label_15.setObjectName(u"label_15")
+        sizePolicy1.setHeightForWidth(self.label_15.sizePolicy().hasHeightForWidth())
+        self.label_15.setSizePolicy(sizePolicy1)
+        self.label_15.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_15, 4, 3, 1, 1)
+
+        self.expected_lvl_3_pump_on_time_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_lvl_3_pump_on_time_line_edit.setObjectName(u"expected_lvl_3_pump_on_time_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_lvl_3_pump_on_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_lvl_3_pump_on_time_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_lvl_3_pump_on_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_lvl_3_pump_on_time_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_lvl_3_pump_on_time_line_edit, 5, 2, 1, 1)
+
+        self.label_2 = QLabel(self.groupBox_4)
+        self.label_2.setObjectName(u"label_2")
+        sizePolicy1.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy1)
+        self.label_2.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_2, 2, 0, 1, 1)
+
+        self.expected_temp_detection_interval_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_temp_detection_interval_line_edit.setObjectName(u"expected_temp_detection_interval_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_temp_detection_interval_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_temp_detection_interval_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_temp_detection_interval_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_temp_detection_interval_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_temp_detection_interval_line_edit, 5, 1, 1, 1)
+
+        self.expected_scale_of_pump_on_time_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_scale_of_pump_on_time_line_edit.setObjectName(u"expected_scale_of_pump_on_time_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_scale_of_pump_on_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_scale_of_pump_on_time_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_scale_of_pump_on_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_scale_of_pump_on_time_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_scale_of_pump_on_time_line_edit, 7, 1, 1, 1)
+
+        self.label_11 = QLabel(self.groupBox_4)
+        self.label_11.setObjectName(u"label_11")
+        sizePolicy1.setHeightForWidth(self.label_11.sizePolicy().hasHeightForWidth())
+        self.label_11.setSizePolicy(sizePolicy1)
+        self.label_11.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_11, 4, 2, 1, 1)
+
+        self.label_7 = QLabel(self.groupBox_4)
+        self.label_7.setObjectName(u"label_7")
+        sizePolicy1.setHeightForWidth(self.label_7.sizePolicy().hasHeightForWidth())
+        self.label_7.setSizePolicy(sizePolicy1)
+        self.label_7.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_7, 4, 1, 1, 1)
+
+        self.expected_temp_lvl_2_thold_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_temp_lvl_2_thold_line_edit.setObjectName(u"expected_temp_lvl_2_thold_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_temp_lvl_2_thold_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_temp_lvl_2_thold_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_temp_lvl_2_thold_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_temp_lvl_2_thold_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_temp_lvl_2_thold_line_edit, 3, 0, 1, 1)
+
+        self.label_12 = QLabel(self.groupBox_4)
+        self.label_12.setObjectName(u"label_12")
+        sizePolicy1.setHeightForWidth(self.label_12.sizePolicy().hasHeightForWidth())
+        self.label_12.setSizePolicy(sizePolicy1)
+        self.label_12.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_12, 6, 2, 1, 1)
+
+        self.profile_name_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.profile_name_line_edit.setObjectName(u"profile_name_line_edit")
+        sizePolicy2.setHeightForWidth(self.profile_name_line_edit.sizePolicy().hasHeightForWidth())
+        self.profile_name_line_edit.setSizePolicy(sizePolicy2)
+        self.profile_name_line_edit.setMinimumSize(QSize(0, 26))
+        self.profile_name_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.profile_name_line_edit, 1, 0, 1, 2)
+
+        self.expected_low_battery_thold_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_low_battery_thold_line_edit.setObjectName(u"expected_low_battery_thold_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_low_battery_thold_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_low_battery_thold_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_low_battery_thold_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_low_battery_thold_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_low_battery_thold_line_edit, 1, 3, 1, 1)
+
+        self.expected_temp_lvl_4_thold_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_temp_lvl_4_thold_line_edit.setObjectName(u"expected_temp_lvl_4_thold_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_temp_lvl_4_thold_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_temp_lvl_4_thold_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_temp_lvl_4_thold_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_temp_lvl_4_thold_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_temp_lvl_4_thold_line_edit, 7, 0, 1, 1)
+
+        self.label_6 = QLabel(self.groupBox_4)
+        self.label_6.setObjectName(u"label_6")
+        sizePolicy1.setHeightForWidth(self.label_6.sizePolicy().hasHeightForWidth())
+        self.label_6.setSizePolicy(sizePolicy1)
+        self.label_6.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_6, 2, 1, 1, 1)
+
+        self.label_9 = QLabel(self.groupBox_4)
+        self.label_9.setObjectName(u"label_9")
+        sizePolicy1.setHeightForWidth(self.label_9.sizePolicy().hasHeightForWidth())
+        self.label_9.setSizePolicy(sizePolicy1)
+        self.label_9.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_9, 0, 2, 1, 1)
+
+        self.expected_setup_duration_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_setup_duration_line_edit.setObjectName(u"expected_setup_duration_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_setup_duration_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_setup_duration_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_setup_duration_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_setup_duration_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_setup_duration_line_edit, 7, 3, 1, 1)
+
+        self.label_8 = QLabel(self.groupBox_4)
+        self.label_8.setObjectName(u"label_8")
+        sizePolicy1.setHeightForWidth(self.label_8.sizePolicy().hasHeightForWidth())
+        self.label_8.setSizePolicy(sizePolicy1)
+        self.label_8.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_8, 6, 1, 1, 1)
+
+        self.expected_lvl_3_pump_off_time_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_lvl_3_pump_off_time_line_edit.setObjectName(u"expected_lvl_3_pump_off_time_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_lvl_3_pump_off_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_lvl_3_pump_off_time_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_lvl_3_pump_off_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_lvl_3_pump_off_time_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_lvl_3_pump_off_time_line_edit, 7, 2, 1, 1)
+
+        self.label_13 = QLabel(self.groupBox_4)
+        self.label_13.setObjectName(u"label_13")
+        sizePolicy1.setHeightForWidth(self.label_13.sizePolicy().hasHeightForWidth())
+        self.label_13.setSizePolicy(sizePolicy1)
+        self.label_13.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_13, 0, 3, 1, 1)
+
+        self.label_10 = QLabel(self.groupBox_4)
+        self.label_10.setObjectName(u"label_10")
+        sizePolicy1.setHeightForWidth(self.label_10.sizePolicy().hasHeightForWidth())
+        self.label_10.setSizePolicy(sizePolicy1)
+        self.label_10.setMinimumSize(QSize(220, 14))
+
+        self.gridLayout_11.addWidget(self.label_10, 2, 2, 1, 1)
+
+        self.expected_heartbeat_interval_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_heartbeat_interval_line_edit.setObjectName(u"expected_heartbeat_interval_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_heartbeat_interval_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_heartbeat_interval_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_heartbeat_interval_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_heartbeat_interval_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_heartbeat_interval_line_edit, 5, 3, 1, 1)
+
+        self.expected_lost_alarm_interval_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_4)
+        self.expected_lost_alarm_interval_line_edit.setObjectName(u"expected_lost_alarm_interval_line_edit")
+        sizePolicy2.setHeightForWidth(self.expected_lost_alarm_interval_line_edit.sizePolicy().hasHeightForWidth())
+        self.expected_lost_alarm_interval_line_edit.setSizePolicy(sizePolicy2)
+        self.expected_lost_alarm_interval_line_edit.setMinimumSize(QSize(0, 26))
+        self.expected_lost_alarm_interval_line_edit.setFont(font1)
+
+        self.gridLayout_11.addWidget(self.expected_lost_alarm_interval_line_edit, 3, 3, 1, 1)
+
+
+        self.gridLayout_12.addLayout(self.gridLayout_11, 0, 0, 1, 1)
+
+
+        self.gridLayout.addWidget(self.groupBox_4, 5, 1, 3, 5)
+
+        self.groupBox_6 = QGroupBox(self.centralwidget)
+        self.groupBox_6.setObjectName(u"groupBox_6")
+        self.groupBox_6.setFont(font)
+        self.gridLayout_13 = QGridLayout(self.groupBox_6)
+        self.gridLayout_13.setObjectName(u"gridLayout_13")
+        self.gridLayout_14 = QGridLayout()
+        self.gridLayout_14.setObjectName(u"gridLayout_14")
+        self.current_lvl_2_pump_on_time_line_edit = QLineEdit(self.groupBox_6)
+        self.current_lvl_2_pump_on_time_line_edit.setObjectName(u"current_lvl_2_pump_on_time_line_edit")
+        self.current_lvl_2_pump_on_time_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_lvl_2_pump_on_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_lvl_2_pump_on_time_line_edit.setSizePolicy(sizePolicy2)
+        self.current_lvl_2_pump_on_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_lvl_2_pump_on_time_line_edit.setFont(font1)
+        self.current_lvl_2_pump_on_time_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_lvl_2_pump_on_time_line_edit, 1, 3, 1, 1)
+
+        self.label_32 = QLabel(self.groupBox_6)
+        self.label_32.setObjectName(u"label_32")
+        sizePolicy2.setHeightForWidth(self.label_32.sizePolicy().hasHeightForWidth())
+        self.label_32.setSizePolicy(sizePolicy2)
+        self.label_32.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_32, 2, 4, 1, 1)
+
+        self.label_21 = QLabel(self.groupBox_6)
+        self.label_21.setObjectName(u"label_21")
+        sizePolicy2.setHeightForWidth(self.label_21.sizePolicy().hasHeightForWidth())
+        self.label_21.setSizePolicy(sizePolicy2)
+        self.label_21.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_21, 4, 3, 1, 1)
+
+        self.current_scale_of_pump_on_time_line_edit = QLineEdit(self.groupBox_6)
+        self.current_scale_of_pump_on_time_line_edit.setObjectName(u"current_scale_of_pump_on_time_line_edit")
+        self.current_scale_of_pump_on_time_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_scale_of_pump_on_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_scale_of_pump_on_time_line_edit.setSizePolicy(sizePolicy2)
+        self.current_scale_of_pump_on_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_scale_of_pump_on_time_line_edit.setFont(font1)
+        self.current_scale_of_pump_on_time_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_scale_of_pump_on_time_line_edit, 7, 2, 1, 1)
+
+        self.current_heartbeat_interval_line_edit = QLineEdit(self.groupBox_6)
+        self.current_heartbeat_interval_line_edit.setObjectName(u"current_heartbeat_interval_line_edit")
+        self.current_heartbeat_interval_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_heartbeat_interval_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_heartbeat_interval_line_edit.setSizePolicy(sizePolicy2)
+        self.current_heartbeat_interval_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_heartbeat_interval_line_edit.setFont(font1)
+        self.current_heartbeat_interval_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_heartbeat_interval_line_edit, 5, 4, 1, 1)
+
+        self.current_temp_lvl_4_thold_line_edit = QLineEdit(self.groupBox_6)
+        self.current_temp_lvl_4_thold_line_edit.setObjectName(u"current_temp_lvl_4_thold_line_edit")
+        self.current_temp_lvl_4_thold_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_temp_lvl_4_thold_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_temp_lvl_4_thold_line_edit.setSizePolicy(sizePolicy2)
+        self.current_temp_lvl_4_thold_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_temp_lvl_4_thold_line_edit.setFont(font1)
+        self.current_temp_lvl_4_thold_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_temp_lvl_4_thold_line_edit, 7, 1, 1, 1)
+
+        self.label_34 = QLabel(self.groupBox_6)
+        self.label_34.setObjectName(u"label_34")
+        sizePolicy2.setHeightForWidth(self.label_34.sizePolicy().hasHeightForWidth())
+        self.label_34.setSizePolicy(sizePolicy2)
+        self.label_34.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_34, 6, 4, 1, 1)
+
+        self.current_setup_duration_line_edit = QLineEdit(self.groupBox_6)
+        self.current_setup_duration_line_edit.setObjectName(u"current_setup_duration_line_edit")
+        self.current_setup_duration_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_setup_duration_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_setup_duration_line_edit.setSizePolicy(sizePolicy2)
+        self.current_setup_duration_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_setup_duration_line_edit.setFont(font1)
+        self.current_setup_duration_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_setup_duration_line_edit, 7, 4, 1, 1)
+
+        self.label_26 = QLabel(self.groupBox_6)
+        self.label_26.setObjectName(u"label_26")
+        sizePolicy2.setHeightForWidth(self.label_26.sizePolicy().hasHeightForWidth())
+        self.label_26.setSizePolicy(sizePolicy2)
+        self.label_26.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_26, 0, 3, 1, 1)
+
+        self.current_temp_sensitivity_line_edit = QLineEdit(self.groupBox_6)
+        self.current_temp_sensitivity_line_edit.setObjectName(u"current_temp_sensitivity_line_edit")
+        self.current_temp_sensitivity_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_temp_sensitivity_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_temp_sensitivity_line_edit.setSizePolicy(sizePolicy2)
+        self.current_temp_sensitivity_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_temp_sensitivity_line_edit.setFont(font1)
+        self.current_temp_sensitivity_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_temp_sensitivity_line_edit, 3, 2, 1, 1)
+
+        self.current_lvl_3_pump_on_time_line_edit = QLineEdit(self.groupBox_6)
+        self.current_lvl_3_pump_on_time_line_edit.setObjectName(u"current_lvl_3_pump_on_time_line_edit")
+        self.current_lvl_3_pump_on_time_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_lvl_3_pump_on_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_lvl_3_pump_on_time_line_edit.setSizePolicy(sizePolicy2)
+        self.current_lvl_3_pump_on_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_lvl_3_pump_on_time_line_edit.setFont(font1)
+        self.current_lvl_3_pump_on_time_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_lvl_3_pump_on_time_line_edit, 5, 3, 1, 1)
+
+        self.label_23 = QLabel(self.groupBox_6)
+        self.label_23.setObjectName(u"label_23")
+        sizePolicy2.setHeightForWidth(self.label_23.sizePolicy().hasHeightForWidth())
+        self.label_23.setSizePolicy(sizePolicy2)
+        self.label_23.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_23, 6, 3, 1, 1)
+
+        self.label_28 = QLabel(self.groupBox_6)
+        self.label_28.setObjectName(u"label_28")
+        sizePolicy2.setHeightForWidth(self.label_28.sizePolicy().hasHeightForWidth())
+        self.label_28.setSizePolicy(sizePolicy2)
+        self.label_28.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_28, 2, 1, 1, 1)
+
+        self.label_30 = QLabel(self.groupBox_6)
+        self.label_30.setObjectName(u"label_30")
+        sizePolicy2.setHeightForWidth(self.label_30.sizePolicy().hasHeightForWidth())
+        self.label_30.setSizePolicy(sizePolicy2)
+        self.label_30.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_30, 2, 2, 1, 1)
+
+        self.current_temp_lvl_2_thold_line_edit = QLineEdit(self.groupBox_6)
+        self.current_temp_lvl_2_thold_line_edit.setObjectName(u"current_temp_lvl_2_thold_line_edit")
+        self.current_temp_lvl_2_thold_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_temp_lvl_2_thold_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_temp_lvl_2_thold_line_edit.setSizePolicy(sizePolicy2)
+        self.current_temp_lvl_2_thold_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_temp_lvl_2_thold_line_edit.setFont(font1)
+        self.current_temp_lvl_2_thold_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_temp_lvl_2_thold_line_edit, 3, 1, 1, 1)
+
+        self.current_lvl_2_pump_off_time_line_edit = QLineEdit(self.groupBox_6)
+        self.current_lvl_2_pump_off_time_line_edit.setObjectName(u"current_lvl_2_pump_off_time_line_edit")
+        self.current_lvl_2_pump_off_time_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_lvl_2_pump_off_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_lvl_2_pump_off_time_line_edit.setSizePolicy(sizePolicy2)
+        self.current_lvl_2_pump_off_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_lvl_2_pump_off_time_line_edit.setFont(font1)
+        self.current_lvl_2_pump_off_time_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_lvl_2_pump_off_time_line_edit, 3, 3, 1, 1)
+
+        self.label_19 = QLabel(self.groupBox_6)
+        self.label_19.setObjectName(u"label_19")
+        sizePolicy2.setHeightForWidth(self.label_19.sizePolicy().hasHeightForWidth())
+        self.label_19.setSizePolicy(sizePolicy2)
+        self.label_19.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_19, 6, 2, 1, 1)
+
+        self.label_22 = QLabel(self.groupBox_6)
+        self.label_22.setObjectName(u"label_22")
+        sizePolicy2.setHeightForWidth(self.label_22.sizePolicy().hasHeightForWidth())
+        self.label_22.setSizePolicy(sizePolicy2)
+        self.label_22.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_22, 4, 2, 1, 1)
+
+        self.label_24 = QLabel(self.groupBox_6)
+        self.label_24.setObjectName(u"label_24")
+        sizePolicy2.setHeightForWidth(self.label_24.sizePolicy().hasHeightForWidth())
+        self.label_24.setSizePolicy(sizePolicy2)
+        self.label_24.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_24, 6, 1, 1, 1)
+
+        self.label_33 = QLabel(self.groupBox_6)
+        self.label_33.setObjectName(u"label_33")
+        sizePolicy2.setHeightForWidth(self.label_33.sizePolicy().hasHeightForWidth())
+        self.label_33.setSizePolicy(sizePolicy2)
+        self.label_33.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_33, 4, 4, 1, 1)
+
+        self.current_temp_lvl_3_thold_line_edit = QLineEdit(self.groupBox_6)
+        self.current_temp_lvl_3_thold_line_edit.setObjectName(u"current_temp_lvl_3_thold_line_edit")
+        self.current_temp_lvl_3_thold_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_temp_lvl_3_thold_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_temp_lvl_3_thold_line_edit.setSizePolicy(sizePolicy2)
+        self.current_temp_lvl_3_thold_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_temp_lvl_3_thold_line_edit.setFont(font1)
+        self.current_temp_lvl_3_thold_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_temp_lvl_3_thold_line_edit, 5, 1, 1, 1)
+
+        self.label_36 = QLabel(self.groupBox_6)
+        self.label_36.setObjectName(u"label_36")
+        sizePolicy5 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+        sizePolicy5.setHorizontalStretch(0)
+        sizePolicy5.setVerticalStretch(0)
+        sizePolicy5.setHeightForWidth(self.label_36.sizePolicy().hasHeightForWidth())
+        self.label_36.setSizePolicy(sizePolicy5)
+        self.label_36.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_36, 0, 1, 1, 2)
+
+        self.label_31 = QLabel(self.groupBox_6)
+        self.label_31.setObjectName(u"label_31")
+        sizePolicy2.setHeightForWidth(self.label_31.sizePolicy().hasHeightForWidth())
+        self.label_31.setSizePolicy(sizePolicy2)
+        self.label_31.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_31, 0, 4, 1, 1)
+
+        self.current_low_battery_thold_line_edit = QLineEdit(self.groupBox_6)
+        self.current_low_battery_thold_line_edit.setObjectName(u"current_low_battery_thold_line_edit")
+        self.current_low_battery_thold_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_low_battery_thold_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_low_battery_thold_line_edit.setSizePolicy(sizePolicy2)
+        self.current_low_battery_thold_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_low_battery_thold_line_edit.setFont(font1)
+        self.current_low_battery_thold_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_low_battery_thold_line_edit, 1, 4, 1, 1)
+
+        self.label_25 = QLabel(self.groupBox_6)
+        self.label_25.setObjectName(u"label_25")
+        sizePolicy2.setHeightForWidth(self.label_25.sizePolicy().hasHeightForWidth())
+        self.label_25.setSizePolicy(sizePolicy2)
+        self.label_25.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_25, 4, 1, 1, 1)
+
+        self.current_temp_detection_interval_line_edit = QLineEdit(self.groupBox_6)
+        self.current_temp_detection_interval_line_edit.setObjectName(u"current_temp_detection_interval_line_edit")
+        self.current_temp_detection_interval_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_temp_detection_interval_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_temp_detection_interval_line_edit.setSizePolicy(sizePolicy2)
+        self.current_temp_detection_interval_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_temp_detection_interval_line_edit.setFont(font1)
+        self.current_temp_detection_interval_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_temp_detection_interval_line_edit, 5, 2, 1, 1)
+
+        self.label_27 = QLabel(self.groupBox_6)
+        self.label_27.setObjectName(u"label_27")
+        sizePolicy2.setHeightForWidth(self.label_27.sizePolicy().hasHeightForWidth())
+        self.label_27.setSizePolicy(sizePolicy2)
+        self.label_27.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_14.addWidget(self.label_27, 2, 3, 1, 1)
+
+        self.current_lvl_3_pump_off_time_line_edit = QLineEdit(self.groupBox_6)
+        self.current_lvl_3_pump_off_time_line_edit.setObjectName(u"current_lvl_3_pump_off_time_line_edit")
+        self.current_lvl_3_pump_off_time_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_lvl_3_pump_off_time_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_lvl_3_pump_off_time_line_edit.setSizePolicy(sizePolicy2)
+        self.current_lvl_3_pump_off_time_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_lvl_3_pump_off_time_line_edit.setFont(font1)
+        self.current_lvl_3_pump_off_time_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_lvl_3_pump_off_time_line_edit, 7, 3, 1, 1)
+
+        self.current_lost_alarm_interval_line_edit = QLineEdit(self.groupBox_6)
+        self.current_lost_alarm_interval_line_edit.setObjectName(u"current_lost_alarm_interval_line_edit")
+        self.current_lost_alarm_interval_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.current_lost_alarm_interval_line_edit.sizePolicy().hasHeightForWidth())
+        self.current_lost_alarm_interval_line_edit.setSizePolicy(sizePolicy2)
+        self.current_lost_alarm_interval_line_edit.setMinimumSize(QSize(0, 26))
+        self.current_lost_alarm_interval_line_edit.setFont(font1)
+        self.current_lost_alarm_interval_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.current_lost_alarm_interval_line_edit, 3, 4, 1, 1)
+
+        self.updated_at_line_edit = QLineEdit(self.groupBox_6)
+        self.updated_at_line_edit.setObjectName(u"updated_at_line_edit")
+        self.updated_at_line_edit.setEnabled(False)
+        sizePolicy2.setHeightForWidth(self.updated_at_line_edit.sizePolicy().hasHeightForWidth())
+        self.updated_at_line_edit.setSizePolicy(sizePolicy2)
+        self.updated_at_line_edit.setMinimumSize(QSize(0, 26))
+        self.updated_at_line_edit.setFont(font1)
+        self.updated_at_line_edit.setReadOnly(True)
+
+        self.gridLayout_14.addWidget(self.updated_at_line_edit, 1, 1, 1, 2)
+
+
+        self.gridLayout_13.addLayout(self.gridLayout_14, 0, 2, 1, 1)
+
+
+        self.gridLayout.addWidget(self.groupBox_6, 1, 1, 3, 5)
+
+        self.groupBox_7 = QGroupBox(self.centralwidget)
+        self.groupBox_7.setObjectName(u"groupBox_7")
+        self.groupBox_7.setFont(font)
+        self.gridLayout_4 = QGridLayout(self.groupBox_7)
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.refresh_push_button = QPushButton(self.groupBox_7)
+        self.refresh_push_button.setObjectName(u"refresh_push_button")
+        self.refresh_push_button.setEnabled(False)
+        sizePolicy6 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Ignored)
+        sizePolicy6.setHorizontalStretch(0)
+        sizePolicy6.setVerticalStretch(0)
+        sizePolicy6.setHeightForWidth(self.refresh_push_button.sizePolicy().hasHeightForWidth())
+        self.refresh_push_button.setSizePolicy(sizePolicy6)
+        self.refresh_push_button.setMinimumSize(QSize(120, 0))
+        self.refresh_push_button.setFont(font3)
+
+        self.gridLayout_4.addWidget(self.refresh_push_button, 1, 0, 1, 1)
+
+        self.copy_to_profile_push_button = QPushButton(self.groupBox_7)
+        self.copy_to_profile_push_button.setObjectName(u"copy_to_profile_push_button")
+        self.copy_to_profile_push_button.setEnabled(False)
+        sizePolicy6.setHeightForWidth(self.copy_to_profile_push_button.sizePolicy().hasHeightForWidth())
+        self.copy_to_profile_push_button.setSizePolicy(sizePolicy6)
+        self.copy_to_profile_push_button.setMinimumSize(QSize(120, 0))
+        self.copy_to_profile_push_button.setFont(font3)
+
+        self.gridLayout_4.addWidget(self.copy_to_profile_push_button, 2, 0, 1, 1)
+
+
+        self.gridLayout.addWidget(self.groupBox_7, 1, 6, 3, 1)
+
+        self.groupBox_3 = QGroupBox(self.centralwidget)
+        self.groupBox_3.setObjectName(u"groupBox_3")
+        self.groupBox_3.setFont(font)
+        self.gridLayout_10 = QGridLayout(self.groupBox_3)
+        self.gridLayout_10.setObjectName(u"gridLayout_10")
+        self.command_line_edit = QLineEdit(self.groupBox_3)
+        self.command_line_edit.setObjectName(u"command_line_edit")
+        sizePolicy2.setHeightForWidth(self.command_line_edit.sizePolicy().hasHeightForWidth())
+        self.command_line_edit.setSizePolicy(sizePolicy2)
+        self.command_line_edit.setMinimumSize(QSize(0, 30))
+        self.command_line_edit.setFont(font1)
+
+        self.gridLayout_10.addWidget(self.command_line_edit, 1, 4, 2, 16)
+
+        self.label_37 = QLabel(self.groupBox_3)
+        self.label_37.setObjectName(u"label_37")
+        sizePolicy2.setHeightForWidth(self.label_37.sizePolicy().hasHeightForWidth())
+        self.label_37.setSizePolicy(sizePolicy2)
+        self.label_37.setMinimumSize(QSize(0, 14))
+
+        self.gridLayout_10.addWidget(self.label_37, 0, 4, 1, 2)
+
+        self.add_command_push_button = QPushButton(self.groupBox_3)
+        self.add_command_push_button.setObjectName(u"add_command_push_button")
+        sizePolicy2.setHeightForWidth(self.add_command_push_button.sizePolicy().hasHeightForWidth())
+        self.add_command_push_button.setSizePolicy(sizePolicy2)
+        self.add_command_push_button.setMinimumSize(QSize(0, 40))
+
+        self.gridLayout_10.addWidget(self.add_command_push_button, 3, 8, 1, 4)
+
+        self.save_command_push_button = QPushButton(self.groupBox_3)
+        self.save_command_push_button.setObjectName(u"save_command_push_button")
+        sizePolicy4.setHeightForWidth(self.save_command_push_button.sizePolicy().hasHeightForWidth())
+        self.save_command_push_button.setSizePolicy(sizePolicy4)
+        self.save_command_push_button.setFont(font2)
+
+        self.gridLayout_10.addWidget(self.save_command_push_button, 3, 12, 1, 4)
+
+        self.terminal_plain_text_edit = QScrollbackPlainTextEdit(self.groupBox_3)
+        self.terminal_plain_text_edit.setObjectName(u"terminal_plain_text_edit")
+        self.terminal_plain_text_edit.setEnabled(False)
+        sizePolicy.setHeightForWidth(self.terminal_plain_text_edit.sizePolicy().hasHeightForWidth())
+        self.terminal_plain_text_edit.setSizePolicy(sizePolicy)
+        self.terminal_plain_text_edit.setFont(font1)
+        self.terminal_plain_text_edit.setReadOnly(True)
+
+        self.gridLayout_10.addWidget(self.terminal_plain_text_edit, 0, 20, 4, 7)
+
+        self.command_list_widget = QListWidget(self.groupBox_3)
+        self.command_list_widget.setObjectName(u"command_list_widget")
+        sizePolicy3.setHeightForWidth(self.command_list_widget.sizePolicy().hasHeightForWidth())
+        self.command_list_widget.setSizePolicy(sizePolicy3)
+        self.command_list_widget.setFont(font1)
+
+        self.gridLayout_10.addWidget(self.command_list_widget, 0, 0, 4, 4)
+
+        self.command_name_line_edit = QSelectAllOnFocusLineEdit(self.groupBox_3)
+        self.command_name_line_edit.setObjectName(u"command_name_line_edit")
+        sizePolicy2.setHeightForWidth(self.command_name_line_edit.sizePolicy().hasHeightForWidth())
+        self.command_name_line_edit.setSizePolicy(sizePolicy2)
+        self.command_name_line_edit.setMinimumSize(QSize(0, 30))
+        self.command_name_line_edit.setFont(font1)
+
+        self.gridLayout_10.addWidget(self.command_name_line_edit, 0, 6, 1, 14)
+
+        self.remove_command_push_button = QPushButton(self.groupBox_3)
+        self.remove_command_push_button.setObjectName(u"remove_command_push_button")
+        sizePolicy2.setHeightForWidth(self.remove_command_push_button.sizePolicy().hasHeightForWidth())
+        self.remove_command_push_button.setSizePolicy(sizePolicy2)
+        self.remove_command_push_button.setMinimumSize(QSize(0, 40))
+
+        self.gridLayout_10.addWidget(self.remove_command_push_button, 3, 4, 1, 4)
+
+        self.send_command_push_button = QPushButton(self.groupBox_3)
+        self.send_command_push_button.setObjectName(u"send_command_push_button")
+        self.send_command_push_button.setEnabled(False)
+        sizePolicy4.setHeightForWidth(self.send_command_push_button.sizePolicy().hasHeightForWidth())
+        self.send_command_push_button.setSizePolicy(sizePolicy4)
+        self.send_command_push_button.setMinimumSize(QSize(0, 40))
+        self.send_command_push_button.setFont(font2)
+
+        self.gridLayout_10.addWidget(self.send_command_push_button, 3, 16, 1, 4)
+
+        self.clear_terminal_push_button = QPushButton(self.groupBox_3)
+        self.clear_terminal_push_button.setObjectName(u"clear_terminal_push_button")
+        self.clear_terminal_push_button.setEnabled(False)
+        sizePolicy4.setHeightForWidth(self.clear_terminal_push_button.sizePolicy().hasHeightForWidth())
+        self.clear_terminal_push_button.setSizePolicy(sizePolicy4)
+        font4 = QFont()
+        font4.setPointSize(16)
+        font4.setBold(True)
+        font4.setStyleStrategy(QFont.PreferAntialias)
+        self.clear_terminal_push_button.setFont(font4)
+
+        self.gridLayout_10.addWidget(self.clear_terminal_push_button, 0, 27, 1, 1)
+
+        self.show_hide_external_terminal_push_button = QPushButton(self.groupBox_3)
+        self.show_hide_external_terminal_push_button.setObjectName(u"show_hide_external_terminal_push_button")
+        sizePolicy6.setHeightForWidth(self.show_hide_external_terminal_push_button.sizePolicy().hasHeightForWidth())
+        self.show_hide_external_terminal_push_button.setSizePolicy(sizePolicy6)
+        font5 = QFont()
+        font5.setPointSize(14)
+        self.show_hide_external_terminal_push_button.setFont(font5)
+
+        self.gridLayout_10.addWidget(self.show_hide_external_terminal_push_button, 1, 27, 3, 1)
+
+
+        self.gridLayout.addWidget(self.groupBox_3, 8, 0, 4, 7)
+
+        self.groupBox_8 = QGroupBox(self.centralwidget)
+        self.groupBox_8.setObjectName(u"groupBox_8")
+        self.gridLayout_5 = QGridLayout(self.groupBox_8)
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.send_profile_push_button = QPushButton(self.groupBox_8)
+        self.send_profile_push_button.setObjectName(u"send_profile_push_button")
+        self.send_profile_push_button.setEnabled(False)
+        sizePolicy4.setHeightForWidth(self.send_profile_push_button.sizePolicy().hasHeightForWidth())
+        self.send_profile_push_button.setSizePolicy(sizePolicy4)
+        self.send_profile_push_button.setMinimumSize(QSize(0, 0))
+        self.send_profile_push_button.setFont(font2)
+
+        self.gridLayout_5.addWidget(self.send_profile_push_button, 0, 0, 1, 1)
+
+        self.save_profile_push_button = QPushButton(self.groupBox_8)
+        self.save_profile_push_button.setObjectName(u"save_profile_push_button")
+        self.save_profile_push_button.setEnabled(False)
+        sizePolicy4.setHeightForWidth(self.save_profile_push_button.sizePolicy().hasHeightForWidth())
+        self.save_profile_push_button.setSizePolicy(sizePolicy4)
+        self.save_profile_push_button.setFont(font2)
+
+        self.gridLayout_5.addWidget(self.save_profile_push_button, 1, 0, 1, 1)
+
+
+        self.gridLayout.addWidget(self.groupBox_8, 5, 6, 3, 1)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        QWidget.setTabOrder(self.port_popup_hookable_combo_box, self.port_connect_push_button)
+        QWidget.setTabOrder(self.port_connect_push_button, self.port_disconnect_push_button)
+        QWidget.setTabOrder(self.port_disconnect_push_button, self.status_code_line_edit)
+        QWidget.setTabOrder(self.status_code_line_edit, self.temp_line_edit)
+        QWidget.setTabOrder(self.temp_line_edit, self.rts_bat_volt_line_edit)
+        QWidget.setTabOrder(self.rts_bat_volt_line_edit, self.cd_bat_volt_line_edit)
+        QWidget.setTabOrder(self.cd_bat_volt_line_edit, self.heartbeat_flag_line_edit)
+        QWidget.setTabOrder(self.heartbeat_flag_line_edit, self.low_temp_flag_line_edit)
+        QWidget.setTabOrder(self.low_temp_flag_line_edit, self.low_bat_flag_line_edit)
+        QWidget.setTabOrder(self.low_bat_flag_line_edit, self.setup_flag_line_edit)
+        QWidget.setTabOrder(self.setup_flag_line_edit, self.updated_at_line_edit)
+        QWidget.setTabOrder(self.updated_at_line_edit, self.current_temp_lvl_2_thold_line_edit)
+        QWidget.setTabOrder(self.current_temp_lvl_2_thold_line_edit, self.current_temp_lvl_3_thold_line_edit)
+        QWidget.setTabOrder(self.current_temp_lvl_3_thold_line_edit, self.current_temp_lvl_4_thold_line_edit)
+        QWidget.setTabOrder(self.current_temp_lvl_4_thold_line_edit, self.current_temp_sensitivity_line_edit)
+        QWidget.setTabOrder(self.current_temp_sensitivity_line_edit, self.current_temp_detection_interval_line_edit)
+        QWidget.setTabOrder(self.current_temp_detection_interval_line_edit, self.current_scale_of_pump_on_time_line_edit)
+        QWidget.setTabOrder(self.current_scale_of_pump_on_time_line_edit, self.current_lvl_2_pump_on_time_line_edit)
+        QWidget.setTabOrder(self.current_lvl_2_pump_on_time_line_edit, self.current_lvl_2_pump_off_time_line_edit)
+        QWidget.setTabOrder(self.current_lvl_2_pump_off_time_line_edit, self.current_lvl_3_pump_on_time_line_edit)
+        QWidget.setTabOrder(self.current_lvl_3_pump_on_time_line_edit, self.current_lvl_3_pump_off_time_line_edit)
+        QWidget.setTabOrder(self.current_lvl_3_pump_off_time_line_edit, self.current_low_battery_thold_line_edit)
+        QWidget.setTabOrder(self.current_low_battery_thold_line_edit, self.current_lost_alarm_interval_line_edit)
+        QWidget.setTabOrder(self.current_lost_alarm_interval_line_edit, self.current_heartbeat_interval_line_edit)
+        QWidget.setTabOrder(self.current_heartbeat_interval_line_edit, self.current_setup_duration_line_edit)
+        QWidget.setTabOrder(self.current_setup_duration_line_edit, self.profile_list_widget)
+        QWidget.setTabOrder(self.profile_list_widget, self.remove_profile_push_button)
+        QWidget.setTabOrder(self.remove_profile_push_button, self.add_profile_push_button)
+        QWidget.setTabOrder(self.add_profile_push_button, self.profile_name_line_edit)
+        QWidget.setTabOrder(self.profile_name_line_edit, self.expected_temp_lvl_2_thold_line_edit)
+        QWidget.setTabOrder(self.expected_temp_lvl_2_thold_line_edit, self.expected_temp_lvl_3_thold_line_edit)
+        QWidget.setTabOrder(self.expected_temp_lvl_3_thold_line_edit, self.expected_temp_lvl_4_thold_line_edit)
+        QWidget.setTabOrder(self.expected_temp_lvl_4_thold_line_edit, self.expected_temp_sensitivity_line_edit)
+        QWidget.setTabOrder(self.expected_temp_sensitivity_line_edit, self.expected_temp_detection_interval_line_edit)
+        QWidget.setTabOrder(self.expected_temp_detection_interval_line_edit, self.expected_scale_of_pump_on_time_line_edit)
+        QWidget.setTabOrder(self.expected_scale_of_pump_on_time_line_edit, self.expected_lvl_2_pump_on_time_line_edit)
+        QWidget.setTabOrder(self.expected_lvl_2_pump_on_time_line_edit, self.expected_lvl_2_pump_off_time_line_edit)
+        QWidget.setTabOrder(self.expected_lvl_2_pump_off_time_line_edit, self.expected_lvl_3_pump_on_time_line_edit)
+        QWidget.setTabOrder(self.expected_lvl_3_pump_on_time_line_edit, self.expected_lvl_3_pump_off_time_line_edit)
+        QWidget.setTabOrder(self.expected_lvl_3_pump_off_time_line_edit, self.expected_low_battery_thold_line_edit)
+        QWidget.setTabOrder(self.expected_low_battery_thold_line_edit, self.expected_lost_alarm_interval_line_edit)
+        QWidget.setTabOrder(self.expected_lost_alarm_interval_line_edit, self.expected_heartbeat_interval_line_edit)
+        QWidget.setTabOrder(self.expected_heartbeat_interval_line_edit, self.expected_setup_duration_line_edit)
+        QWidget.setTabOrder(self.expected_setup_duration_line_edit, self.refresh_push_button)
+        QWidget.setTabOrder(self.refresh_push_button, self.copy_to_profile_push_button)
+        QWidget.setTabOrder(self.copy_to_profile_push_button, self.send_profile_push_button)
+        QWidget.setTabOrder(self.send_profile_push_button, self.save_profile_push_button)
+        QWidget.setTabOrder(self.save_profile_push_button, self.command_list_widget)
+        QWidget.setTabOrder(self.command_list_widget, self.command_name_line_edit)
+        QWidget.setTabOrder(self.command_name_line_edit, self.command_line_edit)
+        QWidget.setTabOrder(self.command_line_edit, self.remove_command_push_button)
+        QWidget.setTabOrder(self.remove_command_push_button, self.add_command_push_button)
+        QWidget.setTabOrder(self.add_command_push_button, self.save_command_push_button)
+        QWidget.setTabOrder(self.save_command_push_button, self.send_command_push_button)
+        QWidget.setTabOrder(self.send_command_push_button, self.terminal_plain_text_edit)
+        QWidget.setTabOrder(self.terminal_plain_text_edit, self.clear_terminal_push_button)
+
+        self.retranslateUi(MainWindow)
+
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Freeze Drip Terminal", None))
+        self.groupBox_5.setTitle(QCoreApplication.translate("MainWindow", u"Device Status", None))
+        self.label_5.setText(QCoreApplication.translate("MainWindow", u"RTS battery voltage (V)", None))
+        self.label_39.setText(QCoreApplication.translate("MainWindow", u"Low Battery flag", None))
+        self.label_41.setText(QCoreApplication.translate("MainWindow", u"Status code", None))
+        self.label_29.setText(QCoreApplication.translate("MainWindow", u"CD battery voltage (V)", None))
+        self.label_17.setText(QCoreApplication.translate("MainWindow", u"Heartbeat flag", None))
+        self.label_35.setText(QCoreApplication.translate("MainWindow", u"Low Temperature flag", None))
+        self.label_40.setText(QCoreApplication.translate("MainWindow", u"Setup flag", None))
+        self.label_42.setText(QCoreApplication.translate("MainWindow", u"Temperature (\u00b0F)", None))
+        self.groupBox.setTitle(QCoreApplication.translate("MainWindow", u"Connection", None))
+        self.label_18.setText(QCoreApplication.translate("MainWindow", u"COM Port", None))
+        self.port_connect_push_button.setText(QCoreApplication.translate("MainWindow", u"Connect", None))
+        self.port_disconnect_push_button.setText(QCoreApplication.translate("MainWindow", u"Disconnect", None))
+        self.groupBox_2.setTitle(QCoreApplication.translate("MainWindow", u"Profiles", None))
+        self.add_profile_push_button.setText(QCoreApplication.translate("MainWindow", u"\u2795", None))
+        self.remove_profile_push_button.setText(QCoreApplication.translate("MainWindow", u"\u2796", None))
+        self.label_20.setText(QCoreApplication.translate("MainWindow", u"Freeze Drip Terminal", None))
+        self.groupBox_4.setTitle(QCoreApplication.translate("MainWindow", u"Profile", None))
+        self.label.setText(QCoreApplication.translate("MainWindow", u"Profile name", None))
+        self.label_3.setText(QCoreApplication.translate("MainWindow", u"Temp level 3 thold (14 ~ 99, \u00b0F)", None))
+        self.label_4.setText(QCoreApplication.translate("MainWindow", u"Temp level 4 thold (14 ~ 99, \u00b0F)", None))
+        self.label_14.setText(QCoreApplication.translate("MainWindow", u"Lost alarm intvl (1 ~ 300, sec)", None))
+        self.label_16.setText(QCoreApplication.translate("MainWindow", u"Setup duration (1 ~ 10, min)", None))
+        self.label_15.setText(QCoreApplication.translate("MainWindow", u"Heartbeat intvl (1 ~ 180, min)", None))
+        self.label_2.setText(QCoreApplication.translate("MainWindow", u"Temp level 2 thold (14 ~ 99, \u00b0F)", None))
+        self.label_11.setText(QCoreApplication.translate("MainWindow", u"Level 3 pump on time (30 ~ 600, sec)", None))
+        self.label_7.setText(QCoreApplication.translate("MainWindow", u"Temp detection intvl (1 ~ 600, sec)", None))
+        self.label_12.setText(QCoreApplication.translate("MainWindow", u"Level 3 pump off time (30 ~ 600, sec)", None))
+        self.label_6.setText(QCoreApplication.translate("MainWindow", u"Temp sensitivity (0.1 ~ 3, \u00b0F)", None))
+        self.label_9.setText(QCoreApplication.translate("MainWindow", u"Level 2 pump on time (30 ~ 600, sec)", None))
+        self.label_8.setText(QCoreApplication.translate("MainWindow", u"Scale of pump on time (1 ~ 10)", None))
+        self.label_13.setText(QCoreApplication.translate("MainWindow", u"Low Battery thold (3 ~ 6, V)", None))
+        self.label_10.setText(QCoreApplication.translate("MainWindow", u"Level 2 pump off time (30 ~ 600, sec)", None))
+        self.groupBox_6.setTitle(QCoreApplication.translate("MainWindow", u"Device Variables", None))
+        self.label_32.setText(QCoreApplication.translate("MainWindow", u"Lost alarm intvl (sec)", None))
+        self.label_21.setText(QCoreApplication.translate("MainWindow", u"Level 3 pump on time (sec)", None))
+        self.label_34.setText(QCoreApplication.translate("MainWindow", u"Setup duration (min)", None))
+        self.label_26.setText(QCoreApplication.translate("MainWindow", u"Level 2 pump on time (sec)", None))
+        self.label_23.setText(QCoreApplication.translate("MainWindow", u"Level 3 pump off time (sec)", None))
+        self.label_28.setText(QCoreApplication.translate("MainWindow", u"Temp level 2 thold (\u00b0F)", None))
+        self.label_30.setText(QCoreApplication.translate("MainWindow", u"Temp sensitivity (\u00b0F)", None))
+        self.label_19.setText(QCoreApplication.translate("MainWindow", u"Scale of pump on time", None))
+        self.label_22.setText(QCoreApplication.translate("MainWindow", u"Temp detection intvl (sec)", None))
+        self.label_24.setText(QCoreApplication.translate("MainWindow", u"Temp level 4 thold (\u00b0F)", None))
+        self.label_33.setText(QCoreApplication.translate("MainWindow", u"Heartbeat intvl (min)", None))
+        self.label_36.setText(QCoreApplication.translate("MainWindow", u"Updated at", None))
+        self.label_31.setText(QCoreApplication.translate("MainWindow", u"Low Battery thold (V)", None))
+        self.label_25.setText(QCoreApplication.translate("MainWindow", u"Temp level 3 thold (\u00b0F)", None))
+        self.label_27.setText(QCoreApplication.translate("MainWindow", u"Level 2 pump off time (sec)", None))
+        self.groupBox_7.setTitle(QCoreApplication.translate("MainWindow", u"Device Action", None))
+        self.refresh_push_button.setText(QCoreApplication.translate("MainWindow", u"\u27f3", None))
+        self.copy_to_profile_push_button.setText(QCoreApplication.translate("MainWindow", u"\u21a7", None))
+        self.groupBox_3.setTitle(QCoreApplication.translate("MainWindow", u"Diagnosis", None))
+        self.label_37.setText(QCoreApplication.translate("MainWindow", u"Command", None))
+        self.add_command_push_button.setText(QCoreApplication.translate("MainWindow", u"\u2795", None))
+        self.save_command_push_button.setText(QCoreApplication.translate("MainWindow", u"Save", None))
+        self.remove_command_push_button.setText(QCoreApplication.translate("MainWindow", u"\u2796", None))
+        self.send_command_push_button.setText(QCoreApplication.translate("MainWindow", u"Send", None))
+        self.clear_terminal_push_button.setText(QCoreApplication.translate("MainWindow", u"\u00d7", None))
+        self.show_hide_external_terminal_push_button.setText(QCoreApplication.translate("MainWindow", u"\U0001f5d4", None))
+        self.groupBox_8.setTitle(QCoreApplication.translate("MainWindow", u"Profile Action", None))
+        self.send_profile_push_button.setText(QCoreApplication.translate("MainWindow", u"Send", None))
+        self.save_profile_push_button.setText(QCoreApplication.translate("MainWindow", u"Save", None))
+    # retranslateUi
+
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'received_form.ui'
+##
+## Created by: Qt User Interface Compiler version 6.6.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGridLayout, QSizePolicy, QWidget)
+
+from desktop.ui.received_form import QReceivedForm
+from desktop.ui.scrollback_plain_text_edit import QScrollbackPlainTextEdit
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        if not Form.objectName():
+            Form.setObjectName(u"Form")
+        Form.resize(384, 480)
+        self.gridLayout = QGridLayout(Form)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.terminal_plain_text_edit = QScrollbackPlainTextEdit(Form)
+        self.terminal_plain_text_edit.setObjectName(u"terminal_plain_text_edit")
+        font = QFont()
+        font.setPointSize(11)
+        self.terminal_plain_text_edit.setFont(font)
+        self.terminal_plain_text_edit.setReadOnly(True)
+
+        self.gridLayout.addWidget(self.terminal_plain_text_edit, 0, 0, 1, 1)
+
+
+        self.retranslateUi(Form)
+
+    # setupUi
+
+    def retranslateUi(self, Form):
+        Form.setWindowTitle(QCoreApplication.translate("Form", u"Received - Freeze Drip Terminal", None))
+    # retranslateUi
+
@@ -1,2 +1,4 @@
 from .main_window_model import MainWindowModel
+from .telemetry_chart_model import TelemetryChartModel
+from .terminal_model import TerminalModel
 from .ui_model import UIModel
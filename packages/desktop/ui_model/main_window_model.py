@@ -1,3 +1,5 @@
+import dataclasses
+import functools
 import pathlib
 from typing import Callable, Optional
 
@@ -11,14 +13,24 @@ class MainWindowModel(UIModel):
 
         self._connected: bool = False
 
-        self.profile_db: sdk.ProfileDatabase = sdk.ProfileDatabase(pathlib.Path('freeze-drip-terminal-desktop.db'))
+        self.db_path: pathlib.Path = pathlib.Path('freeze-drip-terminal-desktop.db')
         self._profile: Optional[sdk.Profile] = None
+        self._profiles: Optional[list[sdk.Profile]] = None
         self._profiles_changed_listeners: list[Callable[[list[sdk.Profile]], None]] = list()
+        self._profile_verdicts: dict[str, tuple[Optional[str], bool]] = dict()
 
-        self.command_db: sdk.CommandDatabase = sdk.CommandDatabase(pathlib.Path('freeze-drip-terminal-desktop.db'))
         self._command: Optional[sdk.Command] = None
+        self._commands: Optional[list[sdk.Command]] = None
         self._commands_changed_listeners: list[Callable[[list[sdk.Command]], None]] = list()
 
+    @functools.cached_property
+    def profile_db(self) -> sdk.ProfileDatabase:
+        return sdk.ProfileDatabase(self.db_path)
+
+    @functools.cached_property
+    def command_db(self) -> sdk.CommandDatabase:
+        return sdk.CommandDatabase(self.db_path)
+
     @property
     def connected(self) -> bool:
         return self._connected
@@ -39,8 +51,18 @@ class MainWindowModel(UIModel):
     def fill_profile(self, id_: int):
         self.profile = self.profile_db.get(id_)
 
+    def _add_profile(self, profile: sdk.Profile) -> None:
+        profile.id = self.profile_db.add(profile)
+        if self._profiles is not None:
+            self._profiles.append(dataclasses.replace(profile))
+
+    def _index_of_profile(self, profile: sdk.Profile) -> int:
+        i: int
+        cached: sdk.Profile
+        return next(i for i, cached in enumerate(self.profiles) if cached.id == profile.id)
+
     def generate_default_profiles(self):
-        self.profile_db.add(sdk.Profile(
+        self._add_profile(sdk.Profile(
             name="Default",
             temp_lvl_2_thold="40",
             temp_lvl_3_thold="37",
@@ -59,20 +81,30 @@ class MainWindowModel(UIModel):
         self.notify_commands_changed()
 
     def create_profile(self) -> sdk.Profile:
-        profile: sdk.Profile = self.profile_db.get(self._profile.id) if self._profile else sdk.Profile()
+        profile: sdk.Profile = dataclasses.replace(self.profiles[self._index_of_profile(self._profile)]) \
+            if self._profile else sdk.Profile()
         profile.name = 'New Profile'
-        self.profile_db.add(profile)
+        self._add_profile(profile)
         self.notify_profiles_changed()
         return profile
 
     def remove_profile(self) -> None:
         self.profile_db.remove(self.profile)
+        index: int = self._index_of_profile(self.profile)
+        del self.profiles[index]
+        if not self.profiles:
+            self.generate_default_profiles()
+        self.select_profile(min(index, len(self.profiles) - 1))
         self.notify_profiles_changed()
 
     def save_profile(self):
         self.profile_db.edit(self.profile)
+        self.profiles[self._index_of_profile(self.profile)] = dataclasses.replace(self.profile)
         self.notify_profiles_changed()
 
+    def select_profile(self, index: int) -> None:
+        self.profile = dataclasses.replace(self.profiles[index])
+
     @property
     def profile(self) -> Optional[sdk.Profile]:
         return self._profile
@@ -81,99 +113,25 @@ class MainWindowModel(UIModel):
     def profile(self, value: Optional[sdk.Profile]) -> None:
         self._profile = value
 
-    def is_profile_temp_lvl_2_thold_valid(self) -> bool:
-        return isinstance(self.profile.temp_lvl_2_thold, str) and \
-                sdk.floatable(self.profile.temp_lvl_2_thold) and \
-                14 <= float(self.profile.temp_lvl_2_thold) <= 99
-
-    def is_profile_temp_lvl_3_thold_valid(self) -> bool:
-        return isinstance(self.profile.temp_lvl_3_thold, str) and \
-                sdk.floatable(self.profile.temp_lvl_3_thold) and \
-                14 <= float(self.profile.temp_lvl_3_thold) <= 99 \
-
-    def is_profile_temp_lvl_4_thold_valid(self) -> bool:
-        return isinstance(self.profile.temp_lvl_4_thold, str) and \
-                sdk.floatable(self.profile.temp_lvl_4_thold) and \
-                14 <= float(self.profile.temp_lvl_4_thold) <= 99
-
-    def is_profile_temp_sensitivity_valid(self) -> bool:
-        return isinstance(self.profile.temp_sensitivity, str) and \
-                sdk.floatable(self.profile.temp_sensitivity) and \
-                0.1 <= float(self.profile.temp_sensitivity) <= 3
-
-    def is_profile_temp_detection_interval_valid(self) -> bool:
-        return isinstance(self.profile.temp_detection_interval, str) and \
-                self.profile.temp_detection_interval.isnumeric() and \
-                1 <= int(self.profile.temp_detection_interval) <= 600
-
-    def is_profile_scale_of_pump_on_time_valid(self) -> bool:
-        return isinstance(self.profile.scale_of_pump_on_time, str) and \
-                sdk.floatable(self.profile.scale_of_pump_on_time) and \
-                1 <= float(self.profile.scale_of_pump_on_time) <= 10
-
-    def is_profile_lvl_2_pump_on_time_valid(self) -> bool:
-        return isinstance(self.profile.lvl_2_pump_on_time, str) and \
-                self.profile.lvl_2_pump_on_time.isnumeric() and \
-                30 <= int(self.profile.lvl_2_pump_on_time) <= 600
-
-    def is_profile_lvl_2_pump_off_time_valid(self) -> bool:
-        return isinstance(self.profile.lvl_2_pump_off_time, str) and \
-                self.profile.lvl_2_pump_off_time.isnumeric() and \
-                30 <= int(self.profile.lvl_2_pump_off_time) <= 600
-
-    def is_profile_lvl_3_pump_on_time_valid(self) -> bool:
-        return isinstance(self.profile.lvl_3_pump_on_time, str) and \
-                self.profile.lvl_3_pump_on_time.isnumeric() and \
-                30 <= int(self.profile.lvl_3_pump_on_time) <= 600
-
-    def is_profile_lvl_3_pump_off_time_valid(self) -> bool:
-        return isinstance(self.profile.lvl_3_pump_off_time, str) and \
-                self.profile.lvl_3_pump_off_time.isnumeric() and \
-                30 <= int(self.profile.lvl_3_pump_off_time) <= 600
-
-    def is_profile_low_battery_thold_valid(self) -> bool:
-        return isinstance(self.profile.low_battery_thold, str) and \
-                sdk.floatable(self.profile.low_battery_thold) and \
-                3 <= float(self.profile.low_battery_thold) <= 6
-
-    def is_profile_lost_alarm_interval_valid(self) -> bool:
-        return isinstance(self.profile.lost_alarm_interval, str) and \
-                self.profile.lost_alarm_interval.isnumeric() and \
-                1 <= int(self.profile.lost_alarm_interval) <= 300
-
-    def is_profile_heartbeat_interval_valid(self) -> bool:
-        return isinstance(self.profile.heartbeat_interval, str) and \
-                self.profile.heartbeat_interval.isnumeric() and \
-                1 <= int(self.profile.heartbeat_interval) <= 180
-
-    def is_profile_setup_duration_valid(self) -> bool:
-        return isinstance(self.profile.setup_duration, str) and \
-                self.profile.setup_duration.isnumeric() and \
-                1 <= int(self.profile.setup_duration) <= 10
+    def is_profile_field_valid(self, name: str) -> bool:
+        # Verdicts are kept per value, so an edit re-parses only the field it changed
+        value: Optional[str] = getattr(self.profile, name)
+        verdict: Optional[tuple[Optional[str], bool]] = self._profile_verdicts.get(name)
+        if verdict is None or verdict[0] is not value:
+            verdict = self._profile_verdicts[name] = (value, sdk.PROFILE_FIELD_RANGES[name].is_valid(value))
+        return verdict[1]
 
     def is_profile_valid(self) -> bool:
-        return all([
-            self.is_profile_temp_lvl_2_thold_valid(),
-            self.is_profile_temp_lvl_3_thold_valid(),
-            self.is_profile_temp_lvl_4_thold_valid(),
-            self.is_profile_temp_sensitivity_valid(),
-            self.is_profile_temp_detection_interval_valid(),
-            self.is_profile_scale_of_pump_on_time_valid(),
-            self.is_profile_lvl_2_pump_on_time_valid(),
-            self.is_profile_lvl_2_pump_off_time_valid(),
-            self.is_profile_lvl_3_pump_on_time_valid(),
-            self.is_profile_lvl_3_pump_off_time_valid(),
-            self.is_profile_low_battery_thold_valid(),
-            self.is_profile_lost_alarm_interval_valid(),
-            self.is_profile_heartbeat_interval_valid(),
-            self.is_profile_setup_duration_valid(),
-        ])
+        field: sdk.FieldRange
+        return all([self.is_profile_field_valid(field.name) for field in sdk.PROFILE_SCHEMA])
 
     @property
     def profiles(self) -> list[sdk.Profile]:
-        if not list(self.profile_db.get_all()):
-            self.generate_default_profiles()
-        return list(self.profile_db.get_all())
+        if self._profiles is None:
+            self._profiles = list(self.profile_db.get_all())
+            if not self._profiles:
+                self.generate_default_profiles()
+        return self._profiles
 
     def add_on_commands_changed_listener(self, listener: Callable[[list[sdk.Command]], None]) -> None:
         self._commands_changed_listeners.append(listener)
@@ -184,35 +142,54 @@ class MainWindowModel(UIModel):
         for listener in self._commands_changed_listeners:
             listener(commands)
 
+    def _add_command(self, command: sdk.Command) -> None:
+        command.id = self.command_db.add(command)
+        if self._commands is not None:
+            self._commands.append(dataclasses.replace(command))
+
+    def _index_of_command(self, command: sdk.Command) -> int:
+        i: int
+        cached: sdk.Command
+        return next(i for i, cached in enumerate(self.commands) if cached.id == command.id)
+
     def generate_default_commands(self) -> None:
-        self.command_db.add(sdk.Command(
+        self._add_command(sdk.Command(
             name="Trigger immediately (countdown 0 second)",
             command="CD0"))
-        self.command_db.add(sdk.Command(
+        self._add_command(sdk.Command(
             name="Countdown 2 seconds",
             command="CD2"))
-        self.command_db.add(sdk.Command(
+        self._add_command(sdk.Command(
             name="SD2",
             command="SD2"))
-        self.command_db.add(sdk.Command(
+        self._add_command(sdk.Command(
             name="TD4",
             command="TD4"))
         self.notify_commands_changed()
 
     def create_command(self) -> sdk.Command:
         command: sdk.Command = sdk.Command(name="New Command")
-        self.command_db.add(command)
+        self._add_command(command)
         self.notify_commands_changed()
         return command
 
     def remove_command(self) -> None:
         self.command_db.remove(self.command)
+        index: int = self._index_of_command(self.command)
+        del self.commands[index]
+        if not self.commands:
+            self.generate_default_commands()
+        self.select_command(min(index, len(self.commands) - 1))
         self.notify_commands_changed()
 
     def save_command(self):
         self.command_db.edit(self.command)
+        self.commands[self._index_of_command(self.command)] = dataclasses.replace(self.command)
         self.notify_commands_changed()
 
+    def select_command(self, index: int) -> None:
+        self.command = dataclasses.replace(self.commands[index])
+
     @property
     def command(self) -> Optional[sdk.Command]:
         return self._command
@@ -223,6 +200,8 @@ class MainWindowModel(UIModel):
 
     @property
     def commands(self) -> list[sdk.Command]:
-        if not list(self.command_db.get_all()):
-            self.generate_default_commands()
-        return list(self.command_db.get_all())
+        if self._commands is None:
+            self._commands = list(self.command_db.get_all())
+            if not self._commands:
+                self.generate_default_commands()
+        return self._commands
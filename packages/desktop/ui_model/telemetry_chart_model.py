@@ -0,0 +1,38 @@
+from typing import Optional
+
+import sdk
+
+
+class TelemetryChartModel:
+    SERIES: tuple[str, ...] = ('temp', 'cd_battery_volt', 'rts_battery_volt')
+
+    def __init__(self, capacity: int = 1 << 17):
+        self.capacity: int = capacity
+        name: str
+        self.series: dict[str, sdk.RingSeries] = {name: sdk.RingSeries(capacity) for name in self.SERIES}
+
+    def append(self, reading: sdk.TelemetryReading) -> bool:
+        time: float = reading.monotonic_ns / 1e9
+        appended: bool = False
+        name: str
+        for name in self.SERIES:
+            tenths: Optional[int] = getattr(reading, name)
+            if tenths is not None:
+                self.series[name].append(time, tenths / 10)
+                appended = True
+        return appended
+
+    def span(self) -> Optional[tuple[float, float]]:
+        series: sdk.RingSeries
+        spans: list[tuple[float, float]] = [
+            (series.times()[0], series.times()[-1]) for series in self.series.values() if len(series)]
+        if not spans:
+            return None
+        start: float
+        end: float
+        return min(start for start, end in spans), max(end for start, end in spans)
+
+    def clear(self) -> None:
+        series: sdk.RingSeries
+        for series in self.series.values():
+            series.clear()
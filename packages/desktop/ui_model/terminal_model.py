@@ -0,0 +1,77 @@
+import itertools
+import os
+import pathlib
+import tempfile
+from typing import BinaryIO, Optional
+
+
+class TerminalModel:
+    CHECKPOINT_INTERVAL: int = 1024
+
+    def __init__(self, path: Optional[pathlib.Path] = None):
+        self.path: Optional[pathlib.Path] = path
+        self.temporary: bool = path is None
+        self.line_count: int = 0
+        self._spill_file: Optional[BinaryIO] = None
+        self._spill_size: int = 0
+        self._checkpoints: list[int] = list()
+
+    def _open(self) -> BinaryIO:
+        if self._spill_file is None:
+            if self.path is None:
+                fd: int
+                name: str
+                fd, name = tempfile.mkstemp(prefix='freeze-drip-terminal-', suffix='.log')
+                os.close(fd)
+                self.path = pathlib.Path(name)
+            self._spill_file = open(self.path, 'wb')
+        return self._spill_file
+
+    def append(self, lines: list[str]) -> str:
+        spill_file: BinaryIO = self._open()
+        line: str
+        text: str = ''.join(f"{line}\n" for line in lines)
+        next_checkpoint: int = len(self._checkpoints) * self.CHECKPOINT_INTERVAL
+        if self.line_count + len(lines) <= next_checkpoint:
+            data: bytes = text.encode()
+            spill_file.write(data)
+            self._spill_size += len(data)
+            self.line_count += len(lines)
+            return text
+        for line in lines:
+            if self.line_count % self.CHECKPOINT_INTERVAL == 0:
+                self._checkpoints.append(self._spill_size)
+            data: bytes = f"{line}\n".encode()
+            spill_file.write(data)
+            self._spill_size += len(data)
+            self.line_count += 1
+        return text
+
+    def read(self, start: int, count: int) -> str:
+        start = max(0, min(start, self.line_count))
+        count = max(0, min(count, self.line_count - start))
+        if not count:
+            return ''
+        self._open().flush()
+        reader: BinaryIO
+        with open(self.path, 'rb') as reader:
+            reader.seek(self._checkpoints[start // self.CHECKPOINT_INTERVAL])
+            skip: int = start % self.CHECKPOINT_INTERVAL
+            lines: list[bytes] = list(itertools.islice(reader, skip, skip + count))
+        return b''.join(lines).decode(errors='replace')
+
+    def clear(self) -> None:
+        spill_file: BinaryIO = self._open()
+        spill_file.seek(0)
+        spill_file.truncate()
+        self.line_count = 0
+        self._spill_size = 0
+        self._checkpoints.clear()
+
+    def close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        if self.temporary and self.path is not None and self.path.exists():
+            self.path.unlink()
+            self.path = None
@@ -1,10 +1,47 @@
-from .constant import VERSION
-from .data import Command, CommandDatabase, Profile, ProfileDatabase
+import importlib
+from typing import Any
+
+from .capture import RawCaptureSink, read_raw_capture
+from .codec import decode_profile, decode_profiles, encode_profile, encode_profiles
+from .data import Command, CommandDatabase, connect_database, Profile, ProfileDatabase, ProfileRecord
+from .engine import FreezeDripEngine, FreezeDripPort
+from .framing import LineFramer
+from .latency import LatencyHistogram, LatencyMonitor, StampedLines
 from .serial import (
+    FreezeDripCommandPipeline,
     FreezeDripSerialData,
+    FreezeDripSerialListener,
     FreezeDripSerialParser,
+    FreezeDripSerialRecord,
     FreezeDripSerialResponse,
+    FreezeDripSignal,
+    FreezeDripStatus,
     get_available_serial_ports,
-    SimpleFreezeDripSerial,
-    SimpleFreezeDripSerialListener)
+    SimpleFreezeDripSerial)
+from .telemetry import TelemetryDatabase, TelemetryReading
 from .util import floatable, ObservableProperty, Singleton
+
+
+_lazy_attributes: dict[str, str] = {
+    'AsyncFreezeDripSerial': 'aio',
+    'FieldRange': 'validation',
+    'FreezeDripEvent': 'aio',
+    'FreezeDripSerialProtocol': 'aio',
+    'FreezeDripSimulator': 'simulator',
+    'PROFILE_FIELD_RANGES': 'validation',
+    'PROFILE_SCHEMA': 'validation',
+    'RingSeries': 'series',
+    'SimulatedDevice': 'simulator',
+    'SimpleFreezeDripSerialListener': 'qt',
+    'VERSION': 'constant',
+    'decimate_min_max': 'series',
+    'validate_profiles': 'validation',
+}
+
+
+def __getattr__(name: str):
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(importlib.import_module(f'.{_lazy_attributes[name]}', __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import os
+from typing import AsyncIterator, Optional, Union
+
+import serial
+
+from .capture import RawCaptureSink
+from .framing import LineFramer
+from .serial import FreezeDripSerialData, FreezeDripSerialParser, FreezeDripSerialResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+FreezeDripEvent = Union[FreezeDripSerialData, FreezeDripSerialResponse]
+
+
+class FreezeDripSerialProtocol(asyncio.Protocol):
+    def __init__(self, device: 'AsyncFreezeDripSerial'):
+        self.device: 'AsyncFreezeDripSerial' = device
+
+    def data_received(self, data: bytes) -> None:
+        self.device._on_data(data)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.device._on_connection_lost(exc)
+
+
+class AsyncFreezeDripSerial:
+    def __init__(
+            self,
+            port_name: str,
+            capture: Optional[RawCaptureSink] = None,
+            timeout: float = 1.0,
+            max_events: int = 1024):
+        self.port_name: str = port_name
+        self.capture: Optional[RawCaptureSink] = capture
+        self.timeout: float = timeout
+        self.serial: Optional[serial.Serial] = None
+        self.parser: FreezeDripSerialParser = FreezeDripSerialParser()
+        self.framer: LineFramer = LineFramer()
+        self.closed: bool = True
+        self._events: asyncio.Queue = asyncio.Queue(max_events)
+        self._command_lock: asyncio.Lock = asyncio.Lock()
+        self._acknowledgement: Optional[asyncio.Future] = None
+        self._read_transport: Optional[asyncio.ReadTransport] = None
+        self._write_transport: Optional[asyncio.WriteTransport] = None
+
+    async def open(self) -> 'AsyncFreezeDripSerial':
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self.serial = serial.Serial(self.port_name, baudrate=115200, timeout=0)
+        self._read_transport, _ = await loop.connect_read_pipe(
+            lambda: FreezeDripSerialProtocol(self), os.fdopen(os.dup(self.serial.fileno()), 'rb', buffering=0))
+        self._write_transport, _ = await loop.connect_write_pipe(
+            asyncio.Protocol, os.fdopen(os.dup(self.serial.fileno()), 'wb', buffering=0))
+        self.closed = False
+        return self
+
+    def send(self, output: str) -> 'AsyncFreezeDripSerial':
+        payload: bytes = f'{output}\r\n'.encode()
+        if self.capture:
+            self.capture.sent(payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s SENDING: %r", self.port_name, payload)
+        self._write_transport.write(payload)
+        return self
+
+    async def command(self, command: str, timeout: Optional[float] = None) -> FreezeDripSerialResponse:
+        async with self._command_lock:
+            self._acknowledgement = asyncio.get_running_loop().create_future()
+            try:
+                self.send(command)
+                return await asyncio.wait_for(self._acknowledgement, self.timeout if timeout is None else timeout)
+            finally:
+                self._acknowledgement = None
+
+    async def events(self) -> AsyncIterator[FreezeDripEvent]:
+        while True:
+            event: Optional[FreezeDripEvent] = await self._events.get()
+            if event is None:
+                return
+            yield event
+
+    def _on_data(self, data: bytes) -> None:
+        if self.capture:
+            self.capture.received(data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s RECEIVED: %r", self.port_name, data)
+        self.framer.feed(data)
+        pending: list[str] = list()
+        raw_line: bytes
+        for raw_line in self.framer.lines():
+            c: str
+            line: str = ''.join(c for c in raw_line.decode(errors='ignore').strip() if c.isprintable())
+            if line not in FreezeDripSerialParser._RESPONSES:
+                pending.append(line)
+                continue
+            self._put_data(pending)
+            pending = list()
+            response: FreezeDripSerialResponse = FreezeDripSerialResponse(line)
+            self._put_event(response)
+            if self._acknowledgement and not self._acknowledgement.done():
+                self._acknowledgement.set_result(response)
+        self._put_data(pending)
+
+    def _put_data(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        data: Optional[FreezeDripSerialData] = self.parser.parse_lines(lines)[0]
+        if data:
+            self._put_event(data)
+
+    def _put_event(self, event: Optional[FreezeDripEvent]) -> None:
+        if self._events.full():
+            self._events.get_nowait()
+        self._events.put_nowait(event)
+
+    def _on_connection_lost(self, exc: Optional[Exception]) -> None:
+        if exc:
+            logger.warning("Lost %s: %s", self.port_name, exc)
+        self.close()
+
+    def close(self) -> 'AsyncFreezeDripSerial':
+        if self.closed:
+            return self
+        self.closed = True
+        if self._acknowledgement and not self._acknowledgement.done():
+            self._acknowledgement.set_exception(ConnectionError(f"{self.port_name} closed"))
+        self._read_transport.close()
+        self._write_transport.close()
+        self.serial.close()
+        self._put_event(None)
+        return self
+
+    async def __aenter__(self) -> 'AsyncFreezeDripSerial':
+        return await self.open()
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,90 @@
+import os
+import queue
+import struct
+import threading
+import time
+from typing import BinaryIO, Iterator, Optional, Union
+
+RAW_CAPTURE_HEADER: struct.Struct = struct.Struct('<QcI')
+RAW_CAPTURE_RECEIVED: bytes = b'R'
+RAW_CAPTURE_SENT: bytes = b'S'
+
+
+class RawCaptureSink:
+    def __init__(
+            self,
+            path: Union[str, os.PathLike],
+            buffer_size: int = 1 << 20,
+            flush_interval: float = 1.0):
+        self.path: Union[str, os.PathLike] = path
+        self.buffer_size: int = buffer_size
+        self.flush_interval: float = flush_interval
+        self.records: queue.SimpleQueue = queue.SimpleQueue()
+        self.closed: bool = False
+        self._file: BinaryIO = open(path, 'ab', buffering=buffer_size)
+        self._thread: threading.Thread = threading.Thread(target=self.write_loop, daemon=True)
+        self._thread.start()
+
+    def received(self, payload: bytes) -> None:
+        self.records.put((time.time_ns(), RAW_CAPTURE_RECEIVED, payload))
+
+    def sent(self, payload: bytes) -> None:
+        self.records.put((time.time_ns(), RAW_CAPTURE_SENT, payload))
+
+    def write_loop(self) -> None:
+        chunk: bytearray = bytearray()
+        flush_at: float = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                record: Optional[tuple[int, bytes, bytes]] = self.records.get(
+                    timeout=max(0.0, flush_at - time.monotonic()))
+            except queue.Empty:
+                record = ()
+            if record is None:
+                break
+            if record:
+                time_ns: int
+                direction: bytes
+                payload: bytes
+                time_ns, direction, payload = record
+                chunk += RAW_CAPTURE_HEADER.pack(time_ns, direction, len(payload))
+                chunk += payload
+            if len(chunk) >= self.buffer_size or time.monotonic() >= flush_at:
+                self._write(chunk)
+                chunk = bytearray()
+                flush_at = time.monotonic() + self.flush_interval
+        self._write(chunk)
+        self._file.close()
+
+    def _write(self, chunk: bytearray) -> None:
+        if chunk:
+            self._file.write(chunk)
+        self._file.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.records.put(None)
+        self._thread.join()
+
+    def __enter__(self) -> 'RawCaptureSink':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def read_raw_capture(path: Union[str, os.PathLike]) -> Iterator[tuple[int, bytes, bytes]]:
+    with open(path, 'rb') as file:
+        while header := file.read(RAW_CAPTURE_HEADER.size):
+            if len(header) < RAW_CAPTURE_HEADER.size:
+                return
+            time_ns: int
+            direction: bytes
+            length: int
+            time_ns, direction, length = RAW_CAPTURE_HEADER.unpack(header)
+            payload: bytes = file.read(length)
+            if len(payload) < length:
+                return
+            yield time_ns, direction, payload
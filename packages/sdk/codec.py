@@ -0,0 +1,123 @@
+import dataclasses
+import itertools
+import operator
+import re
+import struct
+from typing import Callable, Iterable, Optional, Sequence, Union
+
+from .data import ProfileRecord
+
+# Key, ProfileRecord field and hex digits of each value, in the order the device expects them
+_FIELDS: tuple[tuple[str, Optional[str], int], ...] = (
+    ('B', 'low_battery_thold', 2),
+    ('RBV', None, 2),
+    ('CBV', None, 2),
+    ('S', 'setup_duration', 2),
+    ('H', 'heartbeat_interval', 2),
+    ('T', 'temp_sensitivity', 2),
+    ('U', 'scale_of_pump_on_time', 2),
+    ('L', 'lost_alarm_interval', 4),
+    ('D', 'temp_detection_interval', 4),
+    ('T1', 'temp_lvl_2_thold', 4),
+    ('T2', 'temp_lvl_3_thold', 4),
+    ('T3', 'temp_lvl_4_thold', 4),
+    ('S1', 'lvl_2_pump_on_time', 4),
+    ('S2', 'lvl_2_pump_off_time', 4),
+    ('S3', 'lvl_3_pump_on_time', 4),
+    ('S4', 'lvl_3_pump_off_time', 4),
+)
+# The battery voltages are only ever reported by the device, so frames sent to it leave them unset
+_UNSET: str = 'FF'
+
+_NAMES: tuple[str, ...] = tuple(_name for _, _name, _ in _FIELDS if _name)
+_KEYS: dict[str, str] = {_key: _name for _key, _name, _ in _FIELDS if _name}
+_IGNORED_KEYS: frozenset[str] = frozenset(_key for _key, _name, _ in _FIELDS if not _name)
+_VALUE_PATTERNS: dict[str, re.Pattern] = {
+    _key: re.compile('[0-9A-Fa-f]' * _digits) for _key, _, _digits in _FIELDS}
+_FRAME_FORMAT: str = '#' + ','.join(
+    f"{_key},%0{_digits}X" if _name else f"{_key},{_UNSET}" for _key, _name, _digits in _FIELDS) + '$'
+_FRAME_LENGTH: int = len(_FRAME_FORMAT % ((0,) * len(_NAMES)))
+_FRAME_PATTERN: re.Pattern = re.compile('#' + ','.join(
+    f"{re.escape(_key)},({'[0-9A-Fa-f]' * _digits})" if _name else f"{re.escape(_key)},{'[0-9A-Fa-f]' * _digits}"
+    for _key, _name, _digits in _FIELDS) + r'\$')
+_FRAME_STRUCT: struct.Struct = struct.Struct(
+    '>' + ''.join('B' if _digits == 2 else 'H' for _, _name, _digits in _FIELDS if _name))
+_frame_values: Callable[[ProfileRecord], tuple[int, ...]] = operator.attrgetter(*_NAMES)
+# ProfileRecord starts with id and name, then has the frame fields in an order of its own
+_RECORD_NAMES: tuple[str, ...] = tuple(
+    field.name for field in dataclasses.fields(ProfileRecord) if field.name in _KEYS.values())
+_record_values: Callable[[tuple[int, ...]], tuple[int, ...]] = operator.itemgetter(*map(_NAMES.index, _RECORD_NAMES))
+
+
+def _record(values: tuple[int, ...]) -> ProfileRecord:
+    return ProfileRecord(None, None, *_record_values(values))
+
+
+def _decode_fields(frame: str) -> Optional[ProfileRecord]:
+    if not frame.startswith('#') or not frame.endswith('$'):
+        return None
+    tokens: list[str] = frame[1:-1].split(',')
+    if len(tokens) % 2:
+        return None
+    fields: dict[str, int] = dict()
+    key: str
+    value: str
+    for key, value in zip(tokens[0::2], tokens[1::2]):
+        # Exactly as many hex digits as encode_profile() writes, so signs, prefixes and wider values are rejected
+        if key not in _VALUE_PATTERNS or not _VALUE_PATTERNS[key].fullmatch(value):
+            return None
+        if key in _IGNORED_KEYS:
+            continue
+        if _KEYS[key] in fields:
+            return None
+        fields[_KEYS[key]] = int(value, 16)
+    if len(fields) != len(_KEYS):
+        return None
+    return ProfileRecord(**fields)
+
+
+def encode_profile(record: ProfileRecord) -> str:
+    try:
+        frame: str = _FRAME_FORMAT % _frame_values(record)
+    except TypeError:
+        raise ValueError(f"profile {record.name!r} has a missing or non-integer field") from None
+    # A negative or too large value would take a sign or more digits than its field has
+    if len(frame) != _FRAME_LENGTH or '-' in frame:
+        raise ValueError(f"profile {record.name!r} has a field out of range")
+    return frame
+
+
+def encode_profiles(records: Sequence[ProfileRecord]) -> list[bytes]:
+    if not records:
+        return list()
+    try:
+        text: str = (_FRAME_FORMAT + '\n') * len(records) % tuple(
+            itertools.chain.from_iterable(map(_frame_values, records)))
+    except TypeError:
+        text = ''
+    if len(text) != (_FRAME_LENGTH + 1) * len(records) or '-' in text:
+        record: ProfileRecord
+        for record in records:
+            encode_profile(record)
+    return text.encode().split(b'\n')[:-1]
+
+
+def decode_profile(frame: Union[str, bytes]) -> Optional[ProfileRecord]:
+    if isinstance(frame, bytes):
+        frame = frame.decode(errors='replace')
+    match: Optional[re.Match] = _FRAME_PATTERN.fullmatch(frame)
+    if match:
+        return _record(_FRAME_STRUCT.unpack(bytes.fromhex(''.join(match.groups()))))
+    return _decode_fields(frame)
+
+
+def decode_profiles(frames: Iterable[Union[str, bytes]]) -> list[Optional[ProfileRecord]]:
+    frame: Union[str, bytes]
+    texts: list[str] = [frame.decode(errors='replace') if isinstance(frame, bytes) else frame for frame in frames]
+    matches: list[Optional[re.Match]] = list(map(_FRAME_PATTERN.fullmatch, texts))
+    match: Optional[re.Match]
+    # Frames in the order encode_profile() writes them are unpacked together, any others field by field
+    unpacked: Iterable[tuple[int, ...]] = _FRAME_STRUCT.iter_unpack(
+        bytes.fromhex(''.join([''.join(match.groups()) for match in matches if match])))
+    text: str
+    return [_record(next(unpacked)) if match else _decode_fields(text) for text, match in zip(texts, matches)]
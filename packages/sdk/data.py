@@ -1,11 +1,12 @@
 import dataclasses
 import pathlib
-from typing import Any, Iterable, Optional
+import threading
+from typing import Any, Callable, ClassVar, Iterable, Mapping, Optional, TYPE_CHECKING
 
-import dacite
-import dataset
+if TYPE_CHECKING:
+    import dataset
 
-from .util import Singleton
+from .util import from_int, from_tenths, Singleton, to_int, to_tenths
 
 
 @dataclasses.dataclass
@@ -28,68 +29,135 @@ class Profile:
     setup_duration: Optional[str] = None
 
 
+@dataclasses.dataclass(slots=True)
+class ProfileRecord:
+    id: Optional[int] = None
+    name: Optional[str] = None
+    temp_lvl_2_thold: Optional[int] = None
+    temp_lvl_3_thold: Optional[int] = None
+    temp_lvl_4_thold: Optional[int] = None
+    temp_sensitivity: Optional[int] = None
+    temp_detection_interval: Optional[int] = None
+    scale_of_pump_on_time: Optional[int] = None
+    lvl_2_pump_on_time: Optional[int] = None
+    lvl_2_pump_off_time: Optional[int] = None
+    lvl_3_pump_on_time: Optional[int] = None
+    lvl_3_pump_off_time: Optional[int] = None
+    low_battery_thold: Optional[int] = None
+    lost_alarm_interval: Optional[int] = None
+    heartbeat_interval: Optional[int] = None
+    setup_duration: Optional[int] = None
+
+    _codecs: ClassVar[dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]]] = {
+        'id': (lambda x: x, lambda x: x),
+        'name': (lambda x: x, lambda x: x),
+        'temp_lvl_2_thold': (to_tenths, from_tenths),
+        'temp_lvl_3_thold': (to_tenths, from_tenths),
+        'temp_lvl_4_thold': (to_tenths, from_tenths),
+        'temp_sensitivity': (to_tenths, from_tenths),
+        'temp_detection_interval': (to_int, from_int),
+        'scale_of_pump_on_time': (to_tenths, from_tenths),
+        'lvl_2_pump_on_time': (to_int, from_int),
+        'lvl_2_pump_off_time': (to_int, from_int),
+        'lvl_3_pump_on_time': (to_int, from_int),
+        'lvl_3_pump_off_time': (to_int, from_int),
+        'low_battery_thold': (to_tenths, from_tenths),
+        'lost_alarm_interval': (to_int, from_int),
+        'heartbeat_interval': (to_int, from_int),
+        'setup_duration': (to_int, from_int),
+    }
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'ProfileRecord':
+        name: str
+        decode: Callable[[Any], Any]
+        return cls(**{name: decode(row.get(name)) for name, (decode, _) in cls._codecs.items()})
+
+    def to_row(self) -> dict[str, Any]:
+        name: str
+        encode: Callable[[Any], Any]
+        return {name: encode(getattr(self, name)) for name, (_, encode) in self._codecs.items()}
+
+    @classmethod
+    def from_profile(cls, profile: Profile) -> 'ProfileRecord':
+        return cls.from_row(vars(profile))
+
+    def to_profile(self) -> Profile:
+        name: str
+        encode: Callable[[Any], Any]
+        return Profile(**{name: encode(getattr(self, name)) for name, (_, encode) in ProfileRecord._codecs.items()})
+
+
+_databases: dict[pathlib.Path, 'dataset.Database'] = dict()
+_databases_lock: threading.Lock = threading.Lock()
+
+
+def connect_database(path: pathlib.Path) -> 'dataset.Database':
+    import dataset
+
+    key: pathlib.Path = path.resolve()
+    with _databases_lock:
+        if key not in _databases:
+            _databases[key] = dataset.connect(f'sqlite:///{str(path)}')
+        return _databases[key]
+
+
+def _open_table(database: 'dataset.Database', name: str) -> 'dataset.Table':
+    table: 'dataset.Table' = database.create_table(name)
+    table.table  # Reflects the table, or creates it if it is absent
+    table.create_index(['id'])
+    return table
+
+
 class ProfileDatabase(Singleton):
     def __init__(self, path: pathlib.Path):
         self.path: pathlib.Path = path
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'profile' not in tx.tables:
-                tx.create_table('profile')
+        self.database: 'dataset.Database' = connect_database(self.path)
+        self.table: 'dataset.Table' = _open_table(self.database, 'profile')
 
-    def add(self, profile: Profile) -> None:
+    def add(self, profile: Profile) -> int:
         profile_dict: dict[str, Any] = dataclasses.asdict(profile)
-        profile_dict['id'] = None
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            profile_table: dataset.Table = tx.get_table('profile')
-            profile_table.insert(profile_dict)
-            profile_table.create_index(['id'])
+        del profile_dict['id']
+        with self.database:
+            return self.table.insert(profile_dict)
 
     def edit(self, profile: Profile) -> None:
         if not self.path.exists():
             raise FileNotFoundError("database is absent")
         if not isinstance(profile.id, int):
             raise KeyError("no id provided")
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'profile' not in tx.tables:
-                raise ValueError('profile table is not in the database yet')
-            profile_table: dataset.Table = tx.get_table('profile')
-            profile_table.update(dataclasses.asdict(profile), ['id'])
+        if not self.table.exists:
+            raise ValueError('profile table is not in the database yet')
+        with self.database:
+            self.table.update(dataclasses.asdict(profile), ['id'])
 
     def get(self, id_: int) -> Profile:
         if not self.path.exists():
             raise FileNotFoundError("database is absent")
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'profile' not in tx.tables:
-                raise ValueError('profile table is not in the database yet')
-            profile_table: dataset.Table = tx.get_table('profile')
-            res: Optional[dict[str, Any]] = profile_table.find_one(id=id_)
-            if not res:
-                raise ValueError("no such id")
-            return dacite.from_dict(data_class=Profile, data=res)
+        if not self.table.exists:
+            raise ValueError('profile table is not in the database yet')
+        res: Optional[dict[str, Any]] = self.table.find_one(id=id_)
+        if not res:
+            raise ValueError("no such id")
+        import dacite
+        return dacite.from_dict(data_class=Profile, data=res)
 
     def get_all(self) -> Iterable[Profile]:
         if not self.path.exists():
             raise FileNotFoundError("database is absent")
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'profile' not in tx.tables:
-                return map(lambda _: _, ())
-            profile_table: dataset.Table = tx.get_table('profile')
-            return map(lambda x: dacite.from_dict(data_class=Profile, data=x), profile_table.find())
+        if not self.table.exists:
+            return map(lambda _: _, ())
+        import dacite
+        return map(lambda x: dacite.from_dict(data_class=Profile, data=x), self.table.find())
 
     def remove(self, profile: Profile) -> None:
         if not self.path.exists():
             raise FileNotFoundError("database is absent")
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'profile' not in tx.tables:
-                raise ValueError('profile table is not in the database yet')
-            profile_table: dataset.Table = tx.get_table('profile')
-            if not profile_table.find_one(id=profile.id):
+        if not self.table.exists:
+            raise ValueError('profile table is not in the database yet')
+        with self.database:
+            if not self.table.delete(id=profile.id):
                 raise ValueError("no such id")
-            profile_table.delete(id=profile.id)
 
 
 @dataclasses.dataclass
@@ -102,62 +170,49 @@ class Command:
 class CommandDatabase(Singleton):
     def __init__(self, path: pathlib.Path):
         self.path: pathlib.Path = path
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'command' not in tx.tables:
-                tx.create_table('command')
+        self.database: 'dataset.Database' = connect_database(self.path)
+        self.table: 'dataset.Table' = _open_table(self.database, 'command')
 
-    def add(self, command: Command) -> None:
+    def add(self, command: Command) -> int:
         command_dict: dict[str, Any] = dataclasses.asdict(command)
-        command_dict['id'] = None
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            command_table: dataset.Table = tx.get_table('command')
-            command_table.insert(command_dict)
-            command_table.create_index(['id'])
+        del command_dict['id']
+        with self.database:
+            return self.table.insert(command_dict)
 
     def edit(self, command: Command) -> None:
         if not self.path.exists():
             raise FileNotFoundError("database is absent")
         if not isinstance(command.id, int):
             raise KeyError("no id provided")
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'command' not in tx.tables:
-                raise ValueError('command table is not in the database yet')
-            command_table: dataset.Table = tx.get_table('command')
-            command_table.update(dataclasses.asdict(command), ['id'])
+        if not self.table.exists:
+            raise ValueError('command table is not in the database yet')
+        with self.database:
+            self.table.update(dataclasses.asdict(command), ['id'])
 
     def get(self, id_: int) -> Command:
         if not self.path.exists():
             raise FileNotFoundError("database is absent")
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'command' not in tx.tables:
-                raise ValueError('command table is not in the database yet')
-            command_table: dataset.Table = tx.get_table('command')
-            res: Optional[dict[str, Any]] = command_table.find_one(id=id_)
-            if not res:
-                raise ValueError("no such id")
-            return dacite.from_dict(data_class=Command, data=res)
+        if not self.table.exists:
+            raise ValueError('command table is not in the database yet')
+        res: Optional[dict[str, Any]] = self.table.find_one(id=id_)
+        if not res:
+            raise ValueError("no such id")
+        import dacite
+        return dacite.from_dict(data_class=Command, data=res)
 
     def get_all(self) -> Iterable[Command]:
         if not self.path.exists():
             raise FileNotFoundError("database is absent")
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'command' not in tx.tables:
-                return map(lambda _: _, ())
-            command_table: dataset.Table = tx.get_table('command')
-            return map(lambda x: dacite.from_dict(data_class=Command, data=x), command_table.find())
+        if not self.table.exists:
+            return map(lambda _: _, ())
+        import dacite
+        return map(lambda x: dacite.from_dict(data_class=Command, data=x), self.table.find())
 
     def remove(self, command: Command) -> None:
         if not self.path.exists():
             raise FileNotFoundError("database is absent")
-        tx: dataset.Database
-        with dataset.connect(f'sqlite:///{str(self.path)}') as tx:
-            if 'command' not in tx.tables:
-                raise ValueError('command table is not in the database yet')
-            command_table: dataset.Table = tx.get_table('command')
-            if not command_table.find_one(id=command.id):
+        if not self.table.exists:
+            raise ValueError('command table is not in the database yet')
+        with self.database:
+            if not self.table.delete(id=command.id):
                 raise ValueError("no such id")
-            command_table.delete(id=command.id)
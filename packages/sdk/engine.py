@@ -0,0 +1,287 @@
+import collections
+import logging
+import os
+import queue
+import selectors
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import serial
+
+from .capture import RawCaptureSink
+from .framing import LineFramer
+from .serial import FreezeDripSerialData, FreezeDripSerialParser, FreezeDripSerialResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class FreezeDripPort:
+    def __init__(
+            self,
+            engine: 'FreezeDripEngine',
+            port_name: str,
+            on_lines: Optional[Callable[['FreezeDripPort', list[str]], Any]] = None,
+            on_data: Optional[Callable[
+                ['FreezeDripPort', Optional[FreezeDripSerialData], list[FreezeDripSerialResponse]], Any]] = None,
+            capture: Optional[RawCaptureSink] = None,
+            timeout: float = 1.0,
+            fallback_delay: float = 0.1):
+        self.engine: 'FreezeDripEngine' = engine
+        self.port_name: str = port_name
+        self.on_lines: Optional[Callable[['FreezeDripPort', list[str]], Any]] = on_lines
+        self.on_data: Optional[Callable[
+            ['FreezeDripPort', Optional[FreezeDripSerialData], list[FreezeDripSerialResponse]], Any]] = on_data
+        self.capture: Optional[RawCaptureSink] = capture
+        self.timeout: float = timeout
+        self.fallback_delay: float = fallback_delay
+        self.parser: FreezeDripSerialParser = FreezeDripSerialParser()
+        self.serial: serial.Serial = serial.Serial(port_name, baudrate=115200, timeout=0)
+        self.fd: int = self.serial.fileno()
+        self.commands: collections.deque[str] = collections.deque()
+        self.closed: bool = False
+        self.framer: LineFramer = LineFramer()
+        self._output: bytearray = bytearray()
+        self._awaiting: bool = False
+        self._acknowledged: bool = False
+        self._sent_at: float = 0.0
+        self._last_activity: float = 0.0
+        # When the replies still owed by commands that stopped waiting for them stop being expected
+        self._late_replies: collections.deque[float] = collections.deque()
+
+    def send(self, output: str) -> 'FreezeDripPort':
+        self.engine.call(self._queue_output, f'{output}\r\n'.encode())
+        return self
+
+    def submit(self, *commands: str) -> 'FreezeDripPort':
+        self.engine.call(self.commands.extend, commands)
+        return self
+
+    def close(self) -> 'FreezeDripPort':
+        self.engine.call(self.engine._unregister, self)
+        return self
+
+    def _queue_output(self, output: bytes) -> None:
+        self._output += output
+        self.engine._update(self)
+
+    def _readinto(self, buffer: memoryview) -> int:
+        return os.readv(self.fd, [buffer])
+
+    def _on_input(self) -> None:
+        raw_lines: list[bytes] = self.framer.lines()
+        if not raw_lines:
+            return
+        lines: list[str] = list()
+        now: float = time.monotonic()
+        raw_line: bytes
+        for raw_line in raw_lines:
+            c: str
+            line: str = ''.join(c for c in raw_line.decode(errors='ignore').strip() if c.isprintable())
+            if line in FreezeDripSerialParser._RESPONSES:
+                self._on_reply(now)
+            lines.append(line)
+        self._last_activity = now
+        # Every port shares the engine thread, so a failing callback must not take the others down with it
+        if self.on_lines:
+            try:
+                self.on_lines(self, lines)
+            except Exception:
+                logger.exception("Line callback failed for %s", self.port_name)
+        if self.on_data:
+            data: Optional[FreezeDripSerialData]
+            responses: list[FreezeDripSerialResponse]
+            data, responses = self.parser.parse_lines(lines)
+            if data or responses:
+                try:
+                    self.on_data(self, data, responses)
+                except Exception:
+                    logger.exception("Data callback failed for %s", self.port_name)
+
+    def _on_reply(self, now: float) -> None:
+        while self._late_replies and self._late_replies[0] <= now:
+            self._late_replies.popleft()
+        # Replies come in command order, so the oldest one owed is answered before the current command
+        if self._late_replies:
+            self._late_replies.popleft()
+        elif self._awaiting:
+            self._acknowledged = True
+
+    def _dispatch(self, now: float) -> Optional[float]:
+        if self._awaiting:
+            deadline: float = min(self._sent_at + self.timeout, self._last_activity + self.fallback_delay)
+            if not self._acknowledged and now < deadline:
+                return deadline - now
+            self._awaiting = False
+            if not self._acknowledged:
+                self._late_replies.append(now + self.timeout)
+        if not self.commands:
+            return None
+        self._queue_output(f'{self.commands.popleft()}\r\n'.encode())
+        self._awaiting = True
+        self._acknowledged = False
+        self._sent_at = now
+        self._last_activity = now
+        return min(self.timeout, self.fallback_delay)
+
+
+class FreezeDripEngine:
+    def __init__(self, read_size: int = 4096):
+        self.read_size: int = read_size
+        self.selector: selectors.BaseSelector = selectors.DefaultSelector()
+        self.ports: dict[int, FreezeDripPort] = dict()
+        self.stopped: bool = True
+        self._calls: queue.SimpleQueue = queue.SimpleQueue()
+        self._wake_reader: int
+        self._wake_writer: int
+        self._wake_reader, self._wake_writer = os.pipe()
+        os.set_blocking(self._wake_reader, False)
+        os.set_blocking(self._wake_writer, False)
+        self.selector.register(self._wake_reader, selectors.EVENT_READ)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'FreezeDripEngine':
+        self.stopped = False
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def open(
+            self,
+            port_name: str,
+            on_lines: Optional[Callable[[FreezeDripPort, list[str]], Any]] = None,
+            on_data: Optional[Callable[
+                [FreezeDripPort, Optional[FreezeDripSerialData], list[FreezeDripSerialResponse]], Any]] = None,
+            capture: Optional[RawCaptureSink] = None) -> FreezeDripPort:
+        port: FreezeDripPort = FreezeDripPort(self, port_name, on_lines, on_data, capture)
+        self.call(self._register, port)
+        return port
+
+    def call(self, func: Callable[..., Any], *args: Any) -> None:
+        self._calls.put((func, args))
+        self.wake()
+
+    def wake(self) -> None:
+        try:
+            os.write(self._wake_writer, b'\0')
+        except BlockingIOError:
+            pass
+
+    def run(self) -> None:
+        timeout: Optional[float] = None
+        while not self.stopped:
+            key: selectors.SelectorKey
+            events: int
+            for key, events in self.selector.select(timeout):
+                port: Optional[FreezeDripPort] = key.data
+                if port is None:
+                    self._drain_wake()
+                    continue
+                if events & selectors.EVENT_READ and not port.closed:
+                    self._read(port)
+                if events & selectors.EVENT_WRITE and not port.closed:
+                    self._write(port)
+            while not self._calls.empty():
+                func: Callable[..., Any]
+                args: tuple
+                func, args = self._calls.get()
+                try:
+                    func(*args)
+                except Exception:
+                    logger.exception("Posted call %r failed for %s", func, self._port_name_of(func, args))
+            timeout = self._dispatch()
+        port: FreezeDripPort
+        for port in list(self.ports.values()):
+            self._unregister(port)
+
+    def _dispatch(self) -> Optional[float]:
+        now: float = time.monotonic()
+        timeout: Optional[float] = None
+        port: FreezeDripPort
+        for port in self.ports.values():
+            port_timeout: Optional[float] = port._dispatch(now)
+            if port_timeout is not None and (timeout is None or port_timeout < timeout):
+                timeout = port_timeout
+        return timeout
+
+    @staticmethod
+    def _port_name_of(func: Callable[..., Any], args: tuple) -> str:
+        candidate: Any
+        for candidate in (getattr(func, '__self__', None), *args):
+            if isinstance(candidate, FreezeDripPort):
+                return candidate.port_name
+        return 'the engine'
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_reader, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _read(self, port: FreezeDripPort) -> None:
+        try:
+            count: int = port.framer.fill(port._readinto, self.read_size)
+        except BlockingIOError:
+            return
+        except OSError:
+            logger.warning("Cannot read %s", port.port_name, exc_info=True)
+            self._unregister(port)
+            return
+        if not count:
+            self._unregister(port)
+            return
+        if port.capture or logger.isEnabledFor(logging.DEBUG):
+            chunk: bytes = bytes(port.framer.buffer[port.framer.end - count:port.framer.end])
+            if port.capture:
+                port.capture.received(chunk)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s RECEIVED: %r", port.port_name, chunk)
+        port._on_input()
+
+    def _write(self, port: FreezeDripPort) -> None:
+        try:
+            written: int = os.write(port.fd, port._output)
+        except BlockingIOError:
+            return
+        except OSError:
+            logger.warning("Cannot write %s", port.port_name, exc_info=True)
+            self._unregister(port)
+            return
+        if port.capture:
+            port.capture.sent(bytes(port._output[:written]))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s SENDING: %r", port.port_name, port._output[:written])
+        del port._output[:written]
+        self._update(port)
+
+    def _register(self, port: FreezeDripPort) -> None:
+        self.ports[port.fd] = port
+        self.selector.register(port.fd, self._events(port), port)
+
+    def _update(self, port: FreezeDripPort) -> None:
+        if port.fd in self.ports:
+            self.selector.modify(port.fd, self._events(port), port)
+
+    def _unregister(self, port: FreezeDripPort) -> None:
+        if port.closed:
+            return
+        port.closed = True
+        if self.ports.pop(port.fd, None) is not None:
+            self.selector.unregister(port.fd)
+        port.serial.close()
+
+    @staticmethod
+    def _events(port: FreezeDripPort) -> int:
+        return selectors.EVENT_READ | selectors.EVENT_WRITE if port._output else selectors.EVENT_READ
+
+    def close(self) -> 'FreezeDripEngine':
+        self.stopped = True
+        self.wake()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.selector.close()
+        os.close(self._wake_reader)
+        os.close(self._wake_writer)
+        return self
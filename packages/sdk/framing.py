@@ -0,0 +1,61 @@
+import re
+from typing import Callable, Optional
+
+
+class LineFramer:
+    _TERMINATOR: re.Pattern = re.compile(rb'\r\n|[\r\n]')
+
+    def __init__(self, size: int = 1 << 16):
+        self.buffer: bytearray = bytearray(size)
+        self.start: int = 0
+        self.end: int = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def fill(self, readinto: Callable[[memoryview], Optional[int]], size: int) -> int:
+        self._reserve(size)
+        view: memoryview
+        with memoryview(self.buffer) as view:
+            free: memoryview = view[self.end:self.end + size]
+            try:
+                count: int = readinto(free) or 0
+            finally:
+                free.release()
+        self.end += count
+        return count
+
+    def feed(self, chunk: bytes) -> None:
+        self._reserve(len(chunk))
+        self.buffer[self.end:self.end + len(chunk)] = chunk
+        self.end += len(chunk)
+
+    def lines(self) -> list[bytes]:
+        lines: list[bytes] = list()
+        position: int = self.start
+        view: memoryview
+        with memoryview(self.buffer) as view:
+            match: re.Match
+            for match in self._TERMINATOR.finditer(self.buffer, self.start, self.end):
+                if match.end() == self.end and match.group() == b'\r':
+                    # The LF of a CRLF may still be on its way.
+                    break
+                lines.append(view[position:match.start()].tobytes())
+                position = match.end()
+        self.start = position
+        if self.start == self.end:
+            self.start = self.end = 0
+        return lines
+
+    def clear(self) -> None:
+        self.start = self.end = 0
+
+    def _reserve(self, size: int) -> None:
+        if self.end + size <= len(self.buffer):
+            return
+        pending: int = self.end - self.start
+        if self.start:
+            self.buffer[:pending] = self.buffer[self.start:self.end]
+            self.start, self.end = 0, pending
+        if pending + size > len(self.buffer):
+            self.buffer.extend(bytes(pending + size - len(self.buffer)))
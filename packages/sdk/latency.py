@@ -0,0 +1,131 @@
+import datetime
+import json
+import pathlib
+import time
+from typing import Any, Optional, Union
+
+
+class LatencyHistogram:
+    # Values below 16 get a bucket each, larger ones 8 buckets per power of two, so a percentile is within 12.5%
+    SUB_BUCKET_BITS: int = 3
+    SUB_BUCKETS: int = 1 << SUB_BUCKET_BITS
+
+    def __init__(self):
+        self.counts: list[int] = [0] * (64 * self.SUB_BUCKETS)
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+        self.last: int = 0
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        shift: int = value.bit_length() - cls.SUB_BUCKET_BITS - 1
+        if shift <= 0:
+            return value
+        return shift * cls.SUB_BUCKETS + (value >> shift)
+
+    @classmethod
+    def _bounds(cls, index: int) -> tuple[int, int]:
+        if index < cls.SUB_BUCKETS * 2:
+            return index, index
+        shift: int = index // cls.SUB_BUCKETS - 1
+        mantissa: int = index - shift * cls.SUB_BUCKETS
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        if value < 0:
+            value = 0
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        if not self.count:
+            return 0
+        rank: float = self.count * percent / 100
+        seen: int = 0
+        index: int
+        count: int
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(self._bounds(index)[1], self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def buckets(self) -> list[tuple[int, int, int]]:
+        index: int
+        count: int
+        return [(*self._bounds(index), count) for index, count in enumerate(self.counts) if count]
+
+
+class StampedLines(list):
+    __slots__ = ('read_ns', 'emitted_ns')
+
+    def __init__(self, lines: list[str], read_ns: int, emitted_ns: int):
+        super().__init__(lines)
+        self.read_ns: int = read_ns
+        self.emitted_ns: int = emitted_ns
+
+
+class LatencyMonitor:
+    def __init__(self):
+        self.stages: dict[str, LatencyHistogram] = dict()
+        self.depths: dict[str, LatencyHistogram] = dict()
+        self.started_at: datetime.datetime = datetime.datetime.now()
+
+    def record(self, stage: str, start_ns: int, end_ns: Optional[int] = None) -> int:
+        if end_ns is None:
+            end_ns = time.monotonic_ns()
+        histogram: Optional[LatencyHistogram] = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = LatencyHistogram()
+        histogram.record(end_ns - start_ns)
+        return end_ns
+
+    def record_depth(self, name: str, depth: int) -> None:
+        histogram: Optional[LatencyHistogram] = self.depths.get(name)
+        if histogram is None:
+            histogram = self.depths[name] = LatencyHistogram()
+        histogram.record(depth)
+
+    def reset(self) -> None:
+        # Readers and writers on other threads may still hold the old histograms, so start new ones
+        self.stages = dict()
+        self.depths = dict()
+        self.started_at = datetime.datetime.now()
+
+    def snapshot(self) -> dict[str, Any]:
+        name: str
+        histogram: LatencyHistogram
+        return {
+            'started_at': self.started_at.isoformat(),
+            'stages': {
+                name: {
+                    'count': histogram.count,
+                    'mean_us': histogram.mean() / 1e3,
+                    'p50_us': histogram.percentile(50) / 1e3,
+                    'p99_us': histogram.percentile(99) / 1e3,
+                    'max_us': histogram.max / 1e3,
+                } for name, histogram in list(self.stages.items())},
+            'depths': {
+                name: {
+                    'count': histogram.count,
+                    'last': histogram.last,
+                    'p50': histogram.percentile(50),
+                    'p99': histogram.percentile(99),
+                    'max': histogram.max,
+                } for name, histogram in list(self.depths.items())},
+        }
+
+    def export(self, path: Union[str, pathlib.Path]) -> None:
+        snapshot: dict[str, Any] = self.snapshot()
+        name: str
+        histogram: LatencyHistogram
+        snapshot['buckets_ns'] = {name: histogram.buckets() for name, histogram in list(self.stages.items())}
+        pathlib.Path(path).write_text(json.dumps(snapshot, indent=2))
@@ -0,0 +1,155 @@
+import time
+import urllib.parse
+from typing import Iterator, Optional
+
+from serial.serialutil import PortNotOpenError, SerialBase, SerialException
+
+from .capture import RAW_CAPTURE_RECEIVED, read_raw_capture
+
+
+class Serial(SerialBase):
+    def __init__(self, *args, **kwargs):
+        self.path: str = ''
+        self.speed: float = 1.0
+        self.records: Optional[Iterator[tuple[int, bytes, bytes]]] = None
+        self._pending: bytearray = bytearray()
+        self._next_record: Optional[tuple[int, bytes]] = None
+        self._first_time_ns: Optional[int] = None
+        self._started_ns: int = 0
+        self._read_cancelled: bool = False
+        super().__init__(*args, **kwargs)
+
+    def open(self) -> None:
+        if self._port is None:
+            raise SerialException("Port must be configured before it can be used.")
+        if self.is_open:
+            raise SerialException("Port is already open.")
+        self.from_url(self._port)
+        self.records = (
+            (time_ns, payload) for time_ns, direction, payload in read_raw_capture(self.path)
+            if direction == RAW_CAPTURE_RECEIVED)
+        self._pending.clear()
+        try:
+            self._next_record = next(self.records, None)
+        except OSError as e:
+            self.records = None
+            raise SerialException(f"Cannot read capture {self.path!r}: {e}") from e
+        self._first_time_ns = self._next_record[0] if self._next_record else None
+        self._started_ns = time.monotonic_ns()
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+        if self.records:
+            self.records.close()
+            self.records = None
+        super().close()
+
+    def from_url(self, url: str) -> None:
+        parts: urllib.parse.SplitResult = urllib.parse.urlsplit(url)
+        if parts.scheme != 'replay':
+            raise SerialException(f"expected replay://<capture path>[?speed=<factor>|max], not {url!r}")
+        self.path = urllib.parse.unquote(parts.netloc + parts.path)
+        option: str
+        values: list[str]
+        for option, values in urllib.parse.parse_qs(parts.query, True).items():
+            if option != 'speed':
+                raise SerialException(f"unknown option {option!r} in {url!r}")
+            try:
+                self.speed = 0.0 if values[0] == 'max' else float(values[0])
+            except ValueError:
+                raise SerialException(f"invalid speed {values[0]!r} in {url!r}")
+            if self.speed < 0:
+                raise SerialException(f"invalid speed {values[0]!r} in {url!r}")
+
+    def _due_in(self, time_ns: int) -> float:
+        if not self.speed:
+            return 0.0
+        return ((time_ns - self._first_time_ns) / self.speed - (time.monotonic_ns() - self._started_ns)) / 1e9
+
+    def _fill(self) -> Optional[float]:
+        while self._next_record:
+            due_in: float = self._due_in(self._next_record[0])
+            if due_in > 0:
+                return due_in
+            self._pending += self._next_record[1]
+            self._next_record = next(self.records, None)
+            if not self.speed and len(self._pending) >= 1 << 16:
+                return 0.0
+        return None
+
+    @property
+    def in_waiting(self) -> int:
+        if not self.is_open:
+            raise PortNotOpenError()
+        self._fill()
+        return len(self._pending)
+
+    def read(self, size: int = 1) -> bytes:
+        if not self.is_open:
+            raise PortNotOpenError()
+        deadline: Optional[float] = None if self._timeout is None else time.monotonic() + self._timeout
+        while self.is_open and not self._read_cancelled:
+            due_in: Optional[float] = self._fill()
+            if self._pending:
+                data: bytes = bytes(self._pending[:size])
+                del self._pending[:size]
+                return data
+            if deadline is None:
+                time.sleep(0.1 if due_in is None else min(due_in, 0.1))
+                continue
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(remaining if due_in is None else min(due_in, remaining))
+        self._read_cancelled = False
+        return b''
+
+    def cancel_read(self) -> None:
+        self._read_cancelled = True
+
+    def write(self, data: bytes) -> int:
+        if not self.is_open:
+            raise PortNotOpenError()
+        return len(data)
+
+    def reset_input_buffer(self) -> None:
+        if not self.is_open:
+            raise PortNotOpenError()
+        self._pending.clear()
+
+    def reset_output_buffer(self) -> None:
+        if not self.is_open:
+            raise PortNotOpenError()
+
+    @property
+    def out_waiting(self) -> int:
+        return 0
+
+    def _reconfigure_port(self) -> None:
+        pass
+
+    def _update_break_state(self) -> None:
+        pass
+
+    def _update_rts_state(self) -> None:
+        pass
+
+    def _update_dtr_state(self) -> None:
+        pass
+
+    @property
+    def cts(self) -> bool:
+        return True
+
+    @property
+    def dsr(self) -> bool:
+        return True
+
+    @property
+    def ri(self) -> bool:
+        return False
+
+    @property
+    def cd(self) -> bool:
+        return True
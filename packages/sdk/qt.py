@@ -0,0 +1,7 @@
+from PySide6.QtCore import QObject, Signal
+
+
+class SimpleFreezeDripSerialListener(QObject):
+    signal: Signal = Signal(str)
+    # object rather than list, or Qt would copy StampedLines into a plain list and drop its stamps
+    lines_signal: Signal = Signal(object)
@@ -1,15 +1,30 @@
+import collections
 import dataclasses
+import enum
+import logging
 import queue
 import signal
 import threading
-from typing import Optional, Union
+import time
+from typing import Any, Callable, ClassVar, Iterable, Mapping, Optional, TYPE_CHECKING, Union
 
-from PySide6.QtCore import QObject, Signal
-import serial.tools.list_ports
-import serial.tools.list_ports_common
+import serial
 
-from .data import Profile
-from .util import floatable
+if TYPE_CHECKING:
+    import serial.tools.list_ports_common
+
+from .capture import RawCaptureSink
+from .codec import encode_profile
+from .data import Profile, ProfileRecord
+from .framing import LineFramer
+from .latency import LatencyMonitor, StampedLines
+from .util import floatable, from_tenths, to_tenths
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# serial_for_url() looks up replay:// in protocol_replay of this package
+if __package__ not in serial.protocol_handler_packages:
+    serial.protocol_handler_packages.append(__package__)
 
 
 @dataclasses.dataclass
@@ -29,116 +44,192 @@ class FreezeDripSerialData(Profile):
     setup_flag: Optional[str] = None
 
 
-def get_available_serial_ports() -> list[serial.tools.list_ports_common.ListPortInfo]:
+class FreezeDripStatus(enum.IntFlag):
+    HEARTBEAT = 0b1
+    LOW_TEMP = 0b10
+    LOW_BAT = 0b100
+    SETUP = 0b1_0000
+    CD = 0b1000_0000
+
+
+@dataclasses.dataclass(slots=True)
+class FreezeDripSerialRecord(ProfileRecord):
+    status: Optional[FreezeDripStatus] = None
+    temp: Optional[int] = None
+    cd_battery_volt: Optional[int] = None
+    rts_battery_volt: Optional[int] = None
+
+    _codecs: ClassVar[dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]]] = {
+        **ProfileRecord._codecs,
+        'status': (
+            lambda x: None if x is None else FreezeDripStatus(int(x, 16)),
+            lambda x: None if x is None else f"{x:02X}"),
+        'temp': (to_tenths, from_tenths),
+        'cd_battery_volt': (to_tenths, from_tenths),
+        'rts_battery_volt': (to_tenths, from_tenths),
+    }
+    _flags: ClassVar[dict[str, FreezeDripStatus]] = {
+        'heartbeat_flag': FreezeDripStatus.HEARTBEAT,
+        'low_temp_flag': FreezeDripStatus.LOW_TEMP,
+        'low_bat_flag': FreezeDripStatus.LOW_BAT,
+        'setup_flag': FreezeDripStatus.SETUP,
+    }
+
+    def to_row(self) -> dict[str, Any]:
+        row: dict[str, Any] = ProfileRecord.to_row(self)
+        name: str
+        flag: FreezeDripStatus
+        for name, flag in self._flags.items():
+            row[name] = None if self.status is None else str(flag in self.status)
+        return row
+
+    @classmethod
+    def from_data(cls, data: 'FreezeDripSerialData') -> 'FreezeDripSerialRecord':
+        return cls.from_row(vars(data))
+
+    def to_data(self) -> 'FreezeDripSerialData':
+        return FreezeDripSerialData(**self.to_row())
+
+
+def get_available_serial_ports() -> list['serial.tools.list_ports_common.ListPortInfo']:
+    import serial.tools.list_ports
     return serial.tools.list_ports.comports()
 
 
 class FreezeDripSerialParser:
+    _SEPARATOR: str = ' : '
+    _RESPONSES: frozenset[str] = frozenset(('OK', 'ERROR'))
+    _RECEIVED_BATTERY_VALUE_PREFIX: str = 'Received Battery Value: '
+    _FLAGS: tuple[str, str] = (str(False), str(True))
+    _FIELDS: dict[str, tuple[str, str]] = {
+        'Fahrenheit Temperature': ('temp', " 'F"),
+        'Temp. level 2 threshold': ('temp_lvl_2_thold', " 'F"),
+        'Temp. level 3 threshold': ('temp_lvl_3_thold', " 'F"),
+        'Temp. level 4 threshold': ('temp_lvl_4_thold', " 'F"),
+        'Temperature sensitivity': ('temp_sensitivity', " 'F"),
+        'Temp. detection interval': ('temp_detection_interval', ' Secs'),
+        'Scale of S1 and S3': ('scale_of_pump_on_time', ' X'),
+        'Pump on time of level 2': ('lvl_2_pump_on_time', ' Secs'),
+        'Pump off time of level 2': ('lvl_2_pump_off_time', ' Secs'),
+        'Pump on time of level 3': ('lvl_3_pump_on_time', ' Secs'),
+        'Pump off time of level 3': ('lvl_3_pump_off_time', ' Secs'),
+        'Interval of the Lost alarm': ('lost_alarm_interval', ' Secs'),
+        'H.B./L. Bat. interval': ('heartbeat_interval', ' Mins'),
+        'Setup signal interval': ('setup_duration', ' Mins'),
+    }
+
     def __init__(self):
-        self.status: str = ''
+        self._status: str = ''
+        self._status_code: int = 0
+        self._handlers: dict[str, Callable[[str], Optional[dict[str, str]]]] = {
+            'Status': self._parse_status,
+            'Current Battery Voltage': self._parse_current_battery_voltage,
+            'Low Battery threshold': self._parse_low_battery_thold,
+        }
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str) -> None:
+        self._status_code = int(value, 16) if value else 0
+        self._status = value
 
     def is_cd(self) -> Optional[bool]:
-        if self.status:
-            return bool(int(self.status, 16) & 0b1000_0000)
+        if self._status:
+            return bool(self._status_code & 0b1000_0000)
 
     def is_rts(self) -> Optional[bool]:
-        if self.status:
-            return not self.is_cd()
+        if self._status:
+            return not self._status_code & 0b1000_0000
+
+    def _parse_status(self, value: str) -> dict[str, str]:
+        status: str = value.removesuffix(' Hex')
+        code: int = int(status, 16)
+        self._status, self._status_code = status, code
+        return {
+            'status': status,
+            'heartbeat_flag': self._FLAGS[code & 0b1],
+            'low_temp_flag': self._FLAGS[code >> 1 & 0b1],
+            'low_bat_flag': self._FLAGS[code >> 2 & 0b1],
+            'setup_flag': self._FLAGS[code >> 4 & 0b1],
+        }
+
+    def _parse_current_battery_voltage(self, value: str) -> Optional[dict[str, str]]:
+        if not self._status:
+            return
+        bat_volt: str = value.removesuffix(' Volts')
+        if not floatable(bat_volt) or int(float(bat_volt) * 10) == 0xFF:
+            return
+        return {'cd_battery_volt': bat_volt} if self._status_code & 0b1000_0000 else {'rts_battery_volt': bat_volt}
+
+    def _parse_low_battery_thold(self, value: str) -> dict[str, str]:
+        low_battery_thold: str = value.removesuffix(' Volts')
+        if self.is_cd():
+            low_battery_thold = str(float(low_battery_thold) * 2)
+        return {'low_battery_thold': low_battery_thold}
+
+    def _parse_received_battery_value(self, line: str) -> Optional[dict[str, str]]:
+        if not self.is_cd():
+            return
+        return {'rts_battery_volt': line[len(self._RECEIVED_BATTERY_VALUE_PREFIX):].removesuffix(' Volts')}
+
+    def _parse_fields(self, line: str) -> Optional[dict[str, str]]:
+        label: str
+        separator: str
+        value: str
+        label, separator, value = line.partition(self._SEPARATOR)
+        if separator:
+            field: Optional[tuple[str, str]] = self._FIELDS.get(label)
+            if field:
+                return {field[0]: value.removesuffix(field[1])}
+            handler: Optional[Callable[[str], Optional[dict[str, str]]]] = self._handlers.get(label)
+            if handler:
+                return handler(value)
+        if line.startswith(self._RECEIVED_BATTERY_VALUE_PREFIX):
+            return self._parse_received_battery_value(line)
 
     def parse_line(self, line: str) -> Optional[Union[FreezeDripSerialData, FreezeDripSerialResponse]]:
-        if line in ['OK', 'ERROR']:
+        if line in self._RESPONSES:
             return FreezeDripSerialResponse(line)
+        fields: Optional[dict[str, str]] = self._parse_fields(line)
+        if fields:
+            return FreezeDripSerialData(**fields)
+
+    def parse_lines(
+            self,
+            lines: Iterable[str]) -> tuple[Optional[FreezeDripSerialData], list[FreezeDripSerialResponse]]:
+        fields: dict[str, str] = dict()
+        responses: list[FreezeDripSerialResponse] = list()
+        line: str
+        for line in lines:
+            if line in self._RESPONSES:
+                responses.append(FreezeDripSerialResponse(line))
+                continue
+            line_fields: Optional[dict[str, str]] = self._parse_fields(line)
+            if line_fields:
+                fields.update(line_fields)
+        return FreezeDripSerialData(**fields) if fields else None, responses
 
-        if line.startswith('Status : '):
-            self.status = line.removeprefix('Status : ').removesuffix(' Hex')
-            return FreezeDripSerialData(
-                status=self.status,
-                heartbeat_flag=str(bool(int(self.status, 16) & 0b1)),
-                low_temp_flag=str(bool(int(self.status, 16) & 0b10)),
-                low_bat_flag=str(bool(int(self.status, 16) & 0b100)),
-                setup_flag=str(bool(int(self.status, 16) & 0b1_0000)))
-        if line.startswith('Fahrenheit Temperature : '):
-            return FreezeDripSerialData(
-                temp=line.removeprefix('Fahrenheit Temperature : ').removesuffix(" 'F"))
-        if line.startswith('Received Battery Value: '):
-            if not self.is_cd():
-                return
-            return FreezeDripSerialData(
-                rts_battery_volt=line.removeprefix('Received Battery Value: ').removesuffix(' Volts'))
-        if line.startswith('Current Battery Voltage : '):
-            if not self.status:
-                return
-            bat_volt: str = line.removeprefix('Current Battery Voltage : ').removesuffix(' Volts')
-            if not floatable(bat_volt) or int(float(bat_volt) * 10) == 0xFF:
-                return
-            return FreezeDripSerialData(cd_battery_volt=bat_volt) if self.is_cd() \
-                else FreezeDripSerialData(rts_battery_volt=bat_volt)
-
-        if line.startswith('Temp. level 2 threshold : '):
-            return FreezeDripSerialData(
-                temp_lvl_2_thold=line.removeprefix('Temp. level 2 threshold : ').removesuffix(" 'F"))
-        if line.startswith('Temp. level 3 threshold : '):
-            return FreezeDripSerialData(
-                temp_lvl_3_thold=line.removeprefix('Temp. level 3 threshold : ').removesuffix(" 'F"))
-        if line.startswith('Temp. level 4 threshold : '):
-            return FreezeDripSerialData(
-                temp_lvl_4_thold=line.removeprefix('Temp. level 4 threshold : ').removesuffix(" 'F"))
-        if line.startswith('Temperature sensitivity : '):
-            return FreezeDripSerialData(
-                temp_sensitivity=line.removeprefix('Temperature sensitivity : ').removesuffix(" 'F"))
-        if line.startswith('Temp. detection interval : '):
-            return FreezeDripSerialData(
-                temp_detection_interval=line.removeprefix('Temp. detection interval : ').removesuffix(' Secs'))
-        if line.startswith('Scale of S1 and S3 : '):
-            return FreezeDripSerialData(
-                scale_of_pump_on_time=line.removeprefix('Scale of S1 and S3 : ').removesuffix(' X'))
-        if line.startswith('Pump on time of level 2 : '):
-            return FreezeDripSerialData(
-                lvl_2_pump_on_time=line.removeprefix('Pump on time of level 2 : ').removesuffix(' Secs'))
-        if line.startswith('Pump off time of level 2 : '):
-            return FreezeDripSerialData(
-                lvl_2_pump_off_time=line.removeprefix('Pump off time of level 2 : ').removesuffix(' Secs'))
-        if line.startswith('Pump on time of level 3 : '):
-            return FreezeDripSerialData(
-                lvl_3_pump_on_time=line.removeprefix('Pump on time of level 3 : ').removesuffix(' Secs'))
-        if line.startswith('Pump off time of level 3 : '):
-            return FreezeDripSerialData(
-                lvl_3_pump_off_time=line.removeprefix('Pump off time of level 3 : ').removesuffix(' Secs'))
-        if line.startswith('Low Battery threshold : '):
-            low_battery_thold: str = line.removeprefix('Low Battery threshold : ').removesuffix(' Volts')
-            if self.is_cd():
-                low_battery_thold = str(float(low_battery_thold) * 2)
-            return FreezeDripSerialData(low_battery_thold=low_battery_thold)
-        if line.startswith('Interval of the Lost alarm : '):
-            return FreezeDripSerialData(
-                lost_alarm_interval=line.removeprefix('Interval of the Lost alarm : ').removesuffix(' Secs'))
-        if line.startswith('H.B./L. Bat. interval : '):
-            return FreezeDripSerialData(
-                heartbeat_interval=line.removeprefix('H.B./L. Bat. interval : ').removesuffix(' Mins'))
-        if line.startswith('Setup signal interval : '):
-            return FreezeDripSerialData(
-                setup_duration=line.removeprefix('Setup signal interval : ').removesuffix(' Mins'))
-
-    def parse_profile(self, profile: Profile) -> str:
-        profile_str: str = '#'
-        profile_str += 'B' + ',' + f"{int(float(profile.low_battery_thold)*10):02X}" + ','
-        profile_str += 'RBV' + ',' + 'FF' + ','
-        profile_str += 'CBV' + ',' + 'FF' + ','
-        profile_str += 'S' + ',' + f"{int(profile.setup_duration):02X}" + ','
-        profile_str += 'H' + ',' + f"{int(profile.heartbeat_interval):02X}" + ','
-        profile_str += 'T' + ',' + f"{int(float(profile.temp_sensitivity)*10):02X}" + ','
-        profile_str += 'U' + ',' + f"{int(float(profile.scale_of_pump_on_time)*10):02X}" + ','
-        profile_str += 'L' + ',' + f"{int(profile.lost_alarm_interval):04X}" + ','
-        profile_str += 'D' + ',' + f"{int(profile.temp_detection_interval):04X}" + ','
-        profile_str += 'T1' + ',' + f"{int(float(profile.temp_lvl_2_thold)*10):04X}" + ','
-        profile_str += 'T2' + ',' + f"{int(float(profile.temp_lvl_3_thold)*10):04X}" + ','
-        profile_str += 'T3' + ',' + f"{int(float(profile.temp_lvl_4_thold)*10):04X}" + ','
-        profile_str += 'S1' + ',' + f"{int(profile.lvl_2_pump_on_time):04X}" + ','
-        profile_str += 'S2' + ',' + f"{int(profile.lvl_2_pump_off_time):04X}" + ','
-        profile_str += 'S3' + ',' + f"{int(profile.lvl_3_pump_on_time):04X}" + ','
-        profile_str += 'S4' + ',' + f"{int(profile.lvl_3_pump_off_time):04X}"
-        profile_str += '$'
-        return profile_str
+    def parse_profile(self, profile: Union[Profile, ProfileRecord]) -> str:
+        if isinstance(profile, ProfileRecord):
+            return encode_profile(profile)
+        return encode_profile(ProfileRecord(
+            low_battery_thold=int(float(profile.low_battery_thold) * 10),
+            setup_duration=int(profile.setup_duration),
+            heartbeat_interval=int(profile.heartbeat_interval),
+            temp_sensitivity=int(float(profile.temp_sensitivity) * 10),
+            scale_of_pump_on_time=int(float(profile.scale_of_pump_on_time) * 10),
+            lost_alarm_interval=int(profile.lost_alarm_interval),
+            temp_detection_interval=int(profile.temp_detection_interval),
+            temp_lvl_2_thold=int(float(profile.temp_lvl_2_thold) * 10),
+            temp_lvl_3_thold=int(float(profile.temp_lvl_3_thold) * 10),
+            temp_lvl_4_thold=int(float(profile.temp_lvl_4_thold) * 10),
+            lvl_2_pump_on_time=int(profile.lvl_2_pump_on_time),
+            lvl_2_pump_off_time=int(profile.lvl_2_pump_off_time),
+            lvl_3_pump_on_time=int(profile.lvl_3_pump_on_time),
+            lvl_3_pump_off_time=int(profile.lvl_3_pump_off_time)))
 
 
 class FreezeDripSerial:
@@ -146,27 +237,48 @@ class FreezeDripSerial:
             self,
             port_name: str,
             input_queue: Optional[queue.Queue] = None,
-            output_queue: Optional[queue.Queue] = None):
+            output_queue: Optional[queue.Queue] = None,
+            capture: Optional[RawCaptureSink] = None,
+            read_timeout: float = 0.1,
+            latency: Optional[LatencyMonitor] = None):
         signal.signal(signal.SIGTERM, self.signal_handler)
-        self.serial: serial.Serial = serial.Serial(port_name, baudrate=115200)
+        self.serial: serial.SerialBase = serial.serial_for_url(port_name, baudrate=115200, timeout=read_timeout)
         self.input_queue: Optional[queue.Queue] = input_queue
         self.output_queue: Optional[queue.Queue] = output_queue
+        self.capture: Optional[RawCaptureSink] = capture
+        self.latency: Optional[LatencyMonitor] = latency
+        self.framer: LineFramer = LineFramer()
         self.stopped: bool = False
-        threading.Thread(target=self.receive_loop, daemon=True).start()
+        self._receive_thread: threading.Thread = threading.Thread(target=self.receive_loop, daemon=True)
+        self._receive_thread.start()
         threading.Thread(target=self.send_loop, daemon=True).start()
 
     def signal_handler(self, signum: int, frame):
-        self.stopped = True
-        if self.serial and self.serial.is_open:
-            self.serial.close()
+        self.close()
 
     def receive_loop(self) -> None:
         if not self.input_queue:
             return
         while not self.stopped:
-            input_: bytes = self.serial.readline()
-            print(f"RECEIVED: {input_}")
-            self.input_queue.put(input_)
+            try:
+                count: int = self.framer.fill(self.serial.readinto, max(1, self.serial.in_waiting))
+            except (serial.SerialException, OSError):
+                if self.stopped:
+                    break
+                raise
+            if not count:
+                continue
+            read_ns: int = time.monotonic_ns()
+            if self.capture:
+                self.capture.received(self.framer.buffer[self.framer.end - count:self.framer.end])
+            input_: bytes
+            for input_ in self.framer.lines():
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s RECEIVED: %r", self.serial.port, input_)
+                self.input_queue.put((read_ns, input_))
+            if self.latency:
+                self.latency.record('frame', read_ns)
+                self.latency.record_depth('input queue', self.input_queue.qsize())
 
     def send_loop(self) -> None:
         if not self.output_queue:
@@ -176,61 +288,223 @@ class FreezeDripSerial:
                 output: bytes = self.output_queue.get(timeout=1)
             except queue.Empty:
                 continue
-            print(f"SENDING: {output}")
+            if self.capture:
+                self.capture.sent(output)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s SENDING: %r", self.serial.port, output)
             self.serial.write(output)
 
     def close(self) -> None:
         self.stopped = True
+        if self._receive_thread is not threading.current_thread():
+            # Without a read timeout only cancelling the read lets the receive thread see that it is stopped
+            if self.serial.timeout is None and hasattr(self.serial, 'cancel_read'):
+                self.serial.cancel_read()
+            self._receive_thread.join(None if self.serial.timeout is None else self.serial.timeout + 1)
         if self.serial and self.serial.is_open:
             self.serial.close()
 
 
-class SimpleFreezeDripSerialListener(QObject):
-    signal: Signal = Signal(str)
+class FreezeDripCommandPipeline:
+    def __init__(self, send: Callable[[str], Any], timeout: float = 1.0, fallback_delay: float = 0.1):
+        self.send: Callable[[str], Any] = send
+        self.timeout: float = timeout
+        self.fallback_delay: float = fallback_delay
+        self.commands: queue.Queue = queue.Queue()
+        self.stopped: bool = True
+        self._condition: threading.Condition = threading.Condition()
+        self._acknowledged: bool = False
+        self._last_activity: float = 0.0
+        # When the replies still owed by commands that stopped waiting for them stop being expected
+        self._late_replies: collections.deque[float] = collections.deque()
+
+    def start(self) -> 'FreezeDripCommandPipeline':
+        self.stopped = False
+        threading.Thread(target=self.send_loop, daemon=True).start()
+        return self
+
+    def submit(self, *commands: str) -> 'FreezeDripCommandPipeline':
+        command: str
+        for command in commands:
+            self.commands.put(command)
+        return self
+
+    def on_receive(self, line: str) -> None:
+        with self._condition:
+            now: float = time.monotonic()
+            self._last_activity = now
+            if line in FreezeDripSerialParser._RESPONSES:
+                while self._late_replies and self._late_replies[0] <= now:
+                    self._late_replies.popleft()
+                # Replies come in command order, so the oldest one owed is answered before the current command
+                if self._late_replies:
+                    self._late_replies.popleft()
+                else:
+                    self._acknowledged = True
+            self._condition.notify()
+
+    def send_loop(self) -> None:
+        while not self.stopped:
+            try:
+                command: str = self.commands.get(timeout=1)
+            except queue.Empty:
+                continue
+            with self._condition:
+                self._acknowledged = False
+                self._last_activity = time.monotonic()
+            self.send(command)
+            self.wait_for_acknowledgement()
+            with self._condition:
+                if not self._acknowledged:
+                    self._late_replies.append(time.monotonic() + self.timeout)
+            self.commands.task_done()
+
+    def wait_for_acknowledgement(self) -> bool:
+        with self._condition:
+            deadline: float = self._last_activity + self.timeout
+            while not self._acknowledged and not self.stopped:
+                now: float = time.monotonic()
+                if now >= deadline:
+                    break
+                quiet_at: float = self._last_activity + self.fallback_delay
+                if now >= quiet_at:
+                    break
+                self._condition.wait(min(deadline, quiet_at) - now)
+            return self._acknowledged
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        with self.commands.all_tasks_done:
+            return self.commands.all_tasks_done.wait_for(
+                lambda: not self.commands.unfinished_tasks or self.stopped, timeout)
+
+    def stop(self) -> 'FreezeDripCommandPipeline':
+        with self._condition:
+            self.stopped = True
+            self._condition.notify()
+        with self.commands.all_tasks_done:
+            self.commands.all_tasks_done.notify_all()
+        return self
+
+
+class FreezeDripSignal:
+    def __init__(self):
+        self._slots: list[Callable[..., Any]] = list()
+
+    def connect(self, slot: Callable[..., Any]) -> None:
+        self._slots.append(slot)
+
+    def disconnect(self, slot: Callable[..., Any]) -> None:
+        self._slots.remove(slot)
+
+    def emit(self, *args: Any) -> None:
+        slot: Callable[..., Any]
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class FreezeDripSerialListener:
+    def __init__(self):
+        self.signal: FreezeDripSignal = FreezeDripSignal()
+        self.lines_signal: FreezeDripSignal = FreezeDripSignal()
 
 
 class SimpleFreezeDripSerial:
-    def __init__(self, port_name: str, on_receive_listeners: Optional[list[SimpleFreezeDripSerialListener]] = None):
+    def __init__(
+            self,
+            port_name: str,
+            on_receive_listeners: Optional[list[FreezeDripSerialListener]] = None,
+            batch_interval: float = 0.0,
+            capture: Optional[RawCaptureSink] = None,
+            latency: Optional[LatencyMonitor] = None):
         self.port_name: str = port_name
+        self.batch_interval: float = batch_interval
+        self.capture: Optional[RawCaptureSink] = capture
+        self.latency: Optional[LatencyMonitor] = latency
         self.input_queue: Optional[queue.Queue] = queue.Queue()
         self.output_queue: Optional[queue.Queue] = queue.Queue()
         self.serial: Optional[FreezeDripSerial] = None
         self.stopped: bool = True
-        self._on_receive_listeners: list[SimpleFreezeDripSerialListener] = list()
+        self._on_receive_listeners: list[FreezeDripSerialListener] = list()
         if on_receive_listeners is not None:
             self._on_receive_listeners = on_receive_listeners
+        self.pipeline: FreezeDripCommandPipeline = FreezeDripCommandPipeline(self.send)
 
-    def add_on_receive_listener(self, listener: SimpleFreezeDripSerialListener) -> None:
+    def add_on_receive_listener(self, listener: FreezeDripSerialListener) -> None:
         self._on_receive_listeners.append(listener)
 
     def open(self) -> Optional['SimpleFreezeDripSerial']:
         self.stopped = False
         threading.Thread(target=self.receive_loop, daemon=True).start()
         try:
-            self.serial = FreezeDripSerial(self.port_name, self.input_queue, self.output_queue)
+            self.serial = FreezeDripSerial(
+                self.port_name, self.input_queue, self.output_queue, self.capture, latency=self.latency)
         except serial.serialutil.SerialException:
+            logger.warning("Cannot open %s", self.port_name, exc_info=True)
             self.close()
             return
+        self.pipeline.start()
         return self
 
     def receive_loop(self) -> None:
+        lines: list[str] = list()
+        flush_at: float = 0.0
+        batch_read_ns: int = 0
+        batch_received_ns: int = 0
         while not self.stopped:
             try:
-                input_: str = self.input_queue.get(timeout=1).decode(errors='ignore').strip()
+                read_ns: int
+                received: bytes
+                read_ns, received = self.input_queue.get(
+                    timeout=max(0.0, flush_at - time.monotonic()) if lines else 1)
             except queue.Empty:
+                if lines:
+                    self._emit_lines(lines, batch_read_ns, batch_received_ns)
+                    lines = list()
+                continue
+            received_ns: int = self.latency.record('queue', read_ns) if self.latency else 0
+            c: str
+            input_: str = received.decode(errors='ignore').strip()
+            line: str = ''.join(c for c in input_ if c.isprintable())
+            if self.batch_interval <= 0:
+                listener: FreezeDripSerialListener
+                for listener in self._on_receive_listeners:
+                    listener.signal.emit(line)
+                self.pipeline.on_receive(line)
                 continue
-            listener: SimpleFreezeDripSerialListener
-            for listener in self._on_receive_listeners:
-                c: str
-                listener.signal.emit(''.join(c for c in input_ if c.isprintable()))
+            self.pipeline.on_receive(line)
+            if not lines:
+                flush_at = time.monotonic() + self.batch_interval
+                batch_read_ns, batch_received_ns = read_ns, received_ns
+            lines.append(line)
+            if time.monotonic() >= flush_at:
+                self._emit_lines(lines, batch_read_ns, batch_received_ns)
+                lines = list()
+
+    def _emit_lines(self, lines: list[str], read_ns: int, received_ns: int) -> None:
+        if self.latency:
+            # Listeners on other threads time the rest of the way from the stamps the batch carries
+            lines = StampedLines(lines, read_ns, self.latency.record('batch', received_ns))
+        listener: FreezeDripSerialListener
+        for listener in self._on_receive_listeners:
+            listener.lines_signal.emit(lines)
 
     def send(self, output: str) -> 'SimpleFreezeDripSerial':
         output: bytes = f'{output}\r\n'.encode()
         self.output_queue.put(output)
+        if self.latency:
+            self.latency.record_depth('output queue', self.output_queue.qsize())
+        return self
+
+    def submit(self, *outputs: str) -> 'SimpleFreezeDripSerial':
+        self.pipeline.submit(*outputs)
         return self
 
+    def join(self, timeout: Optional[float] = None) -> bool:
+        return self.pipeline.join(timeout)
+
     def close(self) -> 'SimpleFreezeDripSerial':
         self.stopped = True
+        self.pipeline.stop()
         if self.serial:
             self.serial.close()
         return self
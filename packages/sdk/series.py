@@ -0,0 +1,158 @@
+from typing import Optional
+
+import numpy
+
+
+def _column_edges(times: numpy.ndarray, width: int, start: float, end: float) -> numpy.ndarray:
+    edges: numpy.ndarray = numpy.searchsorted(times, numpy.linspace(start, end, width + 1)[:-1], side='left')
+    return numpy.unique(edges[edges < len(times)])
+
+
+def _columns(
+        starts: numpy.ndarray,
+        ends: numpy.ndarray,
+        minimums: numpy.ndarray,
+        maximums: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+    column_times: numpy.ndarray = numpy.empty(len(minimums) * 2)
+    column_times[0::2] = starts
+    column_times[1::2] = ends
+    column_values: numpy.ndarray = numpy.empty(len(minimums) * 2)
+    column_values[0::2] = minimums
+    column_values[1::2] = maximums
+    return column_times, column_values
+
+
+def decimate_min_max(
+        times: numpy.ndarray,
+        values: numpy.ndarray,
+        width: int,
+        start: Optional[float] = None,
+        end: Optional[float] = None) -> tuple[numpy.ndarray, numpy.ndarray]:
+    if not len(times) or width <= 0:
+        return numpy.empty(0), numpy.empty(0)
+    start = times[0] if start is None else start
+    end = times[-1] if end is None else end
+    first: int = int(numpy.searchsorted(times, start, side='left'))
+    last: int = int(numpy.searchsorted(times, end, side='right'))
+    times = times[first:last]
+    values = values[first:last]
+    if len(times) <= width * 2:
+        return times, values
+    # The times are ascending, so each pixel column is one contiguous run of samples
+    edges: numpy.ndarray = _column_edges(times, width, start, end)
+    return _columns(
+        times[edges],
+        times[numpy.append(edges[1:], len(times)) - 1],
+        numpy.minimum.reduceat(values, edges),
+        numpy.maximum.reduceat(values, edges))
+
+
+class RingSeries:
+    BLOCK: int = 64
+
+    def __init__(self, capacity: int = 1 << 17):
+        self.capacity: int = -(-capacity // self.BLOCK) * self.BLOCK
+        self.blocks: int = self.capacity // self.BLOCK
+        # Every sample is written twice, capacity apart, so the newest samples are always one contiguous view
+        self._times: numpy.ndarray = numpy.zeros(self.capacity * 2, dtype=numpy.float64)
+        self._values: numpy.ndarray = numpy.zeros(self.capacity * 2, dtype=numpy.float64)
+        # Minimum and maximum of each BLOCK samples, doubled the same way, so decimation reads blocks, not samples
+        self._block_minimums: numpy.ndarray = numpy.zeros(self.blocks * 2, dtype=numpy.float64)
+        self._block_maximums: numpy.ndarray = numpy.zeros(self.blocks * 2, dtype=numpy.float64)
+        self._next: int = 0
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, time: float, value: float) -> None:
+        i: int = self._next
+        self._times[i] = self._times[i + self.capacity] = time
+        self._values[i] = self._values[i + self.capacity] = value
+        block: int = i // self.BLOCK
+        if i % self.BLOCK:
+            value_minimum: float = min(self._block_minimums[block], value)
+            value_maximum: float = max(self._block_maximums[block], value)
+        else:
+            value_minimum = value_maximum = value
+        self._block_minimums[block] = self._block_minimums[block + self.blocks] = value_minimum
+        self._block_maximums[block] = self._block_maximums[block + self.blocks] = value_maximum
+        self._next = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def extend(self, times: numpy.ndarray, values: numpy.ndarray) -> None:
+        times = times[-self.capacity:]
+        values = values[-self.capacity:]
+        count: int = len(times)
+        if not count:
+            return
+        indices: numpy.ndarray = (self._next + numpy.arange(count)) % self.capacity
+        self._times[indices] = self._times[indices + self.capacity] = times
+        self._values[indices] = self._values[indices + self.capacity] = values
+        self._next = (self._next + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+        blocks: numpy.ndarray = numpy.unique(indices // self.BLOCK)
+        rows: numpy.ndarray = self._values[:self.capacity].reshape(self.blocks, self.BLOCK)[blocks]
+        block_minimums: numpy.ndarray = rows.min(axis=1)
+        block_maximums: numpy.ndarray = rows.max(axis=1)
+        head: int = (self._next - 1) % self.capacity
+        if head % self.BLOCK != self.BLOCK - 1:
+            # Past the newest sample the head block still holds samples that are about to be overwritten
+            head_row: numpy.ndarray = rows[blocks == head // self.BLOCK][0][:head % self.BLOCK + 1]
+            block_minimums[blocks == head // self.BLOCK] = head_row.min()
+            block_maximums[blocks == head // self.BLOCK] = head_row.max()
+        self._block_minimums[blocks] = self._block_minimums[blocks + self.blocks] = block_minimums
+        self._block_maximums[blocks] = self._block_maximums[blocks + self.blocks] = block_maximums
+
+    def clear(self) -> None:
+        self._next = 0
+        self.size = 0
+
+    def _start(self) -> int:
+        return self._next + self.capacity - self.size
+
+    def times(self) -> numpy.ndarray:
+        start: int = self._start()
+        return self._times[start:start + self.size]
+
+    def values(self) -> numpy.ndarray:
+        start: int = self._start()
+        return self._values[start:start + self.size]
+
+    def decimate(
+            self,
+            width: int,
+            start: Optional[float] = None,
+            end: Optional[float] = None) -> tuple[numpy.ndarray, numpy.ndarray]:
+        times: numpy.ndarray = self.times()
+        if not len(times) or width <= 0:
+            return numpy.empty(0), numpy.empty(0)
+        start = times[0] if start is None else start
+        end = times[-1] if end is None else end
+        offset: int = self._start()
+        first: int = offset + int(numpy.searchsorted(times, start, side='left'))
+        last: int = offset + int(numpy.searchsorted(times, end, side='right'))
+        aligned_first: int = -(-first // self.BLOCK) * self.BLOCK
+        aligned_last: int = last // self.BLOCK * self.BLOCK
+        if last - first < width * self.BLOCK * 2:
+            return decimate_min_max(self._times[first:last], self._values[first:last], width)
+
+        # Column edges snap to whole blocks, so the cost depends on the width and not on the number of samples.
+        # Only the partial blocks at both ends are read sample by sample.
+        edges: numpy.ndarray = first + _column_edges(self._times[first:last], width, start, end)
+        edges = numpy.unique(numpy.clip(
+            numpy.rint(edges[1:] / self.BLOCK).astype(numpy.int64) * self.BLOCK, aligned_first, aligned_last))
+        edges = numpy.concatenate(([aligned_first], edges[(edges > aligned_first) & (edges < aligned_last)]))
+        block_edges: numpy.ndarray = (edges - aligned_first) // self.BLOCK
+        block_slice: slice = slice(aligned_first // self.BLOCK, aligned_last // self.BLOCK)
+        minimums: numpy.ndarray = numpy.minimum.reduceat(self._block_minimums[block_slice], block_edges)
+        maximums: numpy.ndarray = numpy.maximum.reduceat(self._block_maximums[block_slice], block_edges)
+        if first < aligned_first:
+            minimums[0] = min(minimums[0], self._values[first:aligned_first].min())
+            maximums[0] = max(maximums[0], self._values[first:aligned_first].max())
+        if aligned_last < last:
+            minimums[-1] = min(minimums[-1], self._values[aligned_last:last].min())
+            maximums[-1] = max(maximums[-1], self._values[aligned_last:last].max())
+        edges[0] = first
+        return _columns(self._times[edges], self._times[numpy.append(edges[1:], last) - 1], minimums, maximums)
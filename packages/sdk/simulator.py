@@ -0,0 +1,258 @@
+import dataclasses
+import logging
+import math
+import os
+import pty
+import random
+import selectors
+import threading
+import time
+import tty
+from typing import Optional
+
+from .codec import decode_profile
+from .data import ProfileRecord
+from .framing import LineFramer
+from .serial import FreezeDripStatus
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def _default_profile() -> ProfileRecord:
+    return ProfileRecord(
+        temp_lvl_2_thold=400,
+        temp_lvl_3_thold=370,
+        temp_lvl_4_thold=320,
+        temp_sensitivity=10,
+        temp_detection_interval=60,
+        scale_of_pump_on_time=20,
+        lvl_2_pump_on_time=30,
+        lvl_2_pump_off_time=60,
+        lvl_3_pump_on_time=60,
+        lvl_3_pump_off_time=30,
+        low_battery_thold=48,
+        lost_alarm_interval=10,
+        heartbeat_interval=60,
+        setup_duration=5)
+
+
+class SimulatedDevice:
+    def __init__(
+            self,
+            cd: bool = True,
+            status_interval: float = 1.0,
+            profile: Optional[ProfileRecord] = None,
+            seed: Optional[int] = None):
+        self.cd: bool = cd
+        self.status_interval: float = status_interval
+        self.profile: ProfileRecord = profile or _default_profile()
+        self.random: random.Random = random.Random(seed)
+        self.temp: int = 453
+        self.battery_volt: int = 48
+        self.remote_battery_volt: int = 45
+        self.setup: bool = False
+        self.master: int
+        self.slave: int
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.slave)
+        os.set_blocking(self.master, False)
+        self.port_name: str = os.ttyname(self.slave)
+        self.framer: LineFramer = LineFramer()
+        self.output: bytearray = bytearray()
+        self.next_status_at: float = time.monotonic() + status_interval if status_interval > 0 else float('inf')
+        self.closed: bool = False
+        self.received_lines: int = 0
+        self.sent_lines: int = 0
+
+    @property
+    def status(self) -> FreezeDripStatus:
+        status: FreezeDripStatus = FreezeDripStatus.HEARTBEAT
+        if self.cd:
+            status |= FreezeDripStatus.CD
+        if self.temp <= self.profile.temp_lvl_2_thold:
+            status |= FreezeDripStatus.LOW_TEMP
+        if self.battery_volt < self.profile.low_battery_thold:
+            status |= FreezeDripStatus.LOW_BAT
+        if self.setup:
+            status |= FreezeDripStatus.SETUP
+        return status
+
+    def _write_lines(self, *lines: str) -> None:
+        line: str
+        self.output += ''.join(f"{line}\r\n" for line in lines).encode()
+        self.sent_lines += len(lines)
+
+    def _status_lines(self) -> list[str]:
+        lines: list[str] = [
+            f"Status : {self.status:02X} Hex",
+            f"Fahrenheit Temperature : {self.temp / 10:.1f} 'F",
+            f"Current Battery Voltage : {self.battery_volt / 10:.1f} Volts"]
+        if self.cd:
+            lines.append(f"Received Battery Value: {self.remote_battery_volt / 10:.1f} Volts")
+        return lines
+
+    def _dump_lines(self) -> list[str]:
+        profile: ProfileRecord = self.profile
+        # The CD reports half of its threshold, which FreezeDripSerialParser doubles back
+        low_battery_thold: float = profile.low_battery_thold / 10 / (2 if self.cd else 1)
+        return [
+            f"Temp. level 2 threshold : {profile.temp_lvl_2_thold / 10:.1f} 'F",
+            f"Temp. level 3 threshold : {profile.temp_lvl_3_thold / 10:.1f} 'F",
+            f"Temp. level 4 threshold : {profile.temp_lvl_4_thold / 10:.1f} 'F",
+            f"Temperature sensitivity : {profile.temp_sensitivity / 10:.1f} 'F",
+            f"Temp. detection interval : {profile.temp_detection_interval} Secs",
+            f"Scale of S1 and S3 : {profile.scale_of_pump_on_time / 10:.1f} X",
+            f"Pump on time of level 2 : {profile.lvl_2_pump_on_time} Secs",
+            f"Pump off time of level 2 : {profile.lvl_2_pump_off_time} Secs",
+            f"Pump on time of level 3 : {profile.lvl_3_pump_on_time} Secs",
+            f"Pump off time of level 3 : {profile.lvl_3_pump_off_time} Secs",
+            f"Low Battery threshold : {low_battery_thold:.1f} Volts",
+            f"Interval of the Lost alarm : {profile.lost_alarm_interval} Secs",
+            f"H.B./L. Bat. interval : {profile.heartbeat_interval} Mins",
+            f"Setup signal interval : {profile.setup_duration} Mins"]
+
+    def respond(self, command: str) -> None:
+        self.received_lines += 1
+        if command == 'RD':
+            self._write_lines(*self._status_lines(), '', *self._dump_lines(), 'OK')
+        elif command == 'CD0':
+            self._write_lines(*self._status_lines(), 'OK')
+        elif command.startswith('#'):
+            profile: Optional[ProfileRecord] = decode_profile(command)
+            if profile:
+                self.profile = dataclasses.replace(profile, id=self.profile.id, name=self.profile.name)
+            self._write_lines('OK' if profile else 'ERROR')
+        elif command:
+            self._write_lines('ERROR')
+
+    def report(self, now: float) -> None:
+        self.temp += self.random.randint(-5, 5)
+        if not self.random.randrange(50):
+            self.battery_volt = max(0, self.battery_volt - 1)
+        self._write_lines(*self._status_lines(), '')
+        self.next_status_at = max(self.next_status_at + self.status_interval, now)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        os.close(self.master)
+        os.close(self.slave)
+
+
+class FreezeDripSimulator:
+    RETRY_INTERVAL: float = 0.1
+
+    def __init__(self, read_size: int = 4096, max_pending: int = 1 << 16):
+        self.read_size: int = read_size
+        self.max_pending: int = max_pending
+        self.selector: selectors.BaseSelector = selectors.DefaultSelector()
+        self.devices: list[SimulatedDevice] = list()
+        self.stopped: bool = True
+        self._lock: threading.Lock = threading.Lock()
+        self._wake_reader: int
+        self._wake_writer: int
+        self._wake_reader, self._wake_writer = os.pipe()
+        os.set_blocking(self._wake_reader, False)
+        os.set_blocking(self._wake_writer, False)
+        self.selector.register(self._wake_reader, selectors.EVENT_READ)
+        self._thread: Optional[threading.Thread] = None
+
+    def add(
+            self,
+            cd: bool = True,
+            status_interval: float = 1.0,
+            profile: Optional[ProfileRecord] = None,
+            seed: Optional[int] = None) -> SimulatedDevice:
+        device: SimulatedDevice = SimulatedDevice(cd, status_interval, profile, seed)
+        with self._lock:
+            self.devices.append(device)
+            self.selector.register(device.master, selectors.EVENT_READ, device)
+        self.wake()
+        return device
+
+    def start(self) -> 'FreezeDripSimulator':
+        self.stopped = False
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def wake(self) -> None:
+        try:
+            os.write(self._wake_writer, b'\0')
+        except BlockingIOError:
+            pass
+
+    def run(self) -> None:
+        while not self.stopped:
+            now: float = time.monotonic()
+            with self._lock:
+                devices: list[SimulatedDevice] = list(self.devices)
+            device: SimulatedDevice
+            next_status_at: float = min((device.next_status_at for device in devices), default=math.inf)
+            # Devices that never report have no deadline, so only their commands, blocked output or a wake end the wait
+            timeout: Optional[float] = None if next_status_at == math.inf else max(0.0, next_status_at - now)
+            if timeout is None and any(device.output for device in devices):
+                timeout = self.RETRY_INTERVAL
+            key: selectors.SelectorKey
+            events: int
+            for key, events in self.selector.select(timeout):
+                if key.data is None:
+                    self._drain_wake()
+                    continue
+                if events & selectors.EVENT_READ:
+                    self._read(key.data)
+            now = time.monotonic()
+            for device in devices:
+                if not device.closed and device.next_status_at <= now:
+                    device.report(now)
+                if not device.closed and device.output:
+                    self._write(device)
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_reader, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _read(self, device: SimulatedDevice) -> None:
+        try:
+            count: int = device.framer.fill(lambda buffer: os.readv(device.master, [buffer]), self.read_size)
+        except BlockingIOError:
+            return
+        except OSError:
+            logger.warning("Cannot read %s", device.port_name, exc_info=True)
+            return
+        if not count:
+            return
+        line: bytes
+        for line in device.framer.lines():
+            device.respond(line.decode(errors='ignore').strip())
+
+    def _write(self, device: SimulatedDevice) -> None:
+        try:
+            written: int = os.write(device.master, device.output)
+        except BlockingIOError:
+            # Nobody is reading the port, so keep only the newest output like a device's transmit buffer would
+            del device.output[:-self.max_pending]
+            return
+        except OSError:
+            # Nobody holds the port open, so the line discipline discards what the device says
+            written = len(device.output)
+        del device.output[:written]
+
+    def close(self) -> 'FreezeDripSimulator':
+        self.stopped = True
+        self.wake()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        device: SimulatedDevice
+        for device in self.devices:
+            device.close()
+        self.devices.clear()
+        self.selector.close()
+        os.close(self._wake_reader)
+        os.close(self._wake_writer)
+        return self
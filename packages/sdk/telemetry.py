@@ -0,0 +1,180 @@
+import dataclasses
+import logging
+import pathlib
+import queue
+import threading
+import time
+from typing import Any, ClassVar, Iterator, Optional, TYPE_CHECKING, Union
+
+from .data import connect_database
+from .serial import FreezeDripSerialData, FreezeDripSerialParser, FreezeDripStatus
+from .util import from_tenths, to_tenths
+
+if TYPE_CHECKING:
+    import dataset
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True)
+class TelemetryReading:
+    port: str
+    time_ns: int
+    monotonic_ns: int
+    role: Optional[str] = None
+    status: Optional[int] = None
+    temp: Optional[int] = None
+    cd_battery_volt: Optional[int] = None
+    rts_battery_volt: Optional[int] = None
+
+    ROLE_CD: ClassVar[str] = 'cd'
+    ROLE_RTS: ClassVar[str] = 'rts'
+
+    @classmethod
+    def from_data(
+            cls,
+            port: str,
+            data: FreezeDripSerialData,
+            parser: Optional[FreezeDripSerialParser] = None) -> Optional['TelemetryReading']:
+        if data.status is None and data.temp is None and data.cd_battery_volt is None \
+                and data.rts_battery_volt is None:
+            return None
+        status: Optional[int] = None if data.status is None else int(data.status, 16)
+        role: Optional[str] = None
+        # Temperature and battery lines often come in a batch without a Status line, so the parser's role is used
+        if parser and parser.is_cd() is not None:
+            role = cls.ROLE_CD if parser.is_cd() else cls.ROLE_RTS
+        elif status is not None:
+            role = cls.ROLE_CD if status & FreezeDripStatus.CD else cls.ROLE_RTS
+        return cls(
+            port=port,
+            time_ns=time.time_ns(),
+            monotonic_ns=time.monotonic_ns(),
+            role=role,
+            status=status,
+            temp=to_tenths(data.temp),
+            cd_battery_volt=to_tenths(data.cd_battery_volt),
+            rts_battery_volt=to_tenths(data.rts_battery_volt))
+
+    def to_data(self) -> FreezeDripSerialData:
+        status: Optional[FreezeDripStatus] = None if self.status is None else FreezeDripStatus(self.status)
+        return FreezeDripSerialData(
+            status=None if status is None else f"{self.status:02X}",
+            temp=from_tenths(self.temp),
+            cd_battery_volt=from_tenths(self.cd_battery_volt),
+            rts_battery_volt=from_tenths(self.rts_battery_volt),
+            heartbeat_flag=None if status is None else str(FreezeDripStatus.HEARTBEAT in status),
+            low_temp_flag=None if status is None else str(FreezeDripStatus.LOW_TEMP in status),
+            low_bat_flag=None if status is None else str(FreezeDripStatus.LOW_BAT in status),
+            setup_flag=None if status is None else str(FreezeDripStatus.SETUP in status))
+
+
+def _open_telemetry_table(database: 'dataset.Database') -> 'dataset.Table':
+    table: 'dataset.Table' = database.create_table('telemetry')
+    table.table  # Reflects the table, or creates it if it is absent
+    name: str
+    type_: Any
+    for name, type_ in (
+            ('port', database.types.text),
+            ('time_ns', database.types.bigint),
+            ('monotonic_ns', database.types.bigint),
+            ('role', database.types.text),
+            ('status', database.types.integer),
+            ('temp', database.types.integer),
+            ('cd_battery_volt', database.types.integer),
+            ('rts_battery_volt', database.types.integer)):
+        table.create_column(name, type_)
+    table.create_index(['port', 'time_ns'])
+    table.create_index(['time_ns'])
+    return table
+
+
+class TelemetryDatabase:
+    def __init__(self, path: pathlib.Path, batch_size: int = 500, flush_interval: float = 1.0):
+        self.path: pathlib.Path = path
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.database: 'dataset.Database' = connect_database(self.path)
+        self.table: 'dataset.Table' = _open_telemetry_table(self.database)
+        self._insert_statement: Any = self.table.table.insert()
+        self.readings: queue.SimpleQueue = queue.SimpleQueue()
+        self.closed: bool = False
+        self._thread: threading.Thread = threading.Thread(target=self.write_loop, daemon=True)
+        self._thread.start()
+
+    def append(self, reading: TelemetryReading) -> None:
+        self.readings.put(reading)
+
+    def write_loop(self) -> None:
+        rows: list[dict[str, Any]] = list()
+        flush_at: float = 0.0
+        while True:
+            try:
+                item: Union[TelemetryReading, threading.Event, None] = self.readings.get(
+                    timeout=max(0.0, flush_at - time.monotonic()) if rows else None)
+            except queue.Empty:
+                self._insert(rows)
+                rows = list()
+                continue
+            if not isinstance(item, TelemetryReading):
+                self._insert(rows)
+                rows = list()
+                if item is None:
+                    self._close_connection()
+                    return
+                item.set()
+                continue
+            if not rows:
+                flush_at = time.monotonic() + self.flush_interval
+            rows.append(dataclasses.asdict(item))
+            if len(rows) >= self.batch_size or time.monotonic() >= flush_at:
+                self._insert(rows)
+                rows = list()
+
+    def _insert(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        try:
+            with self.database:
+                # Table.insert_many() runs on the connection of the thread that bound the metadata
+                self.database.executable.execute(self._insert_statement, rows)
+        except Exception:
+            logger.exception("Cannot store %d telemetry readings", len(rows))
+
+    def _close_connection(self) -> None:
+        # sqlite connections may only be closed by the thread that opened them
+        with self.database.lock:
+            connection: Any = self.database.connections.pop(threading.get_ident(), None)
+        if connection is not None:
+            connection.close()
+
+    def flush(self) -> None:
+        done: threading.Event = threading.Event()
+        self.readings.put(done)
+        done.wait()
+
+    def find(
+            self,
+            port: Optional[str] = None,
+            start_ns: Optional[int] = None,
+            end_ns: Optional[int] = None) -> Iterator[TelemetryReading]:
+        filters: dict[str, Any] = dict()
+        if port is not None:
+            filters['port'] = port
+        if start_ns is not None and end_ns is not None:
+            filters['time_ns'] = {'between': [start_ns, end_ns]}
+        elif start_ns is not None:
+            filters['time_ns'] = {'gte': start_ns}
+        elif end_ns is not None:
+            filters['time_ns'] = {'lte': end_ns}
+        row: dict[str, Any]
+        for row in self.table.find(order_by='time_ns', **filters):
+            del row['id']
+            yield TelemetryReading(**row)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.readings.put(None)
+        self._thread.join()
@@ -1,21 +1,64 @@
-from typing import Any, Callable, TypeVar, Union
+import contextlib
+from typing import Any, Callable, ClassVar, Iterator, Optional, TypeVar, Union
 
 T: type = TypeVar('T')
 
 
 class ObservableProperty:
+    _property_names: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolved once per class, so assigning a private field costs a set lookup instead of two getattr() calls
+        names: set[str] = set()
+        klass: type
+        for klass in reversed(cls.__mro__):
+            name: str
+            value: Any
+            for name, value in vars(klass).items():
+                if isinstance(value, property):
+                    names.add(name)
+                else:
+                    names.discard(name)
+        cls._property_names = frozenset(names)
+
     def __init__(self):
         self._on_changing_observers: list[Callable[[str, Any], None]] = list()
         self._on_specific_changing_observers: dict[str, list[Callable[[Any], None]]] = dict()
         self._on_changed_observers: list[Callable[[str, Any], None]] = list()
         self._on_specific_changed_observers: dict[str, list[Callable[[Any], None]]] = dict()
+        self._batch_depth: int = 0
+        self._batched_changes: dict[str, Any] = dict()
 
     def __setattr__(self, name, value):
-        if isinstance(getattr(type(self), name, None), property):
+        if name not in self._property_names:
+            super().__setattr__(name, value)
+            return
+        if not self._batch_depth:
             self._on_property_changing(property_name=name, property_value=value)
-        super().__setattr__(name, value)
-        if isinstance(getattr(type(self), name, None), property):
+            super().__setattr__(name, value)
             self._on_property_changed(property_name=name, property_value=value)
+            return
+        if name not in self._batched_changes:
+            self._on_property_changing(property_name=name, property_value=value)
+        super().__setattr__(name, value)
+        self._batched_changes[name] = value
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator['ObservableProperty']:
+        # Observers hear about each property changing on its first change and changed once with its last value
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                changes: dict[str, Any]
+                changes, self._batched_changes = self._batched_changes, dict()
+                name: str
+                value: Any
+                for name, value in changes.items():
+                    self._on_property_changed(property_name=name, property_value=value)
 
     def _on_property_changing(self, property_name: str, property_value: Any):
         observer: Callable[[str, Any], None]
@@ -91,3 +134,19 @@ def floatable(a: Any) -> bool:
     except ValueError:
         return False
     return True
+
+
+def to_tenths(a: Optional[str]) -> Optional[int]:
+    return None if a is None or not a.strip() else int(float(a) * 10)
+
+
+def from_tenths(a: Optional[int]) -> Optional[str]:
+    return None if a is None else str(a / 10)
+
+
+def to_int(a: Optional[str]) -> Optional[int]:
+    return None if a is None or not a.strip() else int(a)
+
+
+def from_int(a: Optional[int]) -> Optional[str]:
+    return None if a is None else str(a)
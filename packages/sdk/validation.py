@@ -0,0 +1,71 @@
+import dataclasses
+import math
+from typing import Any, Optional, Sequence
+
+import numpy
+
+from .data import Profile
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FieldRange:
+    name: str
+    kind: type
+    minimum: float
+    maximum: float
+
+    def parse(self, value: Any) -> Optional[float]:
+        if not isinstance(value, str):
+            return None
+        if self.kind is int and not value.isnumeric():
+            return None
+        try:
+            return self.kind(value)
+        except ValueError:
+            return None
+
+    def is_valid(self, value: Any) -> bool:
+        number: Optional[float] = self.parse(value)
+        return number is not None and self.minimum <= number <= self.maximum
+
+    def validate(self, values: Sequence[Any]) -> numpy.ndarray:
+        # Profiles in bulk repeat a handful of values per field, so each distinct value is parsed once
+        index_of: dict[Any, int] = dict()
+        value: Any
+        indices: list[int] = [index_of.setdefault(value, len(index_of)) for value in values]
+        number: Optional[float]
+        numbers: numpy.ndarray = numpy.fromiter(
+            (math.nan if number is None else number for number in map(self.parse, index_of)),
+            numpy.float64, len(index_of))
+        return ((numbers >= self.minimum) & (numbers <= self.maximum))[indices]
+
+
+PROFILE_SCHEMA: tuple[FieldRange, ...] = (
+    FieldRange('temp_lvl_2_thold', float, 14, 99),
+    FieldRange('temp_lvl_3_thold', float, 14, 99),
+    FieldRange('temp_lvl_4_thold', float, 14, 99),
+    FieldRange('temp_sensitivity', float, 0.1, 3),
+    FieldRange('temp_detection_interval', int, 1, 600),
+    FieldRange('scale_of_pump_on_time', float, 1, 10),
+    FieldRange('lvl_2_pump_on_time', int, 30, 600),
+    FieldRange('lvl_2_pump_off_time', int, 30, 600),
+    FieldRange('lvl_3_pump_on_time', int, 30, 600),
+    FieldRange('lvl_3_pump_off_time', int, 30, 600),
+    FieldRange('low_battery_thold', float, 3, 6),
+    FieldRange('lost_alarm_interval', int, 1, 300),
+    FieldRange('heartbeat_interval', int, 1, 180),
+    FieldRange('setup_duration', int, 1, 10),
+)
+PROFILE_FIELD_RANGES: dict[str, FieldRange] = {field.name: field for field in PROFILE_SCHEMA}
+
+
+def validate_profiles(
+        profiles: Sequence[Profile],
+        schema: tuple[FieldRange, ...] = PROFILE_SCHEMA) -> numpy.ndarray:
+    verdicts: numpy.ndarray = numpy.empty((len(profiles), len(schema)), dtype=bool)
+    column: int
+    field: FieldRange
+    for column, field in enumerate(schema):
+        profile: Profile
+        verdicts[:, column] = field.validate([getattr(profile, field.name) for profile in profiles])
+    return verdicts
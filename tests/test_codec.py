@@ -0,0 +1,147 @@
+import dataclasses
+import random
+
+import pytest
+
+import sdk
+
+DEFAULT_FRAME: str = \
+    '#B,30,RBV,FF,CBV,FF,S,05,H,3C,T,0A,U,14,L,000A,D,003C,T1,0190,T2,0172,T3,0140,S1,001E,S2,003C,S3,003C,S4,001E$'
+DEFAULT_RECORD: sdk.ProfileRecord = sdk.ProfileRecord(
+    temp_lvl_2_thold=400,
+    temp_lvl_3_thold=370,
+    temp_lvl_4_thold=320,
+    temp_sensitivity=10,
+    temp_detection_interval=60,
+    scale_of_pump_on_time=20,
+    lvl_2_pump_on_time=30,
+    lvl_2_pump_off_time=60,
+    lvl_3_pump_on_time=60,
+    lvl_3_pump_off_time=30,
+    low_battery_thold=48,
+    lost_alarm_interval=10,
+    heartbeat_interval=60,
+    setup_duration=5)
+NARROW_FIELDS: frozenset[str] = frozenset((
+    'low_battery_thold', 'setup_duration', 'heartbeat_interval', 'temp_sensitivity', 'scale_of_pump_on_time'))
+NAMES: tuple[str, ...] = tuple(field.name for field in dataclasses.fields(sdk.ProfileRecord))[2:]
+
+
+def _maximum(name: str) -> int:
+    return 0xFF if name in NARROW_FIELDS else 0xFFFF
+
+
+def _records(count: int, seed: int = 0) -> list[sdk.ProfileRecord]:
+    generator: random.Random = random.Random(seed)
+    name: str
+    records: list[sdk.ProfileRecord] = [
+        sdk.ProfileRecord(**{name: 0 for name in NAMES}),
+        sdk.ProfileRecord(**{name: _maximum(name) for name in NAMES})]
+    while len(records) < count:
+        records.append(sdk.ProfileRecord(**{name: generator.randint(0, _maximum(name)) for name in NAMES}))
+    return records
+
+
+def _pairs(frame: str) -> list[tuple[str, str]]:
+    tokens: list[str] = frame[1:-1].split(',')
+    i: int
+    return [(tokens[i], tokens[i + 1]) for i in range(0, len(tokens), 2)]
+
+
+def _frame(pairs: list[tuple[str, str]]) -> str:
+    key: str
+    value: str
+    return '#' + ','.join(f"{key},{value}" for key, value in pairs) + '$'
+
+
+def _replaced(frame: str, replaced_key: str, replaced_value: str) -> str:
+    key: str
+    value: str
+    return _frame([(key, replaced_value if key == replaced_key else value) for key, value in _pairs(frame)])
+
+
+def _reordered(frame: str, generator: random.Random) -> str:
+    pairs: list[tuple[str, str]] = _pairs(frame)
+    generator.shuffle(pairs)
+    key: str
+    value: str
+    return _frame([(key, value.lower()) for key, value in pairs])
+
+
+def test_encode_matches_device_frame() -> None:
+    assert sdk.encode_profile(DEFAULT_RECORD) == DEFAULT_FRAME
+    assert sdk.encode_profiles([DEFAULT_RECORD]) == [DEFAULT_FRAME.encode()]
+
+
+def test_decode_device_frame() -> None:
+    assert sdk.decode_profile(DEFAULT_FRAME) == DEFAULT_RECORD
+    assert sdk.decode_profile(DEFAULT_FRAME.encode()) == DEFAULT_RECORD
+
+
+def test_round_trip_over_full_range() -> None:
+    records: list[sdk.ProfileRecord] = _records(2_000)
+    record: sdk.ProfileRecord
+    for record in records:
+        assert sdk.decode_profile(sdk.encode_profile(record)) == record
+
+
+def test_bulk_round_trip_matches_single() -> None:
+    records: list[sdk.ProfileRecord] = _records(2_000, seed=1)
+    frames: list[bytes] = sdk.encode_profiles(records)
+    record: sdk.ProfileRecord
+    assert frames == [sdk.encode_profile(record).encode() for record in records]
+    assert sdk.decode_profiles(frames) == records
+
+
+def test_decode_reordered_fields() -> None:
+    generator: random.Random = random.Random(2)
+    records: list[sdk.ProfileRecord] = _records(500, seed=2)
+    record: sdk.ProfileRecord
+    frames: list[str] = [sdk.encode_profile(record) for record in records]
+    i: int
+    frame: str
+    mixed: list[str] = [_reordered(frame, generator) if i % 3 else frame for i, frame in enumerate(frames)]
+    assert [sdk.decode_profile(frame) for frame in mixed] == records
+    assert sdk.decode_profiles(mixed) == records
+
+
+@pytest.mark.parametrize('frame', [
+    '',
+    DEFAULT_FRAME[:-1],
+    DEFAULT_FRAME[1:],
+    DEFAULT_FRAME.replace(',S4,', ',S5,'),
+    DEFAULT_FRAME.replace(',S4,001E', ''),
+    DEFAULT_FRAME[:-1] + ',B,30$',
+    _replaced(DEFAULT_FRAME, 'B', '3G'),
+    _replaced(DEFAULT_FRAME, 'B', '-1'),
+    _replaced(DEFAULT_FRAME, 'S', '+5'),
+    _replaced(DEFAULT_FRAME, 'H', '3'),
+    _replaced(DEFAULT_FRAME, 'H', '03C'),
+    _replaced(DEFAULT_FRAME, 'T', '0x'),
+    _replaced(DEFAULT_FRAME, 'L', '0x1F'),
+    _replaced(DEFAULT_FRAME, 'L', '1_00'),
+    _replaced(DEFAULT_FRAME, 'L', '1FFFF'),
+    _replaced(DEFAULT_FRAME, 'S4', '-005'),
+    _replaced(DEFAULT_FRAME, 'RBV', '-F'),
+    _frame(list(reversed(_pairs(_replaced(DEFAULT_FRAME, 'S4', '-5'))))),
+    _frame(list(reversed(_pairs(_replaced(DEFAULT_FRAME, 'B', '130'))))),
+])
+def test_decode_rejects_malformed_frame(frame: str) -> None:
+    assert sdk.decode_profile(frame) is None
+    assert sdk.decode_profiles([DEFAULT_FRAME, frame]) == [DEFAULT_RECORD, None]
+
+
+@pytest.mark.parametrize('changes', [
+    {'setup_duration': 0x100},
+    {'heartbeat_interval': -1},
+    {'lost_alarm_interval': 0x10000},
+    {'lvl_3_pump_off_time': -1},
+    {'temp_sensitivity': None},
+    {'temp_lvl_2_thold': 40.0},
+])
+def test_encode_rejects_out_of_range_field(changes: dict) -> None:
+    record: sdk.ProfileRecord = dataclasses.replace(DEFAULT_RECORD, **changes)
+    with pytest.raises(ValueError):
+        sdk.encode_profile(record)
+    with pytest.raises(ValueError):
+        sdk.encode_profiles([DEFAULT_RECORD, record])
@@ -0,0 +1,39 @@
+import os
+import selectors
+import time
+
+import sdk
+
+
+def _read_until(fd: int, expected: bytes, timeout: float) -> bytes:
+    selector: selectors.BaseSelector = selectors.DefaultSelector()
+    selector.register(fd, selectors.EVENT_READ)
+    received: bytes = b''
+    deadline: float = time.monotonic() + timeout
+    while expected not in received and time.monotonic() < deadline:
+        if selector.select(deadline - time.monotonic()):
+            received += os.read(fd, 4096)
+    selector.close()
+    return received
+
+
+def test_late_reply_does_not_acknowledge_next_command() -> None:
+    master: int
+    slave: int
+    master, slave = os.openpty()
+    engine: sdk.FreezeDripEngine = sdk.FreezeDripEngine().start()
+    try:
+        port: sdk.FreezeDripPort = engine.open(os.ttyname(slave))
+        port.timeout = 0.3
+        port.fallback_delay = 10.0
+        port.submit('RD', 'CD0', 'SD2')
+        # RD times out without a reply, then its OK arrives while CD0 is waiting
+        assert b'CD0\r\n' in _read_until(master, b'CD0\r\n', 2.0)
+        os.write(master, b'OK\r\n')
+        assert b'SD2' not in _read_until(master, b'SD2', 0.15)
+        os.write(master, b'OK\r\n')
+        assert b'SD2\r\n' in _read_until(master, b'SD2\r\n', 0.1)
+    finally:
+        engine.close()
+        os.close(master)
+        os.close(slave)
@@ -0,0 +1,75 @@
+import os
+import queue
+import time
+
+import sdk
+from sdk.serial import FreezeDripSerial
+
+
+def _pipeline(sent: list[str], timeout: float) -> sdk.FreezeDripCommandPipeline:
+    return sdk.FreezeDripCommandPipeline(sent.append, timeout, fallback_delay=10.0).start()
+
+
+def _wait_for(sent: list[str], count: int, timeout: float = 2.0) -> None:
+    deadline: float = time.monotonic() + timeout
+    while len(sent) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(sent) == count
+
+
+def test_reply_acknowledges_its_command() -> None:
+    sent: list[str] = list()
+    pipeline: sdk.FreezeDripCommandPipeline = _pipeline(sent, timeout=5.0)
+    try:
+        pipeline.submit('RD', 'CD0')
+        _wait_for(sent, 1)
+        pipeline.on_receive('OK')
+        _wait_for(sent, 2)
+        pipeline.on_receive('ERROR')
+        assert pipeline.join(1.0)
+    finally:
+        pipeline.stop()
+
+
+def test_late_reply_does_not_acknowledge_next_command() -> None:
+    sent: list[str] = list()
+    pipeline: sdk.FreezeDripCommandPipeline = _pipeline(sent, timeout=0.3)
+    try:
+        pipeline.submit('RD', 'CD0')
+        # RD times out without a reply, then its OK arrives while CD0 is waiting
+        _wait_for(sent, 2)
+        pipeline.on_receive('OK')
+        assert not pipeline.join(0.1)
+        pipeline.on_receive('OK')
+        assert pipeline.join(0.1)
+    finally:
+        pipeline.stop()
+
+
+def test_reply_owed_by_timed_out_command_expires() -> None:
+    sent: list[str] = list()
+    pipeline: sdk.FreezeDripCommandPipeline = _pipeline(sent, timeout=0.2)
+    try:
+        pipeline.submit('RD')
+        assert pipeline.join(1.0)
+        time.sleep(0.3)
+        pipeline.submit('CD0')
+        _wait_for(sent, 2)
+        pipeline.on_receive('OK')
+        assert pipeline.join(0.1)
+    finally:
+        pipeline.stop()
+
+
+def test_close_stops_receiving_without_read_timeout() -> None:
+    master: int
+    slave: int
+    master, slave = os.openpty()
+    try:
+        port: FreezeDripSerial = FreezeDripSerial(os.ttyname(slave), queue.Queue(), queue.Queue(), read_timeout=None)
+        time.sleep(0.1)
+        port.close()
+        assert not port._receive_thread.is_alive()
+    finally:
+        os.close(master)
+        os.close(slave)
@@ -0,0 +1,36 @@
+import os
+import selectors
+import time
+
+import sdk
+
+
+def _read_until(fd: int, expected: bytes, timeout: float = 2.0) -> bytes:
+    selector: selectors.BaseSelector = selectors.DefaultSelector()
+    selector.register(fd, selectors.EVENT_READ)
+    received: bytes = b''
+    deadline: float = time.monotonic() + timeout
+    while expected not in received and time.monotonic() < deadline:
+        if selector.select(deadline - time.monotonic()):
+            received += os.read(fd, 4096)
+    selector.close()
+    return received
+
+
+def test_device_without_status_reports_answers_commands() -> None:
+    simulator: sdk.FreezeDripSimulator = sdk.FreezeDripSimulator().start()
+    try:
+        device: sdk.SimulatedDevice = simulator.add(status_interval=0)
+        fd: int = os.open(device.port_name, os.O_RDWR | os.O_NOCTTY)
+        try:
+            time.sleep(0.2)
+            assert simulator._thread.is_alive()
+            os.write(fd, b'RD\r\n')
+            received: bytes = _read_until(fd, b'OK\r\n')
+            assert b'Status : ' in received
+            assert received.endswith(b'OK\r\n')
+            assert simulator._thread.is_alive()
+        finally:
+            os.close(fd)
+    finally:
+        simulator.close()